@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark: deploy_to_database
+เปรียบเทียบเวลาโหลด fact + dimension tables ระหว่าง DataFrame.to_sql แบบเดิมกับ bulk_load_table
+(default ใช้ SQLite เป็น stand-in ของ SQL Server, ใช้ --url ชี้ไป SQL Server container ได้)
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+# เพิ่ม path สำหรับ import functions
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.bulk_load_table import bulk_load_table
+
+
+def build_star_schema(n_rows, seed=42):
+    """
+    สร้าง fact table + dimension tables ที่มีรูปร่างเดียวกับผลลัพธ์ของ ETL Pipeline
+    """
+    rng = np.random.default_rng(seed)
+    home_ownership = ['RENT', 'OWN', 'MORTGAGE', 'ANY']
+    loan_status = ['Fully Paid', 'Current', 'Charged Off', 'Late (31-120 days)']
+    issue_d = pd.date_range('2016-01-01', '2019-12-01', freq='MS')
+    
+    dim_tables = {
+        'home_ownership_dim': pd.DataFrame({'home_ownership_id': range(len(home_ownership)),
+                                            'home_ownership': home_ownership}),
+        'loan_status_dim': pd.DataFrame({'loan_status_id': range(len(loan_status)),
+                                         'loan_status': loan_status}),
+        'issue_d_dim': pd.DataFrame({'issue_d_id': range(len(issue_d)), 'issue_d': issue_d})
+    }
+    fact_table = pd.DataFrame({
+        'loan_amnt': rng.integers(1000, 40000, n_rows).astype(float),
+        'funded_amnt': rng.integers(1000, 40000, n_rows).astype(float),
+        'term': rng.choice([' 36 months', ' 60 months'], n_rows),
+        'int_rate': rng.uniform(5, 31, n_rows).round(2),
+        'installment': rng.uniform(30, 1500, n_rows).round(2),
+        'home_ownership_id': rng.integers(0, len(home_ownership), n_rows),
+        'loan_status_id': rng.integers(0, len(loan_status), n_rows),
+        'issue_d_id': rng.integers(0, len(issue_d), n_rows)
+    })
+    return fact_table, dim_tables
+
+
+def load_with_to_sql(tables, engine):
+    """วิธีเดิมของ deploy_to_database: DataFrame.to_sql ค่า default"""
+    for table_name, df in tables.items():
+        df.to_sql(table_name, con=engine, if_exists='replace', index=False)
+
+
+def load_with_bulk(tables, engine, method):
+    """โหลดด้วย bulk_load_table"""
+    for table_name, df in tables.items():
+        bulk_load_table(df, table_name, engine, method=method)
+
+
+def table_counts(tables, engine):
+    """จำนวนแถวในแต่ละตาราง"""
+    with engine.connect() as connection:
+        return {table_name: connection.execute(text(f"SELECT COUNT(*) FROM {table_name}")).scalar()
+                for table_name in tables}
+
+
+def run_benchmark(n_rows, url=None, methods=('executemany', 'multi')):
+    """รัน benchmark และแสดงผลเวลา"""
+    print(f"📊 Building star schema: {n_rows:,} fact rows")
+    fact_table, dim_tables = build_star_schema(n_rows)
+    tables = dict(dim_tables, loans_fact=fact_table)
+    expected = {table_name: len(df) for table_name, df in tables.items()}
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_engine(url or f"sqlite:///{os.path.join(temp_dir, 'deploy.db')}")
+        print(f"   Target: {engine.url.render_as_string(hide_password=True)}")
+        
+        runs = [('to_sql (default)', lambda: load_with_to_sql(tables, engine))]
+        runs += [(f'bulk_load_table ({method})', lambda method=method: load_with_bulk(tables, engine, method))
+                 for method in methods]
+        
+        all_ok = True
+        baseline = None
+        for label, run in runs:
+            start = time.perf_counter()
+            run()
+            seconds = time.perf_counter() - start
+            baseline = baseline or seconds
+            ok = table_counts(tables, engine) == expected
+            all_ok = all_ok and ok
+            print(f"   {label:<32} {seconds:7.3f}s  {baseline / seconds:5.1f}x  rows {'✅' if ok else '❌'}")
+        engine.dispose()
+    
+    return all_ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark deploy_to_database')
+    parser.add_argument('--rows', type=int, default=200_000, help='จำนวนแถวของ fact table')
+    parser.add_argument('--url', default=None,
+                        help='SQLAlchemy URL ของ database ที่ใช้ทดสอบ (default: SQLite ชั่วคราว)')
+    parser.add_argument('--methods', nargs='+', default=['executemany', 'multi'],
+                        help='วิธีของ bulk_load_table ที่ต้องการเทียบ (เช่น executemany multi bcp)')
+    args = parser.parse_args()
+    
+    sys.exit(0 if run_benchmark(args.rows, args.url, args.methods) else 1)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark: guess_column_types
+เปรียบเทียบความเร็วระหว่างการตรวจ regex ทีละค่า (แบบเดิม) กับ vectorized engine
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# เพิ่ม path สำหรับ import functions
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.guess_column_types import guess_column_types
+
+
+def legacy_guess_column_types(df):
+    """
+    ตรวจประเภทข้อมูลแบบเดิม (re.match ทีละค่าใน Python generator) ใช้เป็น baseline
+    """
+    column_types = {}
+    for column in df.columns:
+        is_datetime = all(re.match(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', str(value)) for value in df[column].dropna())
+        is_date = all(re.match(r'\d{4}-\d{2}-\d{2}', str(value)) for value in df[column].dropna())
+        if is_datetime:
+            column_types[column] = 'datetime64'
+        elif is_date:
+            column_types[column] = 'date'
+        else:
+            column_types[column] = pd.api.types.infer_dtype(df[column], skipna=True)
+    return column_types
+
+
+def build_benchmark_frame(n_rows, seed=42):
+    """
+    สร้าง DataFrame ทดสอบที่มีคอลัมน์ลักษณะเดียวกับ LoanStats (หลังอ่านจาก CSV)
+    """
+    rng = np.random.default_rng(seed)
+    months = pd.date_range('2012-01-01', '2019-12-01', freq='MS')
+    days = pd.date_range('2015-01-01', '2019-12-31', freq='D')
+    return pd.DataFrame({
+        'loan_amnt': rng.integers(1000, 40000, n_rows).astype(float),
+        'int_rate': rng.choice(['5.32%', '13.56%', '22.15%', '30.99%'], n_rows),
+        'home_ownership': rng.choice(['RENT', 'OWN', 'MORTGAGE', 'ANY'], n_rows),
+        'issue_d': rng.choice(months.strftime('%b-%Y'), n_rows),
+        'last_pymnt_d': rng.choice(days.strftime('%Y-%m-%d'), n_rows),
+        'last_credit_pull_ts': rng.choice(days.strftime('%Y-%m-%d %H:%M:%S'), n_rows),
+        'desc': np.where(rng.random(n_rows) < 0.8, None, 'Borrower added on 2016-01-01'),
+    })
+
+
+def run_benchmark(n_rows, copies=1, workers=None):
+    """
+    รัน benchmark และแสดงผลเวลา
+    
+    Args:
+        n_rows: จำนวนแถว
+        copies: จำนวนชุดของคอลัมน์ (7 คอลัมน์ต่อชุด เช่น 21 = 147 คอลัมน์แบบไฟล์ LoanStats เต็ม)
+        workers: จำนวน process ของ guess_column_types(workers=) ที่วัดเพิ่ม (default: None = ไม่วัด)
+    """
+    df = build_benchmark_frame(n_rows)
+    if copies > 1:
+        df = pd.concat([df.add_suffix(f'_{i}') for i in range(copies)], axis=1)
+    print(f"📊 Building benchmark frame: {n_rows:,} rows, {len(df.columns)} columns")
+    
+    start = time.perf_counter()
+    legacy_result = legacy_guess_column_types(df)
+    legacy_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    success, result = guess_column_types(df)
+    vectorized_seconds = time.perf_counter() - start
+    
+    same_result = success and result == legacy_result
+    print(f"   Legacy per-value regex: {legacy_seconds:.3f}s")
+    print(f"   Vectorized engine:      {vectorized_seconds:.3f}s")
+    print(f"   Speedup:                {legacy_seconds / vectorized_seconds:.1f}x")
+    print(f"   Same type dict:         {'✅' if same_result else '❌'}")
+    
+    if workers:
+        start = time.perf_counter()
+        _, parallel_result = guess_column_types(df, workers=workers)
+        parallel_seconds = time.perf_counter() - start
+        same_result = same_result and parallel_result == result
+        print(f"   {workers} processes (forked, shared pages): {parallel_seconds:.3f}s "
+              f"({vectorized_seconds / parallel_seconds:.1f}x vs vectorized, {os.cpu_count()} CPUs), "
+              f"same type dict: {'✅' if parallel_result == result else '❌'}")
+    return same_result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark guess_column_types')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='จำนวนแถวที่ใช้ทดสอบ')
+    parser.add_argument('--copies', type=int, default=1, help='จำนวนชุดของคอลัมน์ (7 คอลัมน์ต่อชุด)')
+    parser.add_argument('--workers', type=int, default=None, help='วัด guess_column_types(workers=N) เพิ่ม')
+    args = parser.parse_args()
+    
+    sys.exit(0 if run_benchmark(args.rows, copies=args.copies, workers=args.workers) else 1)
@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark: ETL pipeline scaling
+วัดเวลา / CPU / หน่วยความจำ / throughput ของ guess_column_types, clean_missing_values,
+filter_issue_date_range, create_star_schema และ main() ทั้งหมดบนข้อมูลสังเคราะห์หลายขนาด
+แล้วเก็บผลต่อท้ายไฟล์ JSON Lines เพื่อเทียบกับรอบก่อนหน้า (regression ของ throughput / หน่วยความจำ)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+# เพิ่ม path สำหรับ import functions และ etl_pipeline
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from functions.guess_column_types import guess_column_types
+from functions.clean_missing_values import clean_missing_values
+from functions.filter_issue_date_range import filter_issue_date_range
+from functions.parse_date_column import clear_date_cache
+from functions.stage_metrics import measure_stage
+from etl_pipeline import create_star_schema
+from synthetic_loans import parse_row_count, add_generator_arguments, generator_options, write_synthetic_loans
+
+# ขนาดข้อมูลที่วัดเมื่อไม่กำหนด --sizes
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+# ไฟล์ผลลัพธ์ (หนึ่งบรรทัดต่อขนาดต่อรอบ) และ directory ของไฟล์ข้อมูลที่สร้างไว้ใช้ซ้ำ
+DEFAULT_RESULTS_FILE = os.path.join(ROOT_DIR, 'artifacts', 'benchmarks', 'pipeline_benchmark.jsonl')
+DEFAULT_DATA_DIR = os.path.join(ROOT_DIR, '.benchmark_data')
+
+
+def dataset_path(data_dir, n_rows, options):
+    """path ของไฟล์ข้อมูลสังเคราะห์ (ชื่อไฟล์ผูกกับจำนวนแถวและ options ของ generator)"""
+    digest = hashlib.sha256(json.dumps(options, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(data_dir, f'loans_{n_rows}_{digest}.csv')
+
+
+def benchmark_functions(data_file, trace_memory=False):
+    """
+    วัดแต่ละฟังก์ชันตามลำดับเดียวกับ batch pipeline บน DataFrame ที่อ่านทั้งไฟล์ (ไม่ใช้ projection / row_filter)
+    
+    Returns:
+        list: record ของ measure_stage() ต่อฟังก์ชัน
+    """
+    metrics = []
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        with measure_stage(metrics, 'read_csv') as record:
+            df = pd.read_csv(data_file, low_memory=False)
+            record['rows_out'] = len(df)
+        with measure_stage(metrics, 'guess_column_types', rows_in=len(df)) as record:
+            success, column_types = guess_column_types(df)
+            record['rows_out'] = len(df) if success else 0
+        with measure_stage(metrics, 'clean_missing_values', rows_in=len(df)) as record:
+            df_clean = clean_missing_values(df, max_null_percentage=30)
+            record['rows_out'] = len(df_clean)
+        del df
+        clear_date_cache()
+        with measure_stage(metrics, 'filter_issue_date_range', rows_in=len(df_clean)) as record:
+            df_filtered = filter_issue_date_range(df_clean, verbose=False)
+            record['rows_out'] = len(df_filtered)
+        df_final = df_filtered.dropna()
+        with measure_stage(metrics, 'create_star_schema', rows_in=len(df_final)) as record:
+            fact_table, _ = create_star_schema(df_final, verbose=False)
+            record['rows_out'] = len(fact_table)
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return metrics
+
+
+def benchmark_main(data_file, pipeline_args=()):
+    """
+    รัน main() ของ etl_pipeline.py ใน process ใหม่ (peak RSS ไม่ปนกับการวัดฟังก์ชัน) พร้อม --metrics-file
+    
+    Returns:
+        list: record 'main' ของทั้งการรัน ตามด้วย record ของแต่ละขั้นตอนของ main() (ชื่อขึ้นต้นด้วย 'main.')
+    """
+    metrics = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        metrics_file = os.path.join(temp_dir, 'metrics.json')
+        command = [sys.executable, os.path.join(ROOT_DIR, 'etl_pipeline.py'), '--input', data_file,
+                   '--metrics-file', metrics_file, *pipeline_args]
+        with measure_stage(metrics, 'main') as record:
+            completed = subprocess.run(command, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                       text=True)
+            if completed.returncode != 0:
+                raise RuntimeError(f"etl_pipeline.py failed ({completed.returncode}): {completed.stderr[-2000:]}")
+            with open(metrics_file, 'r', encoding='utf-8') as f:
+                stages = json.load(f)['stages']
+            record.update(rows_in=next((stage['rows_in'] for stage in stages if stage['stage'] == 'load'), None),
+                          rows_out=next((stage['rows_out'] for stage in stages
+                                         if stage['stage'] in ('star_schema', 'stream')), None))
+    # peak RSS ของ process ลูกเอง (ไม่ใช่ของ process benchmark)
+    metrics[0]['peak_rss_mb'] = metrics[0]['process_peak_rss_mb'] = max(
+        (stage['process_peak_rss_mb'] or 0 for stage in stages), default=None)
+    return metrics + [dict(stage, stage=f"main.{stage['stage']}") for stage in stages]
+
+
+def best_of(runs):
+    """รวมผลหลายรอบของขั้นตอนเดียวกันโดยเก็บ record ที่ wall time น้อยที่สุด (ลดผลของ noise จากเครื่อง)"""
+    return [min(records, key=lambda record: record['wall_seconds']) for records in zip(*runs)]
+
+
+def previous_result(results_file, key):
+    """ผลล่าสุดของ configuration เดียวกันจากไฟล์ผลลัพธ์ (None ถ้ายังไม่เคยรัน)"""
+    if not os.path.exists(results_file):
+        return None
+    previous = None
+    with open(results_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue
+            if result.get('key') == key:
+                previous = result
+    return previous
+
+
+def compare_results(result, previous, tolerance):
+    """
+    เทียบ throughput (rows/s) และ peak memory ของแต่ละขั้นตอนกับรอบก่อน
+    
+    Returns:
+        list: ข้อความของขั้นตอนที่ช้าลง / ใช้หน่วยความจำมากขึ้นเกิน tolerance (เปอร์เซ็นต์)
+    """
+    before = {stage['stage']: stage for stage in previous['stages']}
+    regressions = []
+    for stage in result['stages']:
+        old = before.get(stage['stage'])
+        if old is None or stage['status'] != 'ok' or old['status'] != 'ok':
+            continue
+        # ขั้นตอนที่เร็วมาก (< 10ms) แกว่งเกินกว่าจะใช้ตัดสิน regression
+        if stage['rows_per_second'] and old['rows_per_second'] and old['wall_seconds'] >= 0.01:
+            change = (stage['rows_per_second'] / old['rows_per_second'] - 1) * 100
+            if change < -tolerance:
+                regressions.append(f"{stage['stage']}: throughput {change:+.1f}% "
+                                   f"({old['rows_per_second']:,.0f} -> {stage['rows_per_second']:,.0f} rows/s)")
+        for field in ['tracemalloc_peak_mb', 'peak_rss_mb']:
+            if stage.get(field) and old.get(field):
+                change = (stage[field] / old[field] - 1) * 100
+                if change > tolerance:
+                    regressions.append(f"{stage['stage']}: {field} {change:+.1f}% ({old[field]} -> {stage[field]} MB)")
+    return regressions
+
+
+def run_benchmark(sizes, data_dir, results_file, options, pipeline_args=(), trace_memory=False, skip_main=False,
+                  tolerance=20, repeat=1):
+    """
+    รัน benchmark ทุกขนาด บันทึกผล และแสดงการเปลี่ยนแปลงเทียบกับรอบก่อน
+    
+    Args:
+        sizes: list ของจำนวนแถว
+        data_dir: directory ของไฟล์ข้อมูลสังเคราะห์ (สร้างเมื่อยังไม่มี และใช้ซ้ำในรอบถัดไป)
+        results_file: ไฟล์ JSON Lines ที่เก็บผลทุกรอบ (None = ไม่บันทึก)
+        options: options ของ build_synthetic_loans()
+        pipeline_args: options เพิ่มเติมของ etl_pipeline.py เช่น ['--typed-load']
+        trace_memory: วัด peak ของ tracemalloc ของแต่ละฟังก์ชัน (ช้าลงมาก)
+        skip_main: ไม่วัด main()
+        tolerance: เปอร์เซ็นต์ที่ throughput ลดลง / หน่วยความจำเพิ่มขึ้นได้ก่อนนับเป็น regression
+        repeat: จำนวนรอบที่วัดต่อขนาด แล้วเก็บรอบที่เร็วที่สุดของแต่ละขั้นตอน (default: 1)
+    
+    Returns:
+        list: ข้อความ regression ทั้งหมด (ว่าง = ไม่มี)
+    """
+    regressions = []
+    for n_rows in sizes:
+        data_file = dataset_path(data_dir, n_rows, options)
+        if not os.path.exists(data_file):
+            print(f"🧪 Generating {n_rows:,} rows -> {data_file}")
+            write_synthetic_loans(data_file, n_rows, **options)
+        print(f"\n📊 {n_rows:,} rows ({os.path.getsize(data_file) / 1024**2:,.1f} MB)")
+        
+        stages = best_of([benchmark_functions(data_file, trace_memory=trace_memory) for _ in range(repeat)])
+        if not skip_main:
+            stages += best_of([benchmark_main(data_file, pipeline_args) for _ in range(repeat)])
+        
+        # round trip ผ่าน JSON ให้เทียบกับ key ที่อ่านจากไฟล์ได้ (tuple -> list)
+        key = json.loads(json.dumps({
+            'rows': n_rows,
+            'generator': options,
+            'pipeline_args': list(pipeline_args),
+            'trace_memory': trace_memory,
+            'skip_main': skip_main,
+            'repeat': repeat,
+            'host': platform.node()
+        }))
+        result = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'key': key,
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'cpu_count': os.cpu_count(),
+            'stages': stages
+        }
+        for stage in stages:
+            rate = f"{stage['rows_per_second']:>14,.0f} rows/s" if stage['rows_per_second'] else ' ' * 21
+            memory = f", tracemalloc {stage['tracemalloc_peak_mb']} MB" if stage['tracemalloc_peak_mb'] else ''
+            print(f"   {stage['stage']:<26} {stage['wall_seconds']:9.3f}s {rate}  RSS {stage['peak_rss_mb']} MB{memory}")
+        
+        previous = previous_result(results_file, key) if results_file else None
+        if previous is not None:
+            found = compare_results(result, previous, tolerance)
+            print(f"   vs {previous['created_at']}: "
+                  f"{'✅ no regression' if not found else f'⚠️  {len(found)} regressions'} (tolerance {tolerance}%)")
+            for message in found:
+                print(f"      - {message}")
+            regressions += [f"{n_rows:,} rows, {message}" for message in found]
+        
+        if results_file:
+            os.makedirs(os.path.dirname(os.path.abspath(results_file)), exist_ok=True)
+            with open(results_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(result, default=str) + '\n')
+    
+    if results_file:
+        print(f"\n💾 Results appended to {results_file}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark ETL pipeline functions and main() across data sizes')
+    parser.add_argument('--sizes', type=parse_row_count, nargs='+', default=DEFAULT_SIZES,
+                        help='จำนวนแถวที่วัด เช่น 10k 100k 1M 10M (default: 10k 100k 1M)')
+    add_generator_arguments(parser)
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR,
+                        help='directory ของไฟล์ข้อมูลสังเคราะห์ที่ใช้ซ้ำข้ามรอบ (default: %(default)s)')
+    parser.add_argument('--results-file', default=DEFAULT_RESULTS_FILE,
+                        help='ไฟล์ JSON Lines ที่เก็บผลทุกรอบ (default: %(default)s)')
+    parser.add_argument('--pipeline-args', default='',
+                        help='options เพิ่มเติมของ etl_pipeline.py ตอนวัด main() เช่น "--typed-load --compact"')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='วัด peak ของ tracemalloc ของแต่ละฟังก์ชัน (ช้าลงมาก)')
+    parser.add_argument('--skip-main', action='store_true', help='วัดเฉพาะฟังก์ชัน ไม่รัน main()')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='จำนวนรอบที่วัดต่อขนาด เก็บรอบที่เร็วที่สุดของแต่ละขั้นตอน (default: %(default)s)')
+    parser.add_argument('--tolerance', type=float, default=20,
+                        help='เปอร์เซ็นต์ที่ยอมให้ช้าลง / ใช้หน่วยความจำมากขึ้นเทียบกับรอบก่อน (default: %(default)s)')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='exit code 1 เมื่อมี regression เกิน tolerance')
+    args = parser.parse_args()
+    
+    found = run_benchmark(args.sizes, args.data_dir, args.results_file, generator_options(args),
+                          pipeline_args=args.pipeline_args.split(), trace_memory=args.trace_memory,
+                          skip_main=args.skip_main, tolerance=args.tolerance, repeat=args.repeat)
+    sys.exit(1 if found and args.fail_on_regression else 0)
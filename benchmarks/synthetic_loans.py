@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Synthetic LoanStats Generator
+สร้างไฟล์ CSV รูปแบบเดียวกับ LoanStats (คอลัมน์ / รูปแบบค่า / วันที่ '%b-%Y') แบบ deterministic
+ใช้กับ benchmark ที่ต้องการขนาดข้อมูลตั้งแต่ 10k ถึง 10M แถว
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# จำนวนแถวต่อ block ที่ใช้สุ่ม (แต่ละ block ใช้ seed ของตัวเอง - ไฟล์เหมือนเดิมทุกครั้งไม่ว่าจะเขียนทีละกี่แถว)
+BLOCK_ROWS = 100_000
+
+# สัดส่วน null ของแต่ละคอลัมน์ตามแบบไฟล์ LoanStats จริง (คอลัมน์ที่ไม่อยู่ในนี้ไม่มี null)
+DEFAULT_NULL_RATES = {
+    'loan_amnt': 0.001,
+    'loan_status': 0.001,
+    'emp_title': 0.1,
+    'mths_since_last_delinq': 0.5,
+    'last_pymnt_d': 0.05,
+    'desc': 0.9
+}
+
+# รูปแบบการกระจายของ issue_d ในช่วงปีที่กำหนด
+ISSUE_DISTRIBUTIONS = ('uniform', 'growth')
+
+TERMS = [' 36 months', ' 60 months']
+HOME_OWNERSHIP = ['RENT', 'OWN', 'MORTGAGE', 'ANY']
+LOAN_STATUS = ['Current', 'Fully Paid', 'Charged Off', 'Late (31-120 days)', 'In Grace Period']
+EMP_TITLES = ['Teacher', 'Nurse', 'Driver', 'Manager', 'Engineer', 'Sales', 'Owner', 'Supervisor']
+
+
+def issue_month_weights(months, distribution='uniform'):
+    """
+    น้ำหนักของแต่ละเดือนของ issue_d
+    
+    Args:
+        months: DatetimeIndex ของเดือนที่สุ่มได้
+        distribution: 'uniform' = ทุกเดือนเท่ากัน, 'growth' = จำนวนสินเชื่อเพิ่มขึ้นตามเวลาแบบไฟล์จริง
+    
+    Returns:
+        numpy array ของความน่าจะเป็น (รวมเป็น 1)
+    """
+    if distribution not in ISSUE_DISTRIBUTIONS:
+        raise ValueError(f"Unknown issue date distribution: {distribution} (expected one of {ISSUE_DISTRIBUTIONS})")
+    weights = np.ones(len(months)) if distribution == 'uniform' else np.arange(1, len(months) + 1, dtype=float)
+    return weights / weights.sum()
+
+
+def build_synthetic_loans(n_rows, extra_columns=20, null_rates=None, issue_years=(2012, 2019),
+                          issue_distribution='uniform', seed=42, start_row=0):
+    """
+    สร้าง DataFrame รูปแบบเดียวกับ LoanStats ที่อ่านจาก CSV
+    
+    Args:
+        n_rows: จำนวนแถว
+        extra_columns: จำนวนคอลัมน์ตัวเลขเพิ่มเติม x0, x1, ... ที่ pipeline ไม่ใช้ (ความกว้างของไฟล์)
+        null_rates: dict ของสัดส่วน null ต่อคอลัมน์ (default: None = DEFAULT_NULL_RATES)
+        issue_years: ช่วงปีของ issue_d (default: (2012, 2019) - ครึ่งหนึ่งอยู่นอกช่วงที่ pipeline เก็บ)
+        issue_distribution: การกระจายของ issue_d ใน ISSUE_DISTRIBUTIONS (default: 'uniform')
+        seed: seed ของการสุ่ม (default: 42)
+        start_row: แถวแรก (ใช้ต่อไฟล์ทีละ block - ต้องเป็นพหุคูณของ BLOCK_ROWS) (default: 0)
+    
+    Returns:
+        DataFrame ที่มี n_rows แถว (แถวเดียวกันได้ค่าเดิมเสมอเมื่อ seed / options เดิม)
+    """
+    if start_row % BLOCK_ROWS:
+        raise ValueError(f"start_row must be a multiple of {BLOCK_ROWS}, got {start_row}")
+    null_rates = DEFAULT_NULL_RATES if null_rates is None else null_rates
+    months = pd.date_range(f'{issue_years[0]}-01-01', f'{issue_years[1]}-12-01', freq='MS')
+    month_labels = np.asarray(months.strftime('%b-%Y'))
+    month_weights = issue_month_weights(months, issue_distribution)
+    payment_days = np.asarray(pd.date_range('2016-01-01', '2019-12-01', freq='MS').strftime('%Y-%m-%d'))
+    
+    blocks = []
+    for block_start in range(start_row, start_row + max(n_rows, 1), BLOCK_ROWS):
+        size = min(BLOCK_ROWS, start_row + n_rows - block_start)
+        rng = np.random.default_rng([seed, block_start // BLOCK_ROWS])
+        block = pd.DataFrame({
+            'id': np.arange(block_start, block_start + size),
+            'loan_amnt': rng.integers(1000, 40000, size).astype(float),
+            'funded_amnt': rng.integers(1000, 40000, size).astype(float),
+            'term': rng.choice(TERMS, size),
+            'int_rate': np.char.add(np.round(rng.uniform(5, 31, size), 2).astype(str), '%'),
+            'installment': rng.uniform(30, 1500, size).round(2),
+            'home_ownership': rng.choice(HOME_OWNERSHIP, size),
+            'loan_status': rng.choice(LOAN_STATUS, size),
+            'issue_d': month_labels[rng.choice(len(month_labels), size, p=month_weights)],
+            'emp_title': rng.choice(EMP_TITLES, size),
+            'mths_since_last_delinq': rng.integers(0, 120, size).astype(float),
+            'last_pymnt_d': rng.choice(payment_days, size),
+            'desc': np.full(size, 'Borrower added on 2016-01-01 > debt consolidation', dtype=object)
+        })
+        for i in range(extra_columns):
+            block[f'x{i}'] = rng.random(size).round(6)
+        
+        for column, rate in null_rates.items():
+            if column in block.columns and rate > 0:
+                block[column] = block[column].mask(rng.random(size) < rate)
+        blocks.append(block)
+    
+    return pd.concat(blocks, ignore_index=True)
+
+
+def write_synthetic_loans(path, n_rows, verbose=True, **options):
+    """
+    เขียนไฟล์ CSV สังเคราะห์ทีละ block (หน่วยความจำไม่ขึ้นกับจำนวนแถว) แบบ atomic
+    
+    Args:
+        path: ไฟล์ CSV ปลายทาง
+        n_rows: จำนวนแถว
+        verbose: แสดงความคืบหน้า (default: True)
+        **options: options ของ build_synthetic_loans() (extra_columns, null_rates, issue_years, ...)
+    
+    Returns:
+        str: path ของไฟล์ที่เขียน
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_file = f'{path}.{os.getpid()}.tmp'
+    for start_row in range(0, max(n_rows, 1), BLOCK_ROWS):
+        block = build_synthetic_loans(min(BLOCK_ROWS, n_rows - start_row), start_row=start_row, **options)
+        block.to_csv(temp_file, mode='w' if start_row == 0 else 'a', header=start_row == 0, index=False)
+        if verbose and n_rows > BLOCK_ROWS:
+            print(f"   Generated {start_row + len(block):,}/{n_rows:,} rows", end='\r')
+    if verbose and n_rows > BLOCK_ROWS:
+        print()
+    os.replace(temp_file, path)
+    return path
+
+
+def parse_row_count(value):
+    """แปลงจำนวนแถวแบบย่อ เช่น '10k', '1M', '250000' เป็น int (ใช้เป็น argparse type)"""
+    multipliers = {'k': 1_000, 'm': 1_000_000}
+    text = str(value).strip().lower().replace('_', '')
+    try:
+        if text[-1:] in multipliers:
+            return int(float(text[:-1]) * multipliers[text[-1]])
+        return int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid row count: {value}")
+
+
+def parse_null_rate(value):
+    """แปลง 'COLUMN=RATE' เป็น (column, rate) (ใช้เป็น argparse type)"""
+    column, _, rate = value.partition('=')
+    try:
+        rate = float(rate)
+    except ValueError:
+        rate = -1
+    if not column or not 0 <= rate <= 1:
+        raise argparse.ArgumentTypeError(f"expected COLUMN=RATE with 0 <= RATE <= 1, got {value}")
+    return column, rate
+
+
+def add_generator_arguments(parser):
+    """เพิ่ม options ของ generator ให้ parser (ใช้ร่วมกับ pipeline_benchmark.py)"""
+    parser.add_argument('--extra-columns', type=int, default=20,
+                        help='จำนวนคอลัมน์ตัวเลขเพิ่มเติมที่ pipeline ไม่ใช้ (default: %(default)s)')
+    parser.add_argument('--null-rate', type=parse_null_rate, action='append', default=[], metavar='COLUMN=RATE',
+                        help='กำหนดสัดส่วน null ของคอลัมน์ (ใช้ซ้ำได้ เช่น --null-rate desc=0.5 --null-rate x0=0.4)')
+    parser.add_argument('--issue-years', type=int, nargs=2, default=[2012, 2019], metavar=('FIRST', 'LAST'),
+                        help='ช่วงปีของ issue_d (default: 2012 2019)')
+    parser.add_argument('--issue-distribution', choices=ISSUE_DISTRIBUTIONS, default='uniform',
+                        help='การกระจายของ issue_d (growth = สินเชื่อเพิ่มขึ้นตามเวลา) (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=42, help='seed ของการสุ่ม (default: %(default)s)')
+
+
+def generator_options(args):
+    """แปลง options จาก add_generator_arguments() เป็น keyword arguments ของ build_synthetic_loans()"""
+    return {
+        'extra_columns': args.extra_columns,
+        'null_rates': dict(DEFAULT_NULL_RATES, **dict(args.null_rate)),
+        'issue_years': tuple(args.issue_years),
+        'issue_distribution': args.issue_distribution,
+        'seed': args.seed
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Generate a synthetic LoanStats CSV')
+    parser.add_argument('output', help='ไฟล์ CSV ปลายทาง')
+    parser.add_argument('--rows', type=parse_row_count, default=100_000, help='จำนวนแถว เช่น 10k, 1M (default: 100k)')
+    add_generator_arguments(parser)
+    args = parser.parse_args()
+    
+    path = write_synthetic_loans(args.output, args.rows, **generator_options(args))
+    print(f"✅ Wrote {args.rows:,} rows to {path} ({os.path.getsize(path) / 1024**2:,.1f} MB)")
+    sys.exit(0)
@@ -9,82 +9,313 @@ import pandas as pd
 import numpy as np
 import sys
 import os
+import argparse
+import glob
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from functools import partial
 from datetime import datetime
-from sqlalchemy import create_engine, text
+from sqlalchemy import text, inspect, bindparam
+from sqlalchemy.types import Integer, Float
 import warnings
 warnings.filterwarnings('ignore')
 
 # Import functions
 from functions.guess_column_types import guess_column_types
-from functions.filter_issue_date_range import filter_issue_date_range
-from functions.clean_missing_values import clean_missing_values
+from functions.filter_issue_date_range import filter_issue_date_range, issue_date_in_range
+from functions.clean_missing_values import clean_missing_values, count_missing_values, columns_within_null_limit
+from functions.load_data import load_data
+from functions.sample_csv_rows import sample_csv_rows
+from functions.build_dtype_spec import build_dtype_spec
+from functions.csv_cache import invalidate_csv_cache
+from functions.artifact_bundle import write_artifact_bundle, read_artifact_bundle
+from functions.bulk_load_table import bulk_load_table, LOAD_METHODS
+from functions.database_engine import get_engine, DEFAULT_POOL_SIZE
+from functions.load_control import partition_checksums, read_load_control, load_watermark, record_load_control
+from functions.build_dimension import assign_surrogate_keys, build_dimension_table, dimension_key_index
+from functions.key_registry import load_key_registry, save_key_registry, key_registry_lock
+from functions.calendar_dimension import calendar_month_ids, calendar_year_range, build_calendar_dimension
+from functions.compact_fact_table import compact_fact_table, concat_compact_frames, frame_memory_bytes, restore_fact_table
+from functions.stats_catalog import read_stats_catalog, update_stats_catalog, catalog_null_stats
+from functions.stage_metrics import measure_stage, write_stage_metrics
+from functions.pipeline_dag import dag_node, evaluate_dag
 
 
-def create_star_schema(df):
+# ช่วงปีของ issue_d ที่เก็บไว้ (ตรงกับ default ของ filter_issue_date_range)
+ISSUE_YEAR_RANGE = (2016, 2019)
+
+# Star Schema definition: measures ที่คัดลอกไป fact table และ spec ของแต่ละ dimension
+# (name = prefix ของ <name>_dim / <name>_id, columns = natural key ในไฟล์ต้นทาง (หลายคอลัมน์ได้),
+#  attributes = ฟังก์ชันเพิ่มคอลัมน์ให้ dimension table,
+#  calendar = ช่วงปีของ calendar dimension รายเดือน - id = year * 12 + month แทนการ factorize)
+FACT_MEASURES = ['loan_amnt', 'funded_amnt', 'term', 'int_rate', 'installment']
+DIMENSIONS = [
+    {'name': 'home_ownership', 'label': 'Home Ownership', 'columns': ['home_ownership']},
+    {'name': 'loan_status', 'label': 'Loan Status', 'columns': ['loan_status']},
+    {'name': 'issue_d', 'label': 'Issue Date', 'columns': ['issue_d'], 'calendar': ISSUE_YEAR_RANGE}
+]
+
+# รูปแบบวันที่ของไฟล์ LoanStats ที่ไม่ใช่ ISO (ใช้ parse ระหว่างโหลดเมื่อใช้ --typed-load)
+DATE_FORMATS = {'issue_d': '%b-%Y'}
+
+# จำนวนแถวตัวอย่างที่ใช้เดาประเภทข้อมูลก่อนโหลดแบบกำหนด dtype
+TYPE_SAMPLE_SIZE = 10000
+
+# ชื่อ fact table ใน database และใน artifact bundle
+FACT_TABLE = 'loans_fact'
+
+# ไฟล์ข้อมูล default ของ main() (path ใน Jenkins workspace)
+DATA_FILE = 'data/LoanStats_web_small.csv'
+
+# คอลัมน์ที่ใช้แบ่ง partition ของ fact table สำหรับ deploy แบบ incremental (หนึ่งเดือนของ issue_d ต่อ partition)
+PARTITION_COLUMN = 'issue_d'
+
+
+def required_columns():
+    """
+    คอลัมน์ของไฟล์ต้นทางที่ Star Schema ใช้จริง (ใช้ทำ projection ตอนอ่าน CSV)
+    
+    Returns:
+        list: ชื่อคอลัมน์ measures + คอลัมน์ของ dimensions
+    """
+    return FACT_MEASURES + [column for spec in DIMENSIONS for column in spec['columns']]
+
+
+def _projection(columns, skipped=()):
+    """แปลงรายชื่อคอลัมน์เป็น usecols แบบ callable (ไม่ error ถ้าไฟล์ไม่มีบางคอลัมน์) โดยไม่อ่านคอลัมน์ใน skipped"""
+    if columns is None and not skipped:
+        return None
+    wanted = None if columns is None else set(columns)
+    skipped = set(skipped)
+    return lambda column: (wanted is None or column in wanted) and column not in skipped
+
+
+def _catalog_skipped_columns(catalog, max_null_percentage):
+    """
+    คอลัมน์ที่ stats catalog รู้แล้วว่า null เกิน max_null_percentage (ไม่ต้องอ่านจากไฟล์)
+    
+    Returns:
+        list: ชื่อคอลัมน์ (ว่างถ้าไม่มี catalog)
+    """
+    if catalog is None:
+        return []
+    kept = set(columns_within_null_limit(catalog, max_null_percentage))
+    skipped = [column for column in catalog['null_counts'].index if column not in kept]
+    print(f"📇 Stats catalog: {catalog['rows']:,} rows, {len(catalog['null_counts'])} profiled columns, "
+          f"skipping {len(skipped)} columns over {max_null_percentage}% null before reading")
+    return skipped
+
+
+def _record_stats_catalog(data_file, null_stats, column_types=None):
+    """บันทึกสถิติของรอบนี้ลง stats catalog (ไม่ให้ pipeline ล้มถ้าเขียนไม่ได้)"""
+    if not null_stats:
+        return
+    try:
+        path = update_stats_catalog(data_file, null_stats, column_types)
+        print(f"📇 Stats catalog: saved {len(null_stats['null_counts'])} column profiles to {path}")
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Stats catalog not saved: {e}")
+
+
+def _issue_year_filter(null_stats=None):
+    """
+    สร้าง row_filter สำหรับ load_data() ที่ทิ้งแถว issue_d นอก ISSUE_YEAR_RANGE ระหว่างอ่าน
+    (ตรวจจากข้อความวันที่ดิบก่อนแปลงคอลัมน์อื่น)
+    
+    Args:
+        null_stats: dict ที่ใช้สะสม count_missing_values() ของ chunk ดิบก่อนกรอง
+            (ถูกอัปเดตในที่ - เกณฑ์ null จึงยังคิดจากทุกแถวของไฟล์) (default: None = ไม่นับ)
+    
+    Returns:
+        ฟังก์ชันรับ chunk แล้วคืน bool mask หรือ None ถ้า chunk ไม่มีคอลัมน์ issue_d
+    """
+    min_year, max_year = ISSUE_YEAR_RANGE
+    
+    def keep_rows(chunk):
+        if null_stats is not None:
+            null_stats.update(count_missing_values(chunk, null_stats or None))
+        if 'issue_d' not in chunk.columns:
+            return None
+        return issue_date_in_range(chunk['issue_d'], min_year=min_year, max_year=max_year)
+    
+    return keep_rows
+
+
+def _dimension_table(spec, known_keys):
+    """สร้าง dimension table ของ spec จาก key ที่สะสมไว้ (calendar dimension: known_keys คือช่วงปี)"""
+    if 'calendar' in spec:
+        return build_calendar_dimension(*known_keys, date_column=spec['columns'][0], id_column=f"{spec['name']}_id")
+    return build_dimension_table(known_keys, f"{spec['name']}_id", spec.get('attributes'))
+
+
+def _assign_calendar_keys(spec, dates, year_range=None):
+    """
+    id ของ calendar dimension จากวันที่โดยตรง (year * 12 + month) และขยายช่วงปีให้ครอบคลุมข้อมูล
+    
+    Returns:
+        tuple: (ids ต่อแถว, (ปีแรก, ปีสุดท้าย) ของ calendar)
+    """
+    ids = calendar_month_ids(dates)
+    min_year, max_year = year_range or spec['calendar']
+    data_range = calendar_year_range(ids)
+    if data_range is not None:
+        min_year, max_year = min(min_year, data_range[0]), max(max_year, data_range[1])
+    return ids, (min_year, max_year)
+
+
+def load_dimension_keys(registry_dir=None):
+    """
+    โหลด key ของทุก dimension จาก key registry (ใช้เป็น dimension_keys เริ่มต้นของ create_star_schema)
+    
+    Args:
+        registry_dir: directory ของ key registry (default: None = ไม่ใช้ registry)
+    
+    Returns:
+        dict: {ชื่อ dimension: Index ของ key} ของ dimension ที่มี registry แล้ว
+    """
+    if registry_dir is None:
+        return {}
+    dimension_keys = {}
+    for spec in DIMENSIONS:
+        if 'calendar' in spec:
+            continue
+        known_keys = load_key_registry(registry_dir, spec['name'])
+        if known_keys is not None:
+            dimension_keys[spec['name']] = known_keys
+    return dimension_keys
+
+
+def save_dimension_keys(registry_dir, dimension_keys):
+    """
+    บันทึก key ของทุก dimension ลง key registry (เขียนเฉพาะ dimension ที่มี key ใหม่)
+    
+    Returns:
+        int: จำนวน key ใหม่ทั้งหมดที่บันทึก
+    """
+    calendars = {spec['name'] for spec in DIMENSIONS if 'calendar' in spec}
+    added = sum(save_key_registry(registry_dir, name, known_keys) for name, known_keys in dimension_keys.items()
+                if name not in calendars)
+    print(f"   🔑 Key registry {registry_dir}: {added} new keys")
+    return added
+
+
+def create_star_schema(df, dimension_keys=None, fact_id_start=1, verbose=True):
     """
     สร้าง Star Schema จาก DataFrame ที่ประมวลผลแล้ว
     
+    surrogate id ของทุก dimension ใน DIMENSIONS ถูกกำหนดด้วย factorize ครั้งเดียวต่อ dimension
+    ยกเว้น calendar dimension ที่คำนวณ id จากวันที่ (ไม่ copy ทั้ง DataFrame - fact table คัดลอกเฉพาะ measures)
+    
+    รองรับการสร้างทีละ chunk: ส่ง dimension_keys เดิมเข้ามาเพื่อให้ค่าที่เคยพบ
+    ได้ id เดิม และค่าใหม่ได้ id ถัดไป
+    
     Args:
         df: DataFrame ที่ทำความสะอาดแล้ว
-        
+        dimension_keys: dict {ชื่อ dimension: Index ของ key หรือช่วงปีของ calendar} ที่สะสมจาก chunk ก่อนหน้า
+            (default: None = เริ่มใหม่)
+        fact_id_start: fact_id ของแถวแรก (default: 1)
+        verbose: แสดงสรุปแต่ละตาราง (default: True)
+    
     Returns:
         tuple: (fact_table, dim_tables_dict)
     """
-    print("\n🌟 Creating Star Schema...")
+    if verbose:
+        print("\n🌟 Creating Star Schema...")
+    
+    if dimension_keys is None:
+        dimension_keys = {}
     
     dim_tables = {}
-    fact_data = df.copy()
+    dimension_ids = {}
     
-    # 1. Home Ownership Dimension
-    if 'home_ownership' in df.columns:
-        home_ownership_dim = df[['home_ownership']].drop_duplicates().reset_index(drop=True)
-        home_ownership_dim['home_ownership_id'] = home_ownership_dim.index + 1
-        dim_tables['home_ownership_dim'] = home_ownership_dim
-        
-        # Map to fact table
-        home_ownership_map = home_ownership_dim.set_index('home_ownership')['home_ownership_id'].to_dict()
-        fact_data['home_ownership_id'] = fact_data['home_ownership'].map(home_ownership_map)
-        print(f"   ✅ Home Ownership Dimension: {len(home_ownership_dim)} records")
-    
-    # 2. Loan Status Dimension
-    if 'loan_status' in df.columns:
-        loan_status_dim = df[['loan_status']].drop_duplicates().reset_index(drop=True)
-        loan_status_dim['loan_status_id'] = loan_status_dim.index + 1
-        dim_tables['loan_status_dim'] = loan_status_dim
-        
-        # Map to fact table
-        loan_status_map = loan_status_dim.set_index('loan_status')['loan_status_id'].to_dict()
-        fact_data['loan_status_id'] = fact_data['loan_status'].map(loan_status_map)
-        print(f"   ✅ Loan Status Dimension: {len(loan_status_dim)} records")
+    for spec in DIMENSIONS:
+        if all(column in df.columns for column in spec['columns']):
+            name = spec['name']
+            if 'calendar' in spec:
+                ids, dimension_keys[name] = _assign_calendar_keys(spec, df[spec['columns'][0]], dimension_keys.get(name))
+            else:
+                ids, dimension_keys[name] = assign_surrogate_keys(df, spec['columns'], dimension_keys.get(name))
+            dimension_ids[f'{name}_id'] = ids
+            dim_tables[f'{name}_dim'] = _dimension_table(spec, dimension_keys[name])
+            if verbose:
+                print(f"   ✅ {spec['label']} Dimension: {len(dim_tables[f'{name}_dim'])} records")
     
-    # 3. Issue Date Dimension
-    if 'issue_d' in df.columns:
-        issue_d_dim = df[['issue_d']].drop_duplicates().reset_index(drop=True)
-        issue_d_dim['issue_d_id'] = issue_d_dim.index + 1
-        issue_d_dim['month'] = issue_d_dim['issue_d'].dt.month
-        issue_d_dim['year'] = issue_d_dim['issue_d'].dt.year
-        issue_d_dim['quarter'] = issue_d_dim['issue_d'].dt.quarter
-        dim_tables['issue_d_dim'] = issue_d_dim
-        
-        # Map to fact table
-        issue_d_map = issue_d_dim.set_index('issue_d')['issue_d_id'].to_dict()
-        fact_data['issue_d_id'] = fact_data['issue_d'].map(issue_d_map)
-        print(f"   ✅ Issue Date Dimension: {len(issue_d_dim)} records")
+    # Create Fact Table: measures ที่มีอยู่ + surrogate ids
+    measures = [column for column in FACT_MEASURES if column in df.columns]
+    fact_table = df[measures].reset_index(drop=True)
+    for id_column, ids in dimension_ids.items():
+        fact_table[id_column] = ids
+    fact_table['fact_id'] = fact_table.index + fact_id_start
     
-    # 4. Create Fact Table
-    fact_columns = [
-        'loan_amnt', 'funded_amnt', 'term', 'int_rate', 'installment',
-        'home_ownership_id', 'loan_status_id', 'issue_d_id'
-    ]
+    if verbose:
+        print(f"   ✅ Fact Table: {len(fact_table)} records, {len(measures) + len(dimension_ids)} measures")
     
-    # เลือกเฉพาะคอลัมน์ที่มีอยู่
-    available_columns = [col for col in fact_columns if col in fact_data.columns]
-    fact_table = fact_data[available_columns].reset_index(drop=True)
-    fact_table['fact_id'] = fact_table.index + 1
+    return fact_table, dim_tables
+
+
+def profile_null_stats(data_file, chunksize, columns=None, cache_dir=None):
+    """
+    อ่านไฟล์ทีละ chunk เพื่อนับ null ต่อคอลัมน์เท่านั้น (ไม่แปลง dtype - จำนวน null ไม่ขึ้นกับ dtype spec)
     
-    print(f"   ✅ Fact Table: {len(fact_table)} records, {len(available_columns)} measures")
+    Returns:
+        ผลลัพธ์จาก count_missing_values() ของทั้งไฟล์ หรือ None ถ้าไฟล์ไม่มีข้อมูล
+    """
+    null_stats = None
+    for chunk in load_data(data_file, chunksize=chunksize, usecols=_projection(columns), cache_dir=cache_dir):
+        null_stats = count_missing_values(chunk, null_stats)
+    return null_stats
+
+
+def stream_fact_chunks(data_file, chunksize, dimension_keys, max_null_percentage=30, columns=None,
+                       dtype_spec=None, cache_dir=None, null_stats=None):
+    """
+    รัน ETL แบบ streaming ทีละ chunk (หน่วยความจำขึ้นกับ chunksize ไม่ใช่ขนาดไฟล์)
     
-    return fact_table, dim_tables
+    รอบที่ 1 อ่านไฟล์ทีละ chunk เพื่อนับ null ต่อคอลัมน์เท่านั้น (ข้ามได้เมื่อส่ง null_stats มา) รอบที่ 2
+    อ่านเฉพาะคอลัมน์ที่ผ่านเกณฑ์ ทิ้งแถวที่ issue_d อยู่นอกช่วงปีตั้งแต่ chunk ดิบ แล้วจึง
+    แปลง dtype, dropna และสร้าง fact rows ของแต่ละ chunk
+    
+    Args:
+        data_file: path ของไฟล์ CSV
+        chunksize: จำนวนแถวต่อ chunk
+        dimension_keys: dict ที่ใช้สะสม dimension keys (ถูกอัปเดตในที่)
+        max_null_percentage: เปอร์เซ็นต์สูงสุดของ null ที่ยอมรับได้ (default: 30)
+        columns: อ่านเฉพาะคอลัมน์เหล่านี้ (default: None = ทุกคอลัมน์)
+        dtype_spec: dtype spec จาก build_dtype_spec() (default: None)
+        cache_dir: directory ของ columnar cache ของไฟล์ที่ parse แล้ว (default: None = ไม่ใช้ cache)
+        null_stats: null stats ของทั้งไฟล์ที่นับไว้แล้ว เช่นจาก stats catalog
+            (default: None = นับใหม่ด้วย profile_null_stats())
+    
+    Yields:
+        tuple: (fact_chunk: DataFrame, rows_read: จำนวนแถวดิบของ chunk)
+    """
+    # Pass 1: null-ratio statistics only (unless they are already known)
+    if null_stats is None:
+        null_stats = profile_null_stats(data_file, chunksize, columns=columns, cache_dir=cache_dir)
+    
+    if null_stats is None:
+        return
+    
+    columns_to_keep = columns_within_null_limit(null_stats, max_null_percentage)
+    print(f"   Null profile: {null_stats['rows']:,} rows, keeping "
+          f"{len(columns_to_keep)}/{len(null_stats['null_counts'])} columns (≤{max_null_percentage}% null)")
+    
+    # Pass 2: drop out-of-range rows on the raw chunk, then transform and emit fact rows
+    fact_id_start = 1
+    raw_stats = {}
+    rows_reported = 0
+    for chunk in load_data(data_file, chunksize=chunksize, usecols=columns_to_keep, dtype_spec=dtype_spec,
+                           row_filter=_issue_year_filter(raw_stats), cache_dir=cache_dir):
+        rows_read = raw_stats['rows'] - rows_reported
+        rows_reported = raw_stats['rows']
+        if 'issue_d' in chunk.columns:
+            chunk = filter_issue_date_range(chunk, verbose=False)
+        chunk = chunk.dropna()
+        
+        fact_chunk, _ = create_star_schema(chunk, dimension_keys=dimension_keys,
+                                           fact_id_start=fact_id_start, verbose=False)
+        fact_id_start += len(fact_chunk)
+        yield fact_chunk, rows_read
 
 
 def show_etl_results(fact_table, dim_tables):
@@ -95,6 +326,8 @@ def show_etl_results(fact_table, dim_tables):
         fact_table: DataFrame ของ fact table
         dim_tables: dict ของ dimension tables
     """
+    # ค่าสถิติคำนวณจากค่าเดิม (ผลรวมของ float32 จาก --compact คลาดเคลื่อน)
+    fact_table = restore_fact_table(fact_table)
     print("\n" + "="*80)
     print("🎯 ETL PIPELINE RESULTS")
     print("="*80)
@@ -128,28 +361,230 @@ def show_etl_results(fact_table, dim_tables):
             print(f"   - Total: ${fact_table['loan_amnt'].sum():,.2f}")
 
 
-def deploy_to_database(fact_table, dim_tables):
+def _natural_fact(fact_table, dim_tables):
+    """
+    fact rows ในรูปค่าจริงของ dimension แทน surrogate id (id ของแต่ละรอบอาจต่างกัน)
+    ใช้คำนวณ checksum ของแต่ละ partition - คอลัมน์ของ fact table แบบ compact ถูกแปลงกลับเป็นประเภทปกติ
+    ด้วย restore_fact_table() checksum จึงไม่ขึ้นกับ --compact
+    """
+    natural = restore_fact_table(fact_table.drop(columns=['fact_id'], errors='ignore'))
+    for spec in DIMENSIONS:
+        id_column = f"{spec['name']}_id"
+        dim_df = dim_tables.get(f"{spec['name']}_dim")
+        if id_column in natural.columns and dim_df is not None:
+            keys = dim_df.set_index(id_column)[spec['columns']].reindex(natural[id_column].to_numpy())
+            position = natural.columns.get_loc(id_column)
+            natural = natural.drop(columns=id_column)
+            for offset, column in enumerate(spec['columns']):
+                natural.insert(position + offset, column, keys[column].to_numpy())
+    return natural
+
+
+def _deploy_column_types(df):
+    """
+    ประเภทคอลัมน์ที่ไม่ขึ้นกับข้อมูลรอบแรก สำหรับตารางที่ deploy แบบ incremental append ภายหลัง:
+    surrogate id / fact_id เป็น INT (sql_column_types() อาจเลือก SMALLINT ซึ่งจะล้นเมื่อ id สูงขึ้น)
+    และจำนวนเงินเป็น FLOAT(53) (fact table ที่ restore_fact_table() แล้วเป็น float64 อยู่แล้ว แต่ dimension
+    หรือ frame อื่นอาจยังเป็น float32 ซึ่งจะได้ REAL) - คอลัมน์ข้อความใช้ความกว้างคงที่ของ sql_column_types() อยู่แล้ว
+    """
+    column_types = {}
+    for column in df.columns:
+        if column == 'fact_id' or column.endswith('_id'):
+            column_types[column] = Integer()
+        elif pd.api.types.is_float_dtype(df[column]):
+            column_types[column] = Float(precision=53)
+    return column_types
+
+
+def _merge_dimension(engine, spec, dim_df, load_method):
+    """
+    เพิ่มเฉพาะค่าใหม่ของ dimension เข้าตารางใน database (ค่าเดิมคง id เดิม)
+    
+    Returns:
+        tuple: (dict {id ของรอบนี้: id ใน database}, จำนวนแถวที่เพิ่ม)
+    """
+    table_name = f"{spec['name']}_dim"
+    id_column = f"{spec['name']}_id"
+    key_columns = spec['columns']
+    if inspect(engine).has_table(table_name):
+        existing = pd.read_sql_table(table_name, engine, columns=key_columns + [id_column])
+    else:
+        existing = dim_df.iloc[0:0][key_columns + [id_column]]
+    
+    # เทียบ natural key (ทีละแถวของ dimension) กับ key ที่อยู่ใน database แล้ว
+    positions = dimension_key_index(existing, key_columns).get_indexer(dimension_key_index(dim_df, key_columns))
+    is_new = positions == -1
+    database_ids = np.empty(len(dim_df), dtype=np.int64)
+    database_ids[~is_new] = existing[id_column].to_numpy()[positions[~is_new]]
+    
+    # ค่าใหม่ใช้ id ของรอบนี้ถ้าไม่ชนกับ id ใน database (id จาก key registry จึงตรงกับ database เสมอ)
+    # ไม่เช่นนั้นได้ id ถัดจาก id สูงสุด
+    run_ids = dim_df[id_column].to_numpy()[is_new]
+    if np.isin(run_ids, existing[id_column].to_numpy()).any():
+        next_id = int(existing[id_column].max()) + 1
+        run_ids = np.arange(next_id, next_id + int(is_new.sum()))
+    database_ids[is_new] = run_ids
+    
+    new_rows = dim_df[is_new].copy()
+    new_rows[id_column] = database_ids[is_new]
+    if len(new_rows) > 0:
+        bulk_load_table(new_rows, table_name, engine, method=load_method, if_exists='append',
+                        column_types=_deploy_column_types(new_rows))
+    
+    return dict(zip(dim_df[id_column], database_ids.tolist())), len(new_rows)
+
+
+def _run_concurrently(engine, tasks):
+    """
+    รันงานโหลดแต่ละตารางพร้อมกันบน thread pool (connection ละงานจาก pool ของ engine)
+    SQLite เขียนได้ทีละ connection จึงรันทีละงาน
+    
+    Args:
+        engine: SQLAlchemy engine
+        tasks: dict {ชื่อตาราง: ฟังก์ชันที่ไม่รับ argument}
+    
+    Returns:
+        dict: {ชื่อตาราง: ผลลัพธ์ของฟังก์ชัน}
+    """
+    workers = 1 if engine.dialect.name == 'sqlite' else min(len(tasks), DEFAULT_POOL_SIZE)
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        futures = {pool.submit(task): table_name for table_name, task in tasks.items()}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
+def _deploy_full(engine, fact_table, dim_tables, load_method):
+    """แทนที่ fact/dimension tables ทั้งหมดแล้วบันทึกทุก partition ลง control table"""
+    # fact table ใช้ id ที่กำหนดไว้แล้วตอนสร้าง Star Schema จึงโหลดพร้อมกับ dimension tables ได้เลย
+    print("\n   📤 Deploying dimension and fact tables...")
+    tables = dict(dim_tables)
+    tables[FACT_TABLE] = fact_table
+    load_tasks = {table_name: partial(bulk_load_table, df, table_name, engine, method=load_method,
+                                      column_types=_deploy_column_types(df))
+                  for table_name, df in tables.items()}
+    results = _run_concurrently(engine, load_tasks)
+    for table_name, df in tables.items():
+        stats = results[table_name]
+        print(f"     ✅ {table_name}: {len(df)} records ({stats['method']}, {stats['seconds']:.2f}s)")
+    
+    natural = _natural_fact(fact_table, dim_tables)
+    if PARTITION_COLUMN in natural.columns:
+        _, last_batch = load_watermark(engine, FACT_TABLE)
+        record_load_control(engine, FACT_TABLE, partition_checksums(natural, PARTITION_COLUMN),
+                            last_batch + 1, replace_all=True)
+
+
+def _deploy_incremental(engine, fact_table, dim_tables, load_method):
+    """
+    โหลดเฉพาะ partition (เดือนของ issue_d) ที่ใหม่หรือเปลี่ยนไปจากที่บันทึกใน control table
+    
+    dimension เพิ่มเฉพาะค่าใหม่ fact rows ของ partition ที่เปลี่ยนถูกลบแล้วโหลดใหม่
+    partition ที่มีใน control table แต่ไม่มีในข้อมูลรอบนี้แล้วถูกลบทั้ง fact rows และ record ใน control table
+    (ผลจึงเหมือนโหลดเต็ม) control table บันทึกหลังโหลดเสร็จเท่านั้น ถ้าล้มเหลวกลางทาง
+    รอบถัดไปจะโหลด / ลบ partition เหล่านั้นซ้ำ
+    """
+    natural = _natural_fact(fact_table, dim_tables)
+    loaded = read_load_control(engine, FACT_TABLE)
+    if PARTITION_COLUMN not in natural.columns or loaded.empty:
+        print("   ⚠️  No load watermark found, running a full load")
+        return _deploy_full(engine, fact_table, dim_tables, load_method)
+    
+    watermark, last_batch = load_watermark(engine, FACT_TABLE)
+    partitions = partition_checksums(natural, PARTITION_COLUMN)
+    partitions = partitions.merge(loaded[['partition_key', 'checksum']], on='partition_key', how='left',
+                                  suffixes=('', '_loaded'))
+    is_new = partitions['checksum_loaded'].isna()
+    pending = partitions[partitions['checksum'] != partitions['checksum_loaded']]
+    removed_keys = loaded.loc[~loaded['partition_key'].isin(partitions['partition_key']), 'partition_key'].tolist()
+    print(f"   🔖 Watermark: {watermark} (batch {last_batch}) - {int(is_new.sum())} new, "
+          f"{len(pending) - int(is_new.sum())} changed, {len(partitions) - len(pending)} unchanged, "
+          f"{len(removed_keys)} removed partitions")
+    
+    if pending.empty and not removed_keys:
+        print("   ✅ Nothing to load")
+        return
+    
+    # Dimensions: append new values only (concurrently), then translate this run's ids to the database ids;
+    # the fact delta starts once every id map is final
+    print("\n   📤 Merging dimension tables...")
+    merge_tasks = {spec['name']: partial(_merge_dimension, engine, spec, dim_tables[f"{spec['name']}_dim"],
+                                         load_method)
+                   for spec in DIMENSIONS if f"{spec['name']}_dim" in dim_tables}
+    merges = _run_concurrently(engine, merge_tasks)
+    id_maps = {}
+    for name, (id_map, added) in merges.items():
+        id_maps[name] = id_map
+        print(f"     ✅ {name}_dim: {added} new records")
+    
+    # Fact: replace rows of changed partitions, append rows of new partitions
+    partition_keys = natural[PARTITION_COLUMN].astype(str)
+    changed_keys = pending.loc[pending['checksum_loaded'].notna(), 'partition_key']
+    partition_id = f'{PARTITION_COLUMN}_id'
+    replaced_ids = set(fact_table.loc[partition_keys.isin(changed_keys).to_numpy(), partition_id]
+                       .map(id_maps[PARTITION_COLUMN]).tolist())
+    if removed_keys:
+        # partition ที่ไม่มีในข้อมูลรอบนี้: หา id จาก dimension ใน database (อาจไม่มีใน dimension ของรอบนี้)
+        partition_dim = pd.read_sql_table(f'{PARTITION_COLUMN}_dim', engine, columns=[PARTITION_COLUMN, partition_id])
+        removed = partition_dim[PARTITION_COLUMN].astype(str).isin(removed_keys).to_numpy()
+        replaced_ids.update(partition_dim.loc[removed, partition_id].tolist())
+    replaced_ids = sorted(replaced_ids)
+    
+    delta = fact_table[partition_keys.isin(pending['partition_key']).to_numpy()].copy()
+    for name, id_map in id_maps.items():
+        delta[f'{name}_id'] = delta[f'{name}_id'].map(id_map)
+    
+    with engine.begin() as connection:
+        if replaced_ids:
+            statement = text(f"DELETE FROM {FACT_TABLE} WHERE {partition_id} IN :ids").bindparams(
+                bindparam('ids', expanding=True))
+            connection.execute(statement, {'ids': replaced_ids})
+        max_fact_id = connection.execute(text(f"SELECT MAX(fact_id) FROM {FACT_TABLE}")).scalar() or 0
+    delta['fact_id'] = range(max_fact_id + 1, max_fact_id + 1 + len(delta))
+    
+    if removed_keys:
+        print(f"     🗑️  {FACT_TABLE}: removed partitions {removed_keys}")
+    if len(delta) > 0:
+        print("\n   📤 Loading fact delta...")
+        stats = bulk_load_table(delta.reset_index(drop=True), FACT_TABLE, engine, method=load_method,
+                                if_exists='append')
+        print(f"     ✅ {FACT_TABLE}: {len(delta)} records in {len(pending)} partitions "
+              f"({stats['method']}, {stats['seconds']:.2f}s)")
+    
+    record_load_control(engine, FACT_TABLE, pending[['partition_key', 'row_count', 'checksum']], last_batch + 1,
+                        removed_keys=removed_keys)
+
+
+def deploy_to_database(fact_table, dim_tables, load_method='auto', database_url=None, incremental=False):
     """
     Deploy ข้อมูลไปยัง MSSQL Database
     
     Args:
         fact_table: DataFrame ของ fact table
         dim_tables: dict ของ dimension tables
+        load_method: วิธีโหลดของ bulk_load_table() เช่น 'auto', 'multi', 'bcp' (default: 'auto')
+        database_url: SQLAlchemy URL ที่ใช้แทน MSSQL server ปกติ เช่น sqlite สำหรับทดสอบ
+            (default: None = ใช้ env DATABASE_URL ถ้ามี)
+        incremental: โหลดเฉพาะ partition ที่ใหม่หรือเปลี่ยนตาม control table แทนการแทนที่ทั้งตาราง
+            (default: False)
     """
     print("\n🚀 Deploying to Database...")
     
-    # Database configuration
+    # Database configuration (DATABASE_URL แทนที่ server ปกติได้ทั้งหมด)
     server = '34.27.134.91'
     database = 'TestDB'
     username = 'SA'
     password = os.getenv('DB_PASSWORD', 'Passw0rd123456')
+    database_url = database_url or os.getenv('DATABASE_URL')
     
     try:
-        # Create database engine
-        connection_string = f'mssql+pymssql://{username}:{password}@{server}/{database}'
-        engine = create_engine(connection_string)
+        # Pooled engine, reused by later deploys in the same process
+        connection_string = database_url or f'mssql+pymssql://{username}:{password}@{server}/{database}'
+        engine = get_engine(connection_string)
         
-        print(f"   📡 Connecting to {server}/{database}...")
+        target = f'{server}/{database}' if database_url is None else engine.url.render_as_string(hide_password=True)
+        print(f"   📡 Connecting to {target}...")
         
         # Test connection
         with engine.connect() as connection:
@@ -157,115 +592,789 @@ def deploy_to_database(fact_table, dim_tables):
             if result.fetchone()[0] == 1:
                 print("   ✅ Database connection successful")
         
-        # Deploy dimension tables
-        print("\n   📤 Deploying dimension tables...")
-        for table_name, dim_df in dim_tables.items():
-            dim_df.to_sql(table_name, con=engine, if_exists='replace', index=False)
-            print(f"     ✅ {table_name}: {len(dim_df)} records")
-        
-        # Deploy fact table
-        print("\n   📤 Deploying fact table...")
-        fact_table.to_sql('loans_fact', con=engine, if_exists='replace', index=False)
-        print(f"     ✅ loans_fact: {len(fact_table)} records")
+        # fact table แบบ --compact ถูกแปลงกลับเป็นค่าเดิม (float32 -> float64 ระดับสตางค์) ก่อนโหลด
+        fact_table = restore_fact_table(fact_table)
+        if incremental:
+            _deploy_incremental(engine, fact_table, dim_tables, load_method)
+        else:
+            _deploy_full(engine, fact_table, dim_tables, load_method)
         
         print("\n🎉 Database deployment completed successfully!")
         
         # Verify deployment
         print("\n🔍 Verifying deployment...")
+        table_names = list(dim_tables.keys()) + [FACT_TABLE]
+        count_query = ' UNION ALL '.join(f"SELECT '{table_name}', COUNT(*) FROM {table_name}"
+                                         for table_name in table_names)
         with engine.connect() as connection:
-            for table_name in list(dim_tables.keys()) + ['loans_fact']:
-                count_result = connection.execute(text(f"SELECT COUNT(*) FROM {table_name}"))
-                count = count_result.fetchone()[0]
-                print(f"   📊 {table_name}: {count:,} records in database")
+            counts = dict(connection.execute(text(count_query)).fetchall())
+        for table_name in table_names:
+            print(f"   📊 {table_name}: {counts[table_name]:,} records in database")
         
         return True
-        
+    
     except Exception as e:
         print(f"   ❌ Database deployment failed: {str(e)}")
         print("   Note: This might be expected if database is not accessible")
         return False
 
 
-def main():
+def save_etl_bundle(bundle_dir, fact_table, dim_tables, data_file, original_rows):
     """
-    ETL Pipeline หลัก
+    บันทึก fact + dimension tables เป็น artifact bundle เพื่อให้ stage deploy ใช้ซ้ำโดยไม่ต้องรัน ETL ใหม่
+    
+    Args:
+        bundle_dir: directory ของ bundle
+        fact_table: DataFrame ของ fact table
+        dim_tables: dict ของ dimension tables
+        data_file: ไฟล์ข้อมูลต้นทาง หรือ list ของไฟล์ (เก็บ fingerprint ไว้ใน manifest)
+        original_rows: จำนวนแถวของไฟล์ต้นทาง
+    
+    Returns:
+        dict: manifest ของ bundle
     """
-    print("🚀 Starting ETL Pipeline with Custom Functions")
-    print("="*80)
+    print(f"\n📦 Saving artifact bundle to {bundle_dir}...")
+    tables = dict(dim_tables)
+    # bundle เก็บค่าเดิมเสมอ (fact table แบบ --compact ใช้ภายใน pipeline เท่านั้น)
+    tables[FACT_TABLE] = restore_fact_table(fact_table)
+    manifest = write_artifact_bundle(bundle_dir, tables, source_file=data_file,
+                                     metadata={'original_rows': original_rows, 'fact_table': FACT_TABLE})
+    print(f"✅ Bundle {manifest['bundle_version']}: {len(tables)} tables, "
+          f"{sum(len(entry['checksums']) for entry in manifest['tables'].values())} files with sha256 checksums")
+    return manifest
+
+
+def load_etl_bundle(bundle_dir):
+    """
+    โหลดผลลัพธ์ ETL จาก artifact bundle (ตรวจ checksum ทุกไฟล์ก่อนใช้)
     
-    # Configuration
-    data_file = 'data/LoanStats_web_small.csv'  # Path in Jenkins workspace
+    Returns:
+        tuple: (fact_table, dim_tables, original_rows, final_rows)
+    """
+    print(f"\n📦 Loading artifact bundle from {bundle_dir}...")
+    tables, manifest = read_artifact_bundle(bundle_dir)
+    fact_name = manifest['metadata'].get('fact_table', FACT_TABLE)
+    fact_table = tables.pop(fact_name)
     
-    # Check if running in deployment mode
-    deploy_mode = '--deploy' in sys.argv
+    source = manifest.get('source') or {}
+    source_name = f"{len(source)} files" if isinstance(source, list) else source.get('path', 'unknown source')
+    print(f"✅ Bundle {manifest['bundle_version']} created at {manifest['created_at']} "
+          f"from {source_name} (checksums verified)")
+    return fact_table, tables, manifest['metadata'].get('original_rows', len(fact_table)), len(fact_table)
+
+
+def _print_column_types(column_types):
+    """แสดงตัวอย่างประเภทข้อมูลที่เดาได้"""
+    print(f"✅ Analyzed {len(column_types)} columns")
+    print("   Sample column types:")
+    for i, (col, dtype) in enumerate(list(column_types.items())[:5]):
+        print(f"     - {col}: {dtype}")
+    if len(column_types) > 5:
+        print(f"     ... and {len(column_types)-5} more")
+
+
+def infer_dtype_spec(data_file, columns=None):
+    """
+    เดาประเภทข้อมูลจากแถวตัวอย่างแล้วแปลงเป็น dtype spec สำหรับโหลดทั้งไฟล์
     
-    try:
-        # Step 1: Analyze column types
-        print("\n📋 Step 1: Analyzing Column Types...")
-        success, column_types = guess_column_types(data_file)
+    Args:
+        data_file: path ของไฟล์ CSV
+        columns: คอลัมน์ที่จะโหลด (default: None = ทุกคอลัมน์)
+    
+    Returns:
+        tuple: (column_types, dtype_spec) หรือ (error_message, None) ถ้าล้มเหลว
+    """
+    sample_df, _ = sample_csv_rows(data_file, sample_size=TYPE_SAMPLE_SIZE, strategy='stratified')
+    if columns is not None:
+        sample_df = sample_df[[column for column in sample_df.columns if column in set(columns)]]
+    
+    success, column_types = guess_column_types(sample_df)
+    if not success:
+        return column_types, None
+    
+    dtype_spec = build_dtype_spec(column_types, sample_df=sample_df, date_formats=DATE_FORMATS)
+    return column_types, dtype_spec
+
+
+def _print_compaction(before_bytes, after_bytes, rows):
+    """แสดงขนาดต่อแถวของ fact table ก่อน / หลัง compact"""
+    rows = max(rows, 1)
+    print(f"   🗜️  Compact fact table: {before_bytes / rows:,.1f} -> {after_bytes / rows:,.1f} bytes/row "
+          f"({before_bytes / 1024**2:,.1f} -> {after_bytes / 1024**2:,.1f} MB)")
+
+
+def _build_star_schema(df_final, key_registry=None, compact=False, metrics=None):
+    """
+    Step 6 ของ batch / multi-file: Star Schema (ใช้ key registry ถ้ากำหนด) แล้ว compact ถ้าเลือก
+    ล็อก key registry ตั้งแต่โหลด key จนบันทึก key ใหม่ (การรันพร้อมกันจึงไม่ให้ id เดียวกันกับค่าต่างกัน)
+    """
+    with key_registry_lock(key_registry):
+        dimension_keys = load_dimension_keys(key_registry)
+        with measure_stage(metrics, 'star_schema', rows_in=len(df_final)) as record:
+            fact_table, dim_tables = create_star_schema(df_final, dimension_keys=dimension_keys)
+            record['rows_out'] = len(fact_table)
+        if key_registry is not None:
+            save_dimension_keys(key_registry, dimension_keys)
+    if compact:
+        before_bytes = frame_memory_bytes(fact_table)
+        with measure_stage(metrics, 'compact', rows_in=len(fact_table)) as record:
+            fact_table = compact_fact_table(fact_table)
+            record['rows_out'] = len(fact_table)
+        _print_compaction(before_bytes, frame_memory_bytes(fact_table), len(fact_table))
+    return fact_table, dim_tables
+
+
+def run_batch_pipeline(data_file, max_null_percentage=30, columns=None, typed_load=False, cache_dir=None,
+                       key_registry=None, compact=False, stats_catalog=False, workers=None, metrics=None):
+    """
+    รัน Step 1-6 แบบโหลดทั้งไฟล์เข้าหน่วยความจำ
+    
+    Args:
+        data_file: path ของไฟล์ CSV
+        max_null_percentage: เปอร์เซ็นต์สูงสุดของ null ที่ยอมรับได้ (default: 30)
+        columns: อ่านเฉพาะคอลัมน์เหล่านี้ (default: None = ทุกคอลัมน์)
+        typed_load: เดาประเภทจากตัวอย่างแล้วโหลดด้วย dtype ที่กำหนด (default: False)
+        cache_dir: directory ของ columnar cache ของไฟล์ที่ parse แล้ว (default: None = ไม่ใช้ cache)
+        key_registry: directory ของ key registry ที่ทำให้ surrogate id คงเดิมข้ามการรัน
+            (default: None = กำหนด id ใหม่ทุกรอบ)
+        compact: แปลง fact table เป็นประเภทแคบที่สุดที่ปลอดภัยด้วย compact_fact_table() (default: False)
+        stats_catalog: ใช้ stats catalog ข้างไฟล์ข้อมูล (<data_file>.stats.json) - ไม่อ่านคอลัมน์ที่
+            catalog รู้แล้วว่า null เกินเกณฑ์ และบันทึกสถิติของรอบนี้ไว้ใช้รอบถัดไป (default: False)
+        workers: จำนวน process ที่เดาประเภทของคอลัมน์พร้อมกันใน Step 2 (default: None = ทีละคอลัมน์)
+        metrics: list ที่เก็บเวลา / CPU / หน่วยความจำ / จำนวนแถวของแต่ละขั้นตอน (ดู measure_stage())
+            (default: None = ไม่วัด)
+    
+    Returns:
+        tuple: (fact_table, dim_tables, original_rows, final_rows) หรือ None ถ้าล้มเหลว
+    
+    แถวที่ issue_d อยู่นอก ISSUE_YEAR_RANGE ถูกทิ้งระหว่างอ่านไฟล์ (ก่อนแปลง dtype) ส่วนเกณฑ์
+    null ของ Step 3 ยังคิดจากทุกแถวของไฟล์ตามเดิม
+    """
+    null_stats = {}
+    row_filter = _issue_year_filter(null_stats)
+    catalog = read_stats_catalog(data_file) if stats_catalog else None
+    usecols = _projection(columns, _catalog_skipped_columns(catalog, max_null_percentage))
+    
+    if typed_load:
+        # Step 1: Analyze column types on a sample and turn them into a dtype spec
+        print(f"\n📋 Step 1: Analyzing Column Types on a {TYPE_SAMPLE_SIZE:,}-row sample...")
+        with measure_stage(metrics, 'type_analysis', rows_in=TYPE_SAMPLE_SIZE):
+            column_types, dtype_spec = infer_dtype_spec(data_file, columns)
         
-        if not success:
+        if dtype_spec is None:
             print(f"❌ Column type analysis failed: {column_types}")
-            return False
+            return None
         
-        print(f"✅ Analyzed {len(column_types)} columns")
-        print("   Sample column types:")
-        for i, (col, dtype) in enumerate(list(column_types.items())[:5]):
-            print(f"     - {col}: {dtype}")
-        if len(column_types) > 5:
-            print(f"     ... and {len(column_types)-5} more")
+        _print_column_types(column_types)
+        print(f"   Category columns: {list(dtype_spec['dtype'])}")
         
-        # Step 2: Load raw data
-        print(f"\n📂 Step 2: Loading Data from {data_file}...")
-        df = pd.read_csv(data_file, low_memory=False)
-        print(f"✅ Loaded: {len(df):,} rows, {len(df.columns)} columns")
+        # Step 2: Load raw data once with explicit, compact dtypes
+        print(f"\n📂 Step 2: Loading Data from {data_file} with explicit dtypes...")
+        with measure_stage(metrics, 'load') as record:
+            df = load_data(data_file, usecols=usecols, dtype_spec=dtype_spec, row_filter=row_filter,
+                           cache_dir=cache_dir)
+            record.update(rows_in=null_stats.get('rows', 0), rows_out=len(df))
+        print(f"✅ Loaded: {len(df):,} of {null_stats.get('rows', 0):,} rows in {ISSUE_YEAR_RANGE[0]}-"
+              f"{ISSUE_YEAR_RANGE[1]}, {len(df.columns)} columns "
+              f"({df.memory_usage(deep=True).sum() / 1024**2:,.1f} MB)")
+    else:
+        # Step 1: Load raw data (parse the CSV once and share the frame)
+        print(f"\n📂 Step 1: Loading Data from {data_file}...")
+        with measure_stage(metrics, 'load') as record:
+            df = load_data(data_file, usecols=usecols, row_filter=row_filter, cache_dir=cache_dir)
+            record.update(rows_in=null_stats.get('rows', 0), rows_out=len(df))
+        print(f"✅ Loaded: {len(df):,} of {null_stats.get('rows', 0):,} rows in {ISSUE_YEAR_RANGE[0]}-"
+              f"{ISSUE_YEAR_RANGE[1]}, {len(df.columns)} columns")
         
-        # Step 3: Clean missing values
-        print(f"\n🧹 Step 3: Cleaning Missing Values...")
-        df_clean = clean_missing_values(df, max_null_percentage=30)
-        print(f"✅ After cleaning: {len(df_clean):,} rows, {len(df_clean.columns)} columns")
+        # Step 2: Analyze column types on the already-loaded frame
+        print("\n📋 Step 2: Analyzing Column Types...")
+        with measure_stage(metrics, 'type_analysis', rows_in=len(df)):
+            success, column_types = guess_column_types(df, workers=workers)
         
-        # Step 4: Filter date range (if issue_d exists)
-        print(f"\n📅 Step 4: Filtering Date Range...")
-        if 'issue_d' in df_clean.columns:
-            df_filtered = filter_issue_date_range(df_clean)
-            print(f"✅ After date filtering: {len(df_filtered):,} rows")
-        else:
-            df_filtered = df_clean
-            print("⚠️  No 'issue_d' column found, skipping date filtering")
+        if not success:
+            print(f"❌ Column type analysis failed: {column_types}")
+            return None
         
-        # Step 5: Remove rows with any null values (for clean fact table)
-        print(f"\n🔧 Step 5: Final Data Cleanup...")
+        _print_column_types(column_types)
+    
+    if stats_catalog:
+        _record_stats_catalog(data_file, null_stats, column_types)
+    
+    # Step 3: Clean missing values
+    print(f"\n🧹 Step 3: Cleaning Missing Values...")
+    with measure_stage(metrics, 'clean', rows_in=len(df)) as record:
+        df_clean = clean_missing_values(df, max_null_percentage=max_null_percentage, null_stats=null_stats or None)
+        record['rows_out'] = len(df_clean)
+    print(f"✅ After cleaning: {len(df_clean):,} rows, {len(df_clean.columns)} columns")
+    
+    # Step 4: Filter date range (if issue_d exists)
+    print(f"\n📅 Step 4: Filtering Date Range...")
+    if 'issue_d' in df_clean.columns:
+        with measure_stage(metrics, 'filter', rows_in=len(df_clean)) as record:
+            df_filtered = filter_issue_date_range(df_clean)
+            record['rows_out'] = len(df_filtered)
+        print(f"✅ After date filtering: {len(df_filtered):,} rows")
+    else:
+        df_filtered = df_clean
+        print("⚠️  No 'issue_d' column found, skipping date filtering")
+    
+    # Step 5: Remove rows with any null values (for clean fact table)
+    print(f"\n🔧 Step 5: Final Data Cleanup...")
+    with measure_stage(metrics, 'dropna', rows_in=len(df_filtered)) as record:
         df_final = df_filtered.dropna()
-        print(f"✅ Final dataset: {len(df_final):,} rows, {len(df_final.columns)} columns")
+        record['rows_out'] = len(df_final)
+    print(f"✅ Final dataset: {len(df_final):,} rows, {len(df_final.columns)} columns")
+    
+    # Step 6: Create star schema
+    fact_table, dim_tables = _build_star_schema(df_final, key_registry, compact, metrics)
+    
+    return fact_table, dim_tables, null_stats.get('rows', len(df)), len(df_final)
+
+
+def run_streaming_pipeline(data_file, chunksize, max_null_percentage=30, columns=None, typed_load=False,
+                           cache_dir=None, key_registry=None, compact=False, stats_catalog=False, metrics=None):
+    """
+    รัน Step 1-6 แบบ streaming ทีละ chunk (ดู stream_fact_chunks)
+    key_registry / compact / metrics เหมือนกับ run_batch_pipeline() (compact แปลงทีละ chunk ก่อนต่อกัน
+    metrics วัด pass 1 เป็น 'null_profile' และ pass 2 ทั้งหมดเป็น 'stream')
+    stats_catalog: ข้ามรอบนับ null (pass 1) เมื่อ catalog มีสถิติของทุกคอลัมน์ที่อ่าน ไม่เช่นนั้น
+    บันทึกผลของ pass 1 ลง catalog (default: False)
+    
+    Returns:
+        tuple: (fact_table, dim_tables, original_rows, final_rows) หรือ None ถ้าล้มเหลว
+    """
+    print(f"\n🌊 Streaming {data_file} in chunks of {chunksize:,} rows...")
+    
+    column_types, dtype_spec = None, None
+    if typed_load:
+        with measure_stage(metrics, 'type_analysis', rows_in=TYPE_SAMPLE_SIZE):
+            column_types, dtype_spec = infer_dtype_spec(data_file, columns)
+        if dtype_spec is None:
+            print(f"❌ Column type analysis failed: {column_types}")
+            return None
+        print(f"   Typed load: {len(column_types)} columns, category columns: {list(dtype_spec['dtype'])}")
+    null_stats = catalog_null_stats(read_stats_catalog(data_file), columns) if stats_catalog else None
+    if null_stats is not None:
+        print(f"\n📇 Step 1-3: Null profile from stats catalog (pass 1 skipped)...")
+    else:
+        print(f"\n🧹 Step 1-3: Profiling Missing Values (pass 1)...")
+        with measure_stage(metrics, 'null_profile') as record:
+            null_stats = profile_null_stats(data_file, chunksize, columns=columns, cache_dir=cache_dir)
+            record['rows_in'] = null_stats['rows'] if null_stats else 0
+        if stats_catalog:
+            _record_stats_catalog(data_file, null_stats, column_types)
+    
+    # ล็อก key registry ตลอด pass 2 (id ของ chunk แรกต้องไม่ชนกับการรันอื่นที่บันทึกก่อนรอบนี้จบ)
+    with key_registry_lock(key_registry):
+        dimension_keys = load_dimension_keys(key_registry)
+        fact_chunks = []
+        original_rows = 0
+        before_bytes = 0
+        with measure_stage(metrics, 'stream') as record:
+            for fact_chunk, rows_read in stream_fact_chunks(data_file, chunksize, dimension_keys,
+                                                            max_null_percentage=max_null_percentage,
+                                                            columns=columns, dtype_spec=dtype_spec,
+                                                            cache_dir=cache_dir, null_stats=null_stats):
+                if not fact_chunks:
+                    print(f"\n📅 Step 4-6: Filtering, Cleanup and Star Schema per chunk (pass 2)...")
+                if compact:
+                    before_bytes += frame_memory_bytes(fact_chunk)
+                    fact_chunk = compact_fact_table(fact_chunk)
+                fact_chunks.append(fact_chunk)
+                original_rows += rows_read
+            
+            if compact:
+                fact_table = concat_compact_frames(fact_chunks)
+            else:
+                fact_table = pd.concat(fact_chunks, ignore_index=True) if fact_chunks else pd.DataFrame()
+            record.update(rows_in=original_rows, rows_out=len(fact_table))
+        dim_tables = {f"{spec['name']}_dim": _dimension_table(spec, dimension_keys[spec['name']])
+                      for spec in DIMENSIONS if spec['name'] in dimension_keys}
+        
+        print(f"✅ Processed {len(fact_chunks)} chunks: {original_rows:,} rows in, {len(fact_table):,} fact rows out")
+        for table_name, dim_df in dim_tables.items():
+            print(f"   ✅ {table_name}: {len(dim_df)} records")
+        if key_registry is not None:
+            save_dimension_keys(key_registry, dimension_keys)
+    if compact:
+        _print_compaction(before_bytes, frame_memory_bytes(fact_table), len(fact_table))
+    
+    return fact_table, dim_tables, original_rows, len(fact_table)
+
+
+def input_files(path):
+    """
+    แปลง input ของ pipeline เป็นรายชื่อไฟล์ CSV
+    
+    Args:
+        path: path ของไฟล์, directory (ใช้ทุกไฟล์ *.csv ในนั้น) หรือ glob เช่น 'data/LoanStats_2016Q*.csv'
+    
+    Returns:
+        list: path ของไฟล์เรียงตามชื่อ
+    
+    Raises:
+        FileNotFoundError: directory / glob ไม่ตรงกับไฟล์ใดเลย
+    """
+    if os.path.isdir(path):
+        files = sorted(glob.glob(os.path.join(path, '*.csv')))
+    elif glob.has_magic(path):
+        files = sorted(glob.glob(path))
+    else:
+        return [path]
+    
+    if not files:
+        raise FileNotFoundError(f"No CSV files match {path}")
+    return files
+
+
+def _merge_null_stats(null_stats, other):
+    """
+    รวม null stats ของสองไฟล์ให้เหมือนนับจากไฟล์ที่ต่อกัน
+    (คอลัมน์ที่ไฟล์หนึ่งไม่มีนับเป็น null ทุกแถวของไฟล์นั้น)
+    """
+    if not null_stats:
+        return other
+    if not other:
+        return null_stats
+    columns = null_stats['null_counts'].index.append(
+        other['null_counts'].index.difference(null_stats['null_counts'].index, sort=False))
+    left = null_stats['null_counts'].reindex(columns, fill_value=null_stats['rows'])
+    right = other['null_counts'].reindex(columns, fill_value=other['rows'])
+    return {'rows': null_stats['rows'] + other['rows'], 'null_counts': (left + right).astype('int64')}
+
+
+def _merged_stats_catalog(data_files):
+    """
+    null stats ของทุกไฟล์รวมกันจาก stats catalog ของแต่ละไฟล์ (เฉพาะคอลัมน์ที่ทุก catalog รู้ค่า)
+    
+    Returns:
+        dict ในรูปแบบเดียวกับ count_missing_values() หรือ None ถ้าบางไฟล์ยังไม่มี catalog
+    """
+    catalogs = [read_stats_catalog(data_file) for data_file in data_files]
+    if any(catalog is None for catalog in catalogs):
+        return None
+    
+    merged = None
+    for catalog in catalogs:
+        merged = _merge_null_stats(merged, catalog)
+    known = [column for column in merged['null_counts'].index
+             if all(column in catalog['null_counts'].index or column not in catalog['columns']
+                    for catalog in catalogs)]
+    return {'rows': merged['rows'], 'null_counts': merged['null_counts'][known]}
+
+
+def extract_file(data_file, columns=None, typed_load=False, cache_dir=None, skipped=(), stats_catalog=False):
+    """
+    Step 1, 2 และ 4 ของไฟล์เดียว: โหลด (นับ null จากทุกแถว), เดาประเภท และกรองช่วงวันที่
+    (งานของแต่ละ process ใน run_multi_file_pipeline() - ไม่แสดงผลระหว่างทำ)
+    
+    Args:
+        data_file: path ของไฟล์ CSV
+        columns: อ่านเฉพาะคอลัมน์เหล่านี้ (default: None = ทุกคอลัมน์)
+        typed_load: เดาประเภทจากตัวอย่างของไฟล์นี้แล้วโหลดด้วย dtype ที่กำหนด (default: False)
+        cache_dir: directory ของ columnar cache (default: None = ไม่ใช้ cache)
+        skipped: คอลัมน์ที่ไม่ต้องอ่าน (null เกินเกณฑ์ตาม stats catalog ของทุกไฟล์) (default: ())
+        stats_catalog: บันทึกสถิติของไฟล์นี้ลง stats catalog ของไฟล์ (default: False)
+    
+    Returns:
+        dict: {'data_file', 'frame': แถวที่อยู่ใน ISSUE_YEAR_RANGE, 'null_stats': ของทุกแถวในไฟล์,
+               'column_types': ประเภทที่เดาได้}
+    
+    Raises:
+        ValueError: เดาประเภทข้อมูลของไฟล์ไม่สำเร็จ
+    """
+    null_stats = {}
+    row_filter = _issue_year_filter(null_stats)
+    usecols = _projection(columns, skipped)
+    
+    if typed_load:
+        column_types, dtype_spec = infer_dtype_spec(data_file, columns)
+        if dtype_spec is None:
+            raise ValueError(f"Column type analysis failed for {data_file}: {column_types}")
+        df = load_data(data_file, usecols=usecols, dtype_spec=dtype_spec, row_filter=row_filter,
+                       cache_dir=cache_dir)
+    else:
+        df = load_data(data_file, usecols=usecols, row_filter=row_filter, cache_dir=cache_dir)
+        success, column_types = guess_column_types(df)
+        if not success:
+            raise ValueError(f"Column type analysis failed for {data_file}: {column_types}")
+    
+    if stats_catalog and null_stats:
+        update_stats_catalog(data_file, null_stats, column_types)
+    if 'issue_d' in df.columns:
+        df = filter_issue_date_range(df, verbose=False)
+    
+    return {'data_file': data_file, 'frame': df, 'null_stats': null_stats, 'column_types': column_types}
+
+
+def run_multi_file_pipeline(data_files, max_null_percentage=30, columns=None, typed_load=False, cache_dir=None,
+                            key_registry=None, compact=False, stats_catalog=False, workers=None, metrics=None):
+    """
+    รัน Step 1-6 กับหลายไฟล์ (เช่นไฟล์รายไตรมาส / รายเดือน) โดยโหลด เดาประเภท และกรองวันที่
+    ของแต่ละไฟล์พร้อมกันบน process pool (extract_file())
+    
+    เกณฑ์ null ของ Step 3 ใช้ null stats ของทุกไฟล์รวมกัน และ Star Schema สร้างครั้งเดียวจากแถว
+    ของทุกไฟล์ตามลำดับไฟล์ ผลลัพธ์จึงเหมือนกับรัน run_batch_pipeline() กับไฟล์ที่ต่อกันเป็นไฟล์เดียว
+    (surrogate id ของ dimension ตรงกันทุกไฟล์)
+    
+    Args:
+        data_files: list ของ path ไฟล์ CSV (ดู input_files())
+        workers: จำนวน process (default: None = จำนวน CPU แต่ไม่เกินจำนวนไฟล์, 1 = รันใน process นี้)
+        ที่เหลือเหมือนกับ run_batch_pipeline() (stats_catalog ตัดคอลัมน์เมื่อทุกไฟล์มี catalog แล้ว,
+        metrics วัดงานของ process pool ทั้งหมดเป็น 'extract')
+    
+    Returns:
+        tuple: (fact_table, dim_tables, original_rows, final_rows) หรือ None ถ้าล้มเหลว
+    """
+    workers = workers or min(len(data_files), os.cpu_count() or 1)
+    skipped = []
+    if stats_catalog:
+        skipped = _catalog_skipped_columns(_merged_stats_catalog(data_files), max_null_percentage)
+    
+    # Step 1-2 + 4: Load, analyze and date-filter every file in parallel
+    print(f"\n📂 Step 1-2: Loading and analyzing {len(data_files)} files on {workers} processes...")
+    task = partial(extract_file, columns=columns, typed_load=typed_load, cache_dir=cache_dir,
+                   skipped=skipped, stats_catalog=stats_catalog)
+    try:
+        with measure_stage(metrics, 'extract') as record:
+            if workers == 1:
+                extracts = [task(data_file) for data_file in data_files]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    extracts = list(executor.map(task, data_files))
+            record.update(rows_in=sum(extract['null_stats'].get('rows', 0) for extract in extracts),
+                          rows_out=sum(len(extract['frame']) for extract in extracts))
+    except ValueError as e:
+        print(f"❌ {e}")
+        return None
+    
+    null_stats = None
+    column_types = {}
+    conflicts = set()
+    for extract in extracts:
+        null_stats = _merge_null_stats(null_stats, extract['null_stats'])
+        for column, dtype in extract['column_types'].items():
+            if column_types.setdefault(column, dtype) != dtype:
+                conflicts.add(column)
+        print(f"   ✅ {os.path.basename(extract['data_file'])}: {len(extract['frame']):,} of "
+              f"{extract['null_stats'].get('rows', 0):,} rows in {ISSUE_YEAR_RANGE[0]}-{ISSUE_YEAR_RANGE[1]}")
+    _print_column_types(column_types)
+    if conflicts:
+        print(f"   ⚠️  Types differ between files: {sorted(conflicts)}")
+    
+    # Merge the per-file frames (category columns get the union of every file's categories)
+    frames = [extract['frame'] for extract in extracts]
+    all_columns = pd.Index(frames[0].columns)
+    for frame in frames[1:]:
+        all_columns = all_columns.append(frame.columns.difference(all_columns, sort=False))
+    df = concat_compact_frames([frame if frame.columns.equals(all_columns) else frame.reindex(columns=all_columns)
+                                for frame in frames])
+    original_rows = null_stats['rows'] if null_stats else 0
+    print(f"✅ Loaded: {len(df):,} of {original_rows:,} rows, {len(df.columns)} columns")
+    
+    # Step 3: Clean missing values with the null ratio of all files
+    print(f"\n🧹 Step 3: Cleaning Missing Values...")
+    with measure_stage(metrics, 'clean', rows_in=len(df)) as record:
+        df_clean = clean_missing_values(df, max_null_percentage=max_null_percentage, null_stats=null_stats)
+        record['rows_out'] = len(df_clean)
+    print(f"✅ After cleaning: {len(df_clean):,} rows, {len(df_clean.columns)} columns")
+    
+    # Step 5: Remove rows with any null values
+    print(f"\n🔧 Step 5: Final Data Cleanup...")
+    with measure_stage(metrics, 'dropna', rows_in=len(df_clean)) as record:
+        df_final = df_clean.dropna()
+        record['rows_out'] = len(df_final)
+    print(f"✅ Final dataset: {len(df_final):,} rows, {len(df_final.columns)} columns")
+    
+    # Step 6: Create one star schema from all files
+    fact_table, dim_tables = _build_star_schema(df_final, key_registry, compact, metrics)
+    
+    return fact_table, dim_tables, original_rows, len(df_final)
+
+
+def _dag_load(data_file, columns, typed_load, cache_dir=None):
+    """node 'load' ของ DAG: ทุกแถวของไฟล์ (ไม่กรองปีระหว่างอ่าน - ช่วงปีเป็น parameter ของ node 'filter')"""
+    dtype_spec = None
+    if typed_load:
+        column_types, dtype_spec = infer_dtype_spec(data_file, columns)
+        if dtype_spec is None:
+            raise ValueError(f"Column type analysis failed: {column_types}")
+    df = load_data(data_file, usecols=_projection(columns), dtype_spec=dtype_spec, cache_dir=cache_dir)
+    return {'frame': df, 'null_stats': count_missing_values(df)}
+
+
+def _dag_column_types(loaded, workers=None):
+    """node 'column_types' ของ DAG: เดาประเภทของทุกคอลัมน์ที่โหลด"""
+    success, column_types = guess_column_types(loaded['frame'], workers=workers)
+    if not success:
+        raise ValueError(f"Column type analysis failed: {column_types}")
+    return column_types
+
+
+def _dag_filter(df_clean, issue_years):
+    """node 'filter' ของ DAG: เก็บแถวที่ issue_d อยู่ในช่วงปี (ไม่กรองถ้าไม่มีคอลัมน์ issue_d)"""
+    if 'issue_d' not in df_clean.columns:
+        return df_clean
+    return filter_issue_date_range(df_clean, min_year=issue_years[0], max_year=issue_years[1], verbose=False)
+
+
+def pipeline_dag(cache_dir=None, workers=None):
+    """
+    Step 1-5 ของ batch pipeline เป็น DAG (ดู evaluate_dag()) - แต่ละ node ขึ้นกับ parameter ของตัวเองเท่านั้น:
+    
+        load(data_file, columns, typed_load) -> rows, column_types
+                                             -> clean(max_null_percentage) -> filter(issue_years) -> final
+    
+    node 'load' ถูกอ่านจาก cache เฉพาะเมื่อ node ปลายทางบางตัวต้องคำนวณใหม่ (rows / column_types เก็บแยก)
+    
+    Args:
+        cache_dir: directory ของ columnar cache ที่ node 'load' ใช้อ่าน CSV (default: None)
+        workers: จำนวน process ของ guess_column_types() ใน node 'column_types' (default: None)
+    
+    Returns:
+        dict: {ชื่อ node: dag_node()}
+    """
+    return {
+        'load': dag_node(partial(_dag_load, cache_dir=cache_dir), params=['data_file', 'columns', 'typed_load'],
+                         files=['data_file']),
+        'rows': dag_node(lambda loaded: loaded['null_stats']['rows'], deps=['load']),
+        'column_types': dag_node(partial(_dag_column_types, workers=workers), deps=['load']),
+        'clean': dag_node(lambda loaded, max_null_percentage: clean_missing_values(
+            loaded['frame'], max_null_percentage=max_null_percentage, null_stats=loaded['null_stats']),
+            deps=['load'], params=['max_null_percentage']),
+        'filter': dag_node(_dag_filter, deps=['clean'], params=['issue_years']),
+        'final': dag_node(lambda df_filtered: df_filtered.dropna(), deps=['filter'])
+    }
+
+
+def run_dag_pipeline(data_file, max_null_percentage=30, issue_years=ISSUE_YEAR_RANGE, columns=None, typed_load=False,
+                     cache_dir=None, dag_cache=None, memo=None, key_registry=None, compact=False, workers=None,
+                     metrics=None):
+    """
+    รัน Step 1-6 ผ่าน pipeline_dag(): ผลลัพธ์ของแต่ละ node ถูกเก็บตาม hash ของ input + parameter
+    จึงรันใหม่เฉพาะ node ที่ parameter เปลี่ยนและ node ปลายทาง เช่นเปลี่ยน max_null_percentage
+    ไม่ต้อง parse CSV / เดาประเภทใหม่ และเปลี่ยน issue_years รันใหม่เฉพาะ filter / final
+    
+    Star Schema (Step 6) สร้างใหม่ทุกครั้งจาก node 'final' เพราะอัปเดต key registry (side effect)
+    
+    Args:
+        data_file: path ของไฟล์ CSV
+        max_null_percentage: เปอร์เซ็นต์สูงสุดของ null ที่ยอมรับได้ (default: 30)
+        issue_years: (ปีแรก, ปีสุดท้าย) ของ issue_d ที่เก็บไว้ (default: ISSUE_YEAR_RANGE)
+        dag_cache: directory ที่เก็บผลลัพธ์ของแต่ละ node ข้ามการรัน (default: None = ไม่เก็บลง disk)
+        memo: dict ที่เก็บผลลัพธ์ของแต่ละ node ในหน่วยความจำข้ามการเรียก (default: None)
+        ที่เหลือเหมือนกับ run_batch_pipeline() (metrics วัดเฉพาะ node ที่ถูกรันจริง)
+    
+    Returns:
+        tuple: (fact_table, dim_tables, original_rows, final_rows) หรือ None ถ้าล้มเหลว
+    """
+    params = {
+        'data_file': data_file,
+        'columns': columns,
+        'typed_load': typed_load,
+        'max_null_percentage': max_null_percentage,
+        'issue_years': list(issue_years)
+    }
+    print(f"\n🧩 Step 1-5: Evaluating pipeline DAG for {data_file} "
+          f"(≤{max_null_percentage}% null, {issue_years[0]}-{issue_years[1]})...")
+    try:
+        results, sources = evaluate_dag(pipeline_dag(cache_dir, workers), ['rows', 'column_types', 'final'], params,
+                                        cache_dir=dag_cache, memo=memo, metrics=metrics)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return None
+    
+    for name, source in sources.items():
+        print(f"   {'⚙️ ' if source == 'computed' else '♻️ '} {name}: {source}")
+    _print_column_types(results['column_types'])
+    df_final = results['final']
+    original_rows = results['rows']
+    print(f"✅ Final dataset: {len(df_final):,} of {original_rows:,} rows, {len(df_final.columns)} columns")
+    
+    fact_table, dim_tables = _build_star_schema(df_final, key_registry, compact, metrics)
+    
+    return fact_table, dim_tables, original_rows, len(df_final)
+
+
+def _save_stage_metrics(metrics, args):
+    """บันทึก metrics ของการรันนี้ลง --metrics-file และแสดงสรุปเวลาของแต่ละขั้นตอน"""
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    run_info = {
+        'input': args.deploy_from or args.input,
+        'options': {option: value for option, value in sorted(vars(args).items())
+                    if option not in ('input', 'metrics_file')}
+    }
+    try:
+        path = write_stage_metrics(metrics, args.metrics_file, run_info=run_info)
+    except OSError as e:
+        print(f"⚠️  Stage metrics not saved: {e}")
+        return
+    
+    print(f"\n⏱️  Stage metrics ({path}):")
+    for record in metrics:
+        rate = f", {record['rows_per_second']:,.0f} rows/s" if record['rows_per_second'] else ''
+        print(f"   - {record['stage']}: {record['wall_seconds']:.3f}s wall, {record['cpu_seconds']:.3f}s CPU{rate}"
+              f"{'' if record['status'] == 'ok' else ' (' + record['status'] + ')'}")
+
+
+def parse_args(argv=None):
+    """อ่าน command-line options ของ ETL Pipeline"""
+    parser = argparse.ArgumentParser(description='ETL Pipeline - Loan Data Star Schema')
+    parser.add_argument('--deploy', action='store_true',
+                        help='deploy fact/dimension tables ไปยัง database')
+    parser.add_argument('--input', default=DATA_FILE, metavar='PATH',
+                        help='ไฟล์ CSV, directory (ทุกไฟล์ *.csv) หรือ glob ของไฟล์ข้อมูล (default: %(default)s)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='จำนวน process ที่ประมวลผลไฟล์พร้อมกันเมื่อ input มีหลายไฟล์ (default: จำนวน CPU) '
+                             'หรือที่เดาประเภทของคอลัมน์พร้อมกันเมื่อมีไฟล์เดียว (default: ทีละคอลัมน์)')
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help='ประมวลผลแบบ streaming ทีละ N แถว (หน่วยความจำขึ้นกับ chunk ไม่ใช่ขนาดไฟล์)')
+    parser.add_argument('--all-columns', action='store_true',
+                        help='อ่านทุกคอลัมน์ของไฟล์ (ปิด column projection ตาม Star Schema)')
+    parser.add_argument('--typed-load', action='store_true',
+                        help='เดาประเภทจากแถวตัวอย่างแล้วโหลดด้วย dtype ที่กำหนด (category, integer แคบ, parse วันที่)')
+    parser.add_argument('--cache-dir', default=None,
+                        help='เก็บผลการ parse ไฟล์ CSV แบบ columnar ไว้ใน directory นี้ และใช้ซ้ำในรอบถัดไป')
+    parser.add_argument('--refresh-cache', action='store_true',
+                        help='ลบ cache ของไฟล์ข้อมูลก่อนรัน (ใช้กับ --cache-dir)')
+    parser.add_argument('--bundle-dir', default=None,
+                        help='บันทึก fact/dimension tables เป็น artifact bundle (manifest + checksum) ใน directory นี้')
+    parser.add_argument('--deploy-from', default=None, metavar='BUNDLE',
+                        help='deploy ตารางจาก artifact bundle ไปยัง database โดยไม่รัน ETL ซ้ำ')
+    parser.add_argument('--load-method', default='auto', choices=LOAD_METHODS,
+                        help='วิธีโหลดตารางเข้า database (auto = bcp ถ้ามี mssql-tools ไม่เช่นนั้น multi-row insert)')
+    parser.add_argument('--database-url', default=None,
+                        help='SQLAlchemy URL ของ database ปลายทาง (default: env DATABASE_URL หรือ MSSQL server ปกติ)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='deploy เฉพาะ partition ของ issue_d ที่ใหม่หรือเปลี่ยนไปตาม control table แทนการแทนที่ทั้งตาราง')
+    parser.add_argument('--key-registry', default=None, metavar='DIR',
+                        help='เก็บ natural key -> surrogate id ของทุก dimension ใน directory นี้ (id คงเดิมข้ามการรัน)')
+    parser.add_argument('--compact', action='store_true',
+                        help='เก็บ fact table ด้วยประเภทแคบที่สุดที่ปลอดภัย (id แบบ int8/int16, เงินแบบ float32, ข้อความแบบ category)')
+    parser.add_argument('--stats-catalog', action='store_true',
+                        help='เก็บสถิติ null / ประเภทของแต่ละคอลัมน์ไว้ข้างไฟล์ข้อมูล (<ไฟล์>.stats.json) '
+                             'และไม่อ่านคอลัมน์ที่ null เกินเกณฑ์ในรอบถัดไป')
+    parser.add_argument('--max-null-percentage', type=float, default=30,
+                        help='เปอร์เซ็นต์สูงสุดของ null ที่คอลัมน์มีได้ก่อนถูกตัดออก (default: %(default)s)')
+    parser.add_argument('--dag-cache', default=None, metavar='DIR',
+                        help='รันแบบ DAG และเก็บผลลัพธ์ของแต่ละขั้นตอนใน directory นี้ตาม hash ของ input + parameter '
+                             '(รอบถัดไปรันใหม่เฉพาะขั้นตอนที่ parameter เปลี่ยน)')
+    parser.add_argument('--issue-years', type=int, nargs=2, default=list(ISSUE_YEAR_RANGE), metavar=('FIRST', 'LAST'),
+                        help='ช่วงปีของ issue_d ที่เก็บไว้ (ใช้กับ --dag-cache) (default: %(default)s)')
+    parser.add_argument('--metrics-file', default=None, metavar='PATH',
+                        help='บันทึกเวลา / CPU / หน่วยความจำ / จำนวนแถวของแต่ละขั้นตอนเป็น JSON (หรือ CSV ถ้าลงท้าย .csv)')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='วัด peak ของหน่วยความจำที่ Python จองในแต่ละขั้นตอนด้วย tracemalloc (ช้าลงมาก, ใช้กับ --metrics-file)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    ETL Pipeline หลัก
+    """
+    print("🚀 Starting ETL Pipeline with Custom Functions")
+    print("="*80)
+    
+    args = parse_args(argv)
+    
+    # Check if running in deployment mode
+    deploy_mode = args.deploy or args.deploy_from is not None
+    
+    # Column projection: อ่านเฉพาะคอลัมน์ที่ Star Schema ใช้
+    columns = None if args.all_columns else required_columns()
+    
+    # Stage metrics: วัดเฉพาะเมื่อกำหนด --metrics-file
+    metrics = [] if args.metrics_file else None
+    if metrics is not None and args.trace_memory:
+        tracemalloc.start()
+    
+    try:
+        # Configuration: one file, or many partitioned files (directory / glob)
+        data_files = [] if args.deploy_from else input_files(args.input)
+        data_file = data_files[0] if len(data_files) == 1 else data_files
         
-        # Step 6: Create star schema
-        fact_table, dim_tables = create_star_schema(df_final)
+        if args.cache_dir and args.refresh_cache:
+            for path in data_files:
+                removed = invalidate_csv_cache(args.cache_dir, path)
+                print(f"🗑️  Cleared {removed} cache entries for {path}")
+        
+        # Step 1-6: Extract + Transform (หรือโหลดผลลัพธ์จาก artifact bundle)
+        if args.deploy_from:
+            with measure_stage(metrics, 'bundle_load') as record:
+                result = load_etl_bundle(args.deploy_from)
+                record['rows_out'] = len(result[0]) if result else 0
+        elif args.dag_cache:
+            if len(data_files) > 1 or args.chunksize:
+                print(f"❌ --dag-cache supports a single input file without --chunksize")
+                return False
+            result = run_dag_pipeline(data_file, max_null_percentage=args.max_null_percentage,
+                                      issue_years=tuple(args.issue_years), columns=columns, typed_load=args.typed_load,
+                                      cache_dir=args.cache_dir, dag_cache=args.dag_cache,
+                                      key_registry=args.key_registry, compact=args.compact, workers=args.workers,
+                                      metrics=metrics)
+        elif tuple(args.issue_years) != ISSUE_YEAR_RANGE:
+            print(f"❌ --issue-years requires --dag-cache (other modes keep {ISSUE_YEAR_RANGE[0]}-{ISSUE_YEAR_RANGE[1]})")
+            return False
+        elif len(data_files) > 1:
+            if args.chunksize:
+                print(f"❌ --chunksize supports a single input file, {args.input} matches {len(data_files)} files")
+                return False
+            print(f"📚 Input: {len(data_files)} files from {args.input}")
+            result = run_multi_file_pipeline(data_files, max_null_percentage=args.max_null_percentage,
+                                             columns=columns, typed_load=args.typed_load,
+                                             cache_dir=args.cache_dir, key_registry=args.key_registry,
+                                             compact=args.compact, stats_catalog=args.stats_catalog,
+                                             workers=args.workers, metrics=metrics)
+        elif args.chunksize:
+            result = run_streaming_pipeline(data_file, args.chunksize, max_null_percentage=args.max_null_percentage,
+                                            columns=columns, typed_load=args.typed_load, cache_dir=args.cache_dir,
+                                            key_registry=args.key_registry, compact=args.compact,
+                                            stats_catalog=args.stats_catalog, metrics=metrics)
+        else:
+            result = run_batch_pipeline(data_file, max_null_percentage=args.max_null_percentage, columns=columns,
+                                        typed_load=args.typed_load, cache_dir=args.cache_dir,
+                                        key_registry=args.key_registry, compact=args.compact,
+                                        stats_catalog=args.stats_catalog, workers=args.workers, metrics=metrics)
+        
+        if result is None:
+            return False
+        fact_table, dim_tables, original_rows, final_rows = result
         
         # Step 7: Show results
         show_etl_results(fact_table, dim_tables)
         
+        if args.bundle_dir and not args.deploy_from:
+            with measure_stage(metrics, 'bundle_save', rows_in=len(fact_table)):
+                save_etl_bundle(args.bundle_dir, fact_table, dim_tables, data_file, original_rows)
+        
         # Step 8: Deploy to database (if in deploy mode)
         if deploy_mode:
-            success = deploy_to_database(fact_table, dim_tables)
+            with measure_stage(metrics, 'deploy', rows_in=len(fact_table)):
+                success = deploy_to_database(fact_table, dim_tables, load_method=args.load_method,
+                                             database_url=args.database_url, incremental=args.incremental)
             if not success:
                 return False
         else:
             print(f"\n💡 Tip: Run with '--deploy' flag to deploy to database")
         
         print(f"\n🎉 ETL Pipeline completed successfully!")
-        print(f"   - Original data: {len(df):,} rows")
-        print(f"   - Final data: {len(df_final):,} rows")
+        print(f"   - Original data: {original_rows:,} rows")
+        print(f"   - Final data: {final_rows:,} rows")
         print(f"   - Dimension tables: {len(dim_tables)}")
         print(f"   - Fact table records: {len(fact_table):,}")
         
         return True
-        
+    
     except Exception as e:
         print(f"\n❌ ETL Pipeline failed: {str(e)}")
         import traceback
         traceback.print_exc()
         return False
+    
+    finally:
+        if metrics is not None:
+            _save_stage_metrics(metrics, args)
 
 
 if __name__ == "__main__":
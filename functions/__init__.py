@@ -5,15 +5,79 @@ ETL Functions Package
 ชุดฟังก์ชันสำหรับ ETL Pipeline
 """
 
-from .guess_column_types import guess_column_types
-from .filter_issue_date_range import filter_issue_date_range
+from .guess_column_types import guess_column_types, clear_column_types_memo
+from .filter_issue_date_range import filter_issue_date_range, issue_date_in_range
 from .clean_missing_values import clean_missing_values
+from .load_data import load_data
+from .sample_csv_rows import sample_csv_rows
+from .build_dtype_spec import build_dtype_spec, apply_dtype_spec
+from .parse_date_column import parse_date_column, clear_date_cache
+from .file_fingerprint import file_fingerprint
+from .csv_cache import read_csv_cached, invalidate_csv_cache, evict_csv_cache
+from .columnar_store import save_frame, load_frame
+from .artifact_bundle import write_artifact_bundle, read_artifact_bundle
+from .bulk_load_table import bulk_load_table, sql_column_types
+from .database_engine import get_engine, dispose_engines
+from .load_control import partition_checksums, read_load_control, load_watermark, record_load_control
+from .build_dimension import assign_surrogate_keys, build_dimension_table, dimension_key_index
+from .key_registry import load_key_registry, save_key_registry, key_registry_lock
+from .calendar_dimension import build_calendar_dimension, calendar_month_ids, calendar_year_range
+from .compact_fact_table import compact_fact_table, concat_compact_frames, frame_memory_bytes, restore_fact_table
+from .stats_catalog import read_stats_catalog, update_stats_catalog, catalog_null_stats
+from .stage_metrics import measure_stage, write_stage_metrics
+from .pipeline_dag import dag_node, dag_node_keys, evaluate_dag, evict_dag_cache
 
 __version__ = "1.0.0"
 __author__ = "DataOps Foundation Team"
 
 __all__ = [
     'guess_column_types',
+    'clear_column_types_memo',
     'filter_issue_date_range', 
-    'clean_missing_values'
+    'issue_date_in_range',
+    'clean_missing_values',
+    'load_data',
+    'sample_csv_rows',
+    'build_dtype_spec',
+    'apply_dtype_spec',
+    'parse_date_column',
+    'clear_date_cache',
+    'file_fingerprint',
+    'read_csv_cached',
+    'invalidate_csv_cache',
+    'evict_csv_cache',
+    'save_frame',
+    'load_frame',
+    'write_artifact_bundle',
+    'read_artifact_bundle',
+    'bulk_load_table',
+    'sql_column_types',
+    'partition_checksums',
+    'read_load_control',
+    'load_watermark',
+    'record_load_control',
+    'get_engine',
+    'dispose_engines',
+    'assign_surrogate_keys',
+    'build_dimension_table',
+    'dimension_key_index',
+    'load_key_registry',
+    'save_key_registry',
+    'key_registry_lock',
+    'build_calendar_dimension',
+    'calendar_month_ids',
+    'calendar_year_range',
+    'compact_fact_table',
+    'concat_compact_frames',
+    'frame_memory_bytes',
+    'restore_fact_table',
+    'read_stats_catalog',
+    'update_stats_catalog',
+    'catalog_null_stats',
+    'measure_stage',
+    'write_stage_metrics',
+    'dag_node',
+    'dag_node_keys',
+    'evaluate_dag',
+    'evict_dag_cache'
 ]
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Artifact Bundle Functions
+ฟังก์ชันสำหรับบันทึก / โหลดผลลัพธ์ ETL (fact + dimension tables) เป็น bundle ที่มี manifest และ checksum
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+import warnings
+from .columnar_store import save_frame, load_frame, LAYOUT_FILE
+from .file_fingerprint import file_fingerprint
+warnings.filterwarnings('ignore')
+
+# เปลี่ยนเมื่อรูปแบบของ bundle เปลี่ยน (bundle รุ่นอื่นจะถูกปฏิเสธตอนโหลด)
+BUNDLE_FORMAT_VERSION = 1
+
+MANIFEST_FILE = 'manifest.json'
+TABLES_DIR = 'tables'
+
+
+def _table_checksums(table_dir, layout):
+    """sha256 ของทุกไฟล์ของตาราง {ชื่อไฟล์: sha256}"""
+    files = [LAYOUT_FILE] + [name for column in layout['columns'] for name in column['files']]
+    return {name: file_fingerprint(os.path.join(table_dir, name))['sha256'] for name in files}
+
+
+def _source_fingerprint(source_file):
+    """fingerprint ของไฟล์ต้นทาง (list ของ fingerprint เมื่อมีหลายไฟล์)"""
+    if source_file is None:
+        return None
+    if isinstance(source_file, (list, tuple)):
+        return [file_fingerprint(path) for path in source_file]
+    return file_fingerprint(source_file)
+
+
+def write_artifact_bundle(bundle_dir, tables, source_file=None, metadata=None):
+    """
+    บันทึกตารางผลลัพธ์เป็น bundle (แทนที่ bundle เดิมที่ path เดียวกันแบบ atomic)
+    
+    โครงสร้าง: bundle_dir/manifest.json + bundle_dir/tables/<ชื่อตาราง>/ (คอลัมน์ละไฟล์ .npy)
+    manifest เก็บจำนวนแถว, คอลัมน์, sha256 ของทุกไฟล์, fingerprint ของไฟล์ต้นทาง
+    และ bundle_version (hash ของ checksum ทั้งหมด - เนื้อหาเดียวกันได้ version เดียวกัน)
+    
+    Args:
+        bundle_dir: directory ของ bundle
+        tables: dict {ชื่อตาราง: DataFrame}
+        source_file: ไฟล์ข้อมูลต้นทางที่ใช้สร้างตาราง หรือ list ของไฟล์เมื่อมีหลายไฟล์ (default: None)
+        metadata: ข้อมูลเพิ่มเติมที่ต้องการเก็บใน manifest เช่นจำนวนแถวต้นทาง (default: None)
+    
+    Returns:
+        dict: manifest ที่บันทึก
+    """
+    bundle_dir = os.path.abspath(bundle_dir)
+    temp_dir = f'{bundle_dir}.{os.getpid()}.tmp'
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    table_entries = {}
+    for table_name, df in tables.items():
+        table_dir = os.path.join(temp_dir, TABLES_DIR, table_name)
+        layout = save_frame(df, table_dir)
+        table_entries[table_name] = {
+            'rows': layout['rows'],
+            'columns': [column['name'] for column in layout['columns']],
+            'dtypes': {column['name']: column['dtype'] for column in layout['columns']},
+            'checksums': _table_checksums(table_dir, layout)
+        }
+    
+    version_source = json.dumps({name: entry['checksums'] for name, entry in table_entries.items()}, sort_keys=True)
+    manifest = {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'bundle_version': hashlib.sha256(version_source.encode('utf-8')).hexdigest()[:16],
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'source': _source_fingerprint(source_file),
+        'metadata': metadata or {},
+        'tables': table_entries
+    }
+    with open(os.path.join(temp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    
+    # แทนที่ bundle เดิม
+    old_dir = f'{bundle_dir}.{os.getpid()}.old'
+    if os.path.exists(bundle_dir):
+        os.replace(bundle_dir, old_dir)
+    os.replace(temp_dir, bundle_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    
+    return manifest
+
+
+def read_artifact_bundle(bundle_dir, verify=True):
+    """
+    โหลดตารางจาก bundle ที่บันทึกด้วย write_artifact_bundle()
+    
+    Args:
+        bundle_dir: directory ของ bundle
+        verify: ตรวจ sha256 ของทุกไฟล์กับ manifest ก่อนโหลด (default: True)
+    
+    Returns:
+        tuple: (tables: dict {ชื่อตาราง: DataFrame}, manifest: dict)
+    
+    Raises:
+        ValueError: bundle ไม่มี manifest, รูปแบบไม่รองรับ หรือ checksum ไม่ตรง
+    """
+    manifest_path = os.path.join(bundle_dir, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        raise ValueError(f"Artifact bundle not found: {manifest_path}")
+    
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    if manifest.get('format_version') != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported bundle format version: {manifest.get('format_version')} "
+                         f"(expected {BUNDLE_FORMAT_VERSION})")
+    
+    tables = {}
+    for table_name, entry in manifest['tables'].items():
+        table_dir = os.path.join(bundle_dir, TABLES_DIR, table_name)
+        if verify:
+            for name, expected in entry['checksums'].items():
+                path = os.path.join(table_dir, name)
+                if not os.path.exists(path) or file_fingerprint(path)['sha256'] != expected:
+                    raise ValueError(f"Checksum mismatch in bundle: {table_name}/{name}")
+        
+        df = load_frame(table_dir)
+        if len(df) != entry['rows'] or list(df.columns) != entry['columns']:
+            raise ValueError(f"Table {table_name} does not match the bundle manifest")
+        tables[table_name] = df
+    
+    return tables, manifest
+
+
+if __name__ == "__main__":
+    # Example usage
+    bundle_dir = 'artifacts/etl_bundle'
+    
+    try:
+        tables, manifest = read_artifact_bundle(bundle_dir)
+        print(f"Bundle {manifest['bundle_version']} created at {manifest['created_at']}:")
+        for table_name, df in tables.items():
+            print(f"   {table_name}: {len(df):,} rows")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Dimension Building Functions
+ฟังก์ชันสำหรับกำหนด surrogate key และสร้าง dimension table (รองรับ natural key หลายคอลัมน์)
+"""
+
+import numpy as np
+import pandas as pd
+import warnings
+warnings.filterwarnings('ignore')
+
+
+def _plain_values(values):
+    """แปลงค่า category กลับเป็น dtype ของ categories (key ของ dimension ไม่เก็บเป็น category)"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.astype(values.dtype.categories.dtype)
+    return values
+
+
+def dimension_key_index(df, columns):
+    """
+    สร้าง Index ของ natural key จากคอลัมน์ของ df (MultiIndex ถ้ามีหลายคอลัมน์)
+    
+    Args:
+        df: DataFrame ที่มีคอลัมน์ columns
+        columns: list ของคอลัมน์ natural key
+    
+    Returns:
+        pd.Index หรือ pd.MultiIndex ตามลำดับแถวของ df
+    """
+    if len(columns) == 1:
+        return pd.Index(_plain_values(df[columns[0]]), name=columns[0])
+    return pd.MultiIndex.from_arrays([_plain_values(df[column]) for column in columns], names=columns)
+
+
+def _datetime_levels(keys):
+    """bool ต่อคอลัมน์ของ key ว่าเป็นวันที่หรือไม่ (ใช้ตรวจ key ต่างชนิดกันที่ get_indexer จับคู่ไม่ได้)"""
+    levels = keys.levels if isinstance(keys, pd.MultiIndex) else [keys]
+    return tuple(pd.api.types.is_datetime64_any_dtype(level.dtype) for level in levels)
+
+
+def _factorize_rows(df, columns):
+    """
+    factorize natural key ของทุกแถวในครั้งเดียว
+    
+    Returns:
+        tuple: (codes ต่อแถว, Index ของ key ที่ไม่ซ้ำตามลำดับที่พบครั้งแรก)
+    """
+    if len(columns) == 1:
+        codes, uniques = pd.factorize(df[columns[0]], use_na_sentinel=False)
+        return codes, pd.Index(_plain_values(uniques), name=columns[0])
+    
+    # รวม codes ของแต่ละคอลัมน์เป็น code เดียวต่อแถว (factorize ซ้ำทุกคอลัมน์ ค่าจึงไม่เกินจำนวนแถว)
+    codes = np.zeros(len(df), dtype=np.int64)
+    for column in columns:
+        column_codes, column_uniques = pd.factorize(df[column], use_na_sentinel=False)
+        codes, _ = pd.factorize(codes * len(column_uniques) + column_codes)
+    first_rows = np.unique(codes, return_index=True)[1]
+    return codes, dimension_key_index(df.iloc[first_rows], columns)
+
+
+def assign_surrogate_keys(df, columns, known_keys=None):
+    """
+    กำหนด surrogate id ให้ natural key ของทุกแถว (id เริ่มที่ 1 ตามลำดับที่พบครั้งแรก)
+    
+    factorize ทุกแถวครั้งเดียว แล้วเทียบกับ key ที่มีอยู่เฉพาะค่าที่ไม่ซ้ำ key ที่เคยพบได้ id เดิม
+    key ใหม่ได้ id ถัดไป (ใช้สะสมข้าม chunk ได้)
+    
+    Args:
+        df: DataFrame ที่มีคอลัมน์ columns
+        columns: list ของคอลัมน์ natural key (หนึ่งหรือหลายคอลัมน์)
+        known_keys: Index ของ key ที่มี id แล้วจากรอบก่อน (id = ตำแหน่ง + 1) (default: None = เริ่มใหม่)
+    
+    Returns:
+        tuple: (ids: numpy array int64 ต่อแถว, known_keys: Index ของ key ทั้งหมดรวม key ใหม่)
+    
+    Raises:
+        ValueError: key ใน df เป็นวันที่แต่ known_keys เป็นข้อความ (หรือกลับกัน)
+    """
+    codes, uniques = _factorize_rows(df, columns)
+    if known_keys is None or len(known_keys) == 0:
+        return codes.astype(np.int64) + 1, uniques
+    if len(uniques) > 0 and _datetime_levels(known_keys) != _datetime_levels(uniques):
+        raise ValueError(f"Keys of {columns} are {uniques.dtype} but known keys are {known_keys.dtype}")
+    
+    positions = known_keys.get_indexer(uniques)
+    new = positions == -1
+    if new.any():
+        positions[new] = np.arange(len(known_keys), len(known_keys) + int(new.sum()))
+        known_keys = known_keys.append(uniques[new])
+    return positions.astype(np.int64)[codes] + 1, known_keys
+
+
+def build_dimension_table(known_keys, id_column, attributes=None):
+    """
+    สร้าง dimension table จาก key ที่สะสมไว้
+    
+    Args:
+        known_keys: Index ของ key จาก assign_surrogate_keys()
+        id_column: ชื่อคอลัมน์ surrogate id
+        attributes: ฟังก์ชันรับ dimension table แล้วคืนตารางที่เพิ่มคอลัมน์แล้ว (default: None)
+    
+    Returns:
+        DataFrame: คอลัมน์ natural key + id_column (+ คอลัมน์จาก attributes)
+    """
+    dim_df = known_keys.to_frame(index=False)
+    dim_df[id_column] = np.arange(1, len(dim_df) + 1, dtype=np.int64)
+    if attributes is not None:
+        dim_df = attributes(dim_df)
+    return dim_df
+
+
+if __name__ == "__main__":
+    # Example usage
+    df = pd.DataFrame({'home_ownership': ['RENT', 'OWN', 'RENT'], 'term': [' 36 months', ' 60 months', ' 36 months']})
+    
+    try:
+        ids, keys = assign_surrogate_keys(df, ['home_ownership', 'term'])
+        print(f"Surrogate ids: {ids.tolist()}")
+        print(build_dimension_table(keys, 'home_term_id'))
+    except Exception as e:
+        print(f"Error: {e}")
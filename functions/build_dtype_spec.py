@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Dtype Spec Building Function
+ฟังก์ชันสำหรับแปลงผลลัพธ์ guess_column_types() เป็น dtype spec สำหรับ read_csv
+"""
+
+import pandas as pd
+import warnings
+from .parse_date_column import parse_date_column
+warnings.filterwarnings('ignore')
+
+# ประเภทจาก guess_column_types() ที่ให้ read_csv parse เป็น datetime ระหว่างโหลด
+DATE_TYPES = ('date', 'datetime64')
+
+
+def build_dtype_spec(column_types, sample_df=None, max_category_ratio=0.5, max_categories=1000, date_formats=None):
+    """
+    แปลง type map จาก guess_column_types() เป็น dtype spec แบบประหยัดหน่วยความจำ
+    
+    - string ที่มี cardinality ต่ำ (ดูจาก sample_df) -> 'category'
+    - integer -> downcast เป็นความกว้างที่เล็กที่สุดที่ปลอดภัยหลังอ่านแต่ละ chunk
+      (read_csv จะ wrap ค่าที่ล้น dtype แคบแบบเงียบๆ จึงไม่กำหนด int8/int16 ตอน parse)
+    - date / datetime64 -> parse_dates ระหว่างโหลด
+    - คอลัมน์ใน date_formats -> แปลงเป็น datetime ตาม format ที่กำหนดระหว่างโหลด
+    
+    Args:
+        column_types: dict {คอลัมน์: ประเภท} จาก guess_column_types()
+        sample_df: DataFrame ที่ใช้เดาประเภท สำหรับวัด cardinality (default: None = ไม่ใช้ category)
+        max_category_ratio: สัดส่วน unique/non-null สูงสุดที่ถือว่าเป็น low-cardinality (default: 0.5)
+        max_categories: จำนวน unique values สูงสุดของคอลัมน์ category (default: 1000)
+        date_formats: dict {คอลัมน์: format} ของวันที่ที่ไม่ใช่ ISO เช่น {'issue_d': '%b-%Y'}
+        
+    Returns:
+        dict: {'dtype': dict, 'parse_dates': list, 'downcast_integers': list, 'date_formats': dict}
+        ('dtype' ส่งให้ read_csv โดยตรง ส่วนที่เหลือใช้กับ apply_dtype_spec() ทีละ chunk)
+    """
+    date_formats = dict(date_formats or {})
+    dtype = {}
+    parse_dates = []
+    downcast_integers = []
+    
+    for column, column_type in column_types.items():
+        if column in date_formats:
+            continue
+        
+        if column_type in DATE_TYPES:
+            parse_dates.append(column)
+        elif column_type == 'integer':
+            downcast_integers.append(column)
+        elif column_type == 'string' and sample_df is not None and column in sample_df.columns:
+            values = sample_df[column]
+            non_null = values.count()
+            n_unique = values.nunique()
+            if non_null > 0 and n_unique <= max_categories and n_unique / non_null <= max_category_ratio:
+                dtype[column] = 'category'
+    
+    date_formats = {column: fmt for column, fmt in date_formats.items() if column in column_types}
+    
+    return {
+        'dtype': dtype,
+        'parse_dates': parse_dates,
+        'downcast_integers': downcast_integers,
+        'date_formats': date_formats
+    }
+
+
+def _to_datetime(values, fmt=None):
+    """แปลงเป็น datetime ตาม format ถ้าไม่สำเร็จจึง parse แบบไม่ระบุ format (ล้มเหลวทั้งคู่ = คงค่าเดิม)"""
+    try:
+        return parse_date_column(values, date_format=fmt, use_cache=True)
+    except ValueError:
+        return values
+
+
+def apply_dtype_spec(df, dtype_spec):
+    """
+    แปลงคอลัมน์ของ DataFrame ที่อ่านแล้วตามส่วนของ spec ที่ read_csv ทำให้ไม่ได้อย่างปลอดภัย
+    (downcast integer, parse_dates และวันที่ตาม format) รวมถึงคอลัมน์ใน 'dtype' ที่ยังไม่ได้
+    แปลงตอนอ่าน (เช่นเมื่อกรองแถวก่อนแปลง)
+    
+    Args:
+        df: DataFrame (หรือ chunk) ที่อ่านด้วย dtype ของ spec แล้ว
+        dtype_spec: ผลลัพธ์จาก build_dtype_spec()
+        
+    Returns:
+        DataFrame เดิม (แก้ไขในที่)
+    """
+    for column, dtype in dtype_spec.get('dtype', {}).items():
+        if column in df.columns and str(df[column].dtype) != dtype:
+            df[column] = df[column].astype(dtype)
+    
+    for column in dtype_spec.get('downcast_integers', []):
+        if column in df.columns and pd.api.types.is_integer_dtype(df[column]):
+            df[column] = pd.to_numeric(df[column], downcast='integer')
+    
+    date_columns = [(column, None) for column in dtype_spec.get('parse_dates', [])]
+    date_columns += list(dtype_spec.get('date_formats', {}).items())
+    for column, fmt in date_columns:
+        if column in df.columns and not pd.api.types.is_datetime64_any_dtype(df[column]):
+            df[column] = _to_datetime(df[column], fmt)
+    
+    return df
+
+
+if __name__ == "__main__":
+    # Example usage
+    file_path = '../dataops-foundation-jenkins/data/LoanStats_web_small.csv'
+    
+    try:
+        from functions import guess_column_types, sample_csv_rows
+        sample_df, _ = sample_csv_rows(file_path, sample_size=10000)
+        success, column_types = guess_column_types(sample_df)
+        spec = build_dtype_spec(column_types, sample_df=sample_df, date_formats={'issue_d': '%b-%Y'})
+        print(f"category columns: {list(spec['dtype'])}")
+        print(f"date columns: {spec['parse_dates'] + list(spec['date_formats'])}")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Bulk Table Loading Function
+ฟังก์ชันสำหรับโหลด DataFrame เข้า database แบบ bulk พร้อมกำหนดประเภทคอลัมน์เอง
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from itertools import chain
+import numpy as np
+import pandas as pd
+from sqlalchemy import Table, Column, MetaData
+from sqlalchemy.types import Boolean, SmallInteger, Integer, BigInteger, Float, DateTime, Unicode
+import warnings
+warnings.filterwarnings('ignore')
+
+LOAD_METHODS = ('auto', 'executemany', 'multi', 'bcp', 'bulk_insert')
+
+# จำนวนแถวต่อ batch ของ executemany / bcp
+DEFAULT_BATCH_ROWS = 10000
+
+# SQL Server รับ parameter ได้ไม่เกิน 2100 ต่อ statement และ VALUES ได้ไม่เกิน 1000 แถว
+MAX_STATEMENT_PARAMETERS = 2000
+MAX_VALUES_ROWS = 1000
+
+# parameter marker ของ driver แบบ positional (driver แบบ named ใช้ SQLAlchemy สร้าง statement)
+PARAM_MARKERS = {'qmark': '?', 'format': '%s', 'pyformat': '%s'}
+
+# NVARCHAR ที่ยาวกว่านี้ใช้ NVARCHAR(max)
+MAX_NVARCHAR_LENGTH = 4000
+
+# ความกว้างคงที่ของคอลัมน์ข้อความ (ไม่ขึ้นกับข้อมูลรอบแรก - ค่าที่ append ภายหลังยาวกว่าได้ถึงความกว้างนี้)
+# คอลัมน์ที่มีค่ายาวกว่านี้ใช้ NVARCHAR(max)
+TEXT_COLUMN_LENGTH = 255
+
+
+def sql_column_types(df):
+    """
+    กำหนดประเภทคอลัมน์ SQL จากข้อมูลจริงแทนการ map แบบทั่วไปของ pandas
+    (integer เล็กที่สุดที่พอ, NVARCHAR(TEXT_COLUMN_LENGTH) หรือ NVARCHAR(max) เมื่อมีค่าที่ยาวกว่า,
+    FLOAT(53) / REAL สำหรับ float32, DATETIME)
+    
+    ประเภทตัวเลขขึ้นกับช่วงค่าของ df - ตารางที่จะ append ข้อมูลภายหลังควรกำหนดประเภทเองด้วย
+    column_types ของ bulk_load_table()
+    
+    Args:
+        df: DataFrame ที่จะโหลด
+    
+    Returns:
+        dict: {คอลัมน์: SQLAlchemy type}
+    """
+    column_types = {}
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_bool_dtype(series):
+            column_types[column] = Boolean()
+        elif pd.api.types.is_integer_dtype(series):
+            low, high = (series.min(), series.max()) if len(series) else (0, 0)
+            if np.iinfo(np.int16).min <= low and high <= np.iinfo(np.int16).max:
+                column_types[column] = SmallInteger()
+            elif np.iinfo(np.int32).min <= low and high <= np.iinfo(np.int32).max:
+                column_types[column] = Integer()
+            else:
+                column_types[column] = BigInteger()
+        elif pd.api.types.is_float_dtype(series):
+            column_types[column] = Float(precision=24 if series.dtype == np.float32 else 53)
+        elif pd.api.types.is_datetime64_any_dtype(series):
+            column_types[column] = DateTime()
+        else:
+            lengths = series.dropna().astype(str).str.len()
+            max_length = int(lengths.max()) if len(lengths) else 0
+            column_types[column] = Unicode(TEXT_COLUMN_LENGTH if max_length <= TEXT_COLUMN_LENGTH else None)
+    return column_types
+
+
+def find_bcp(executable='bcp'):
+    """
+    หาโปรแกรม bcp ของ SQL Server (mssql-tools) - ไม่นับโปรแกรมอื่นที่ชื่อซ้ำ
+    
+    Returns:
+        str: path ของ bcp หรือ None ถ้าไม่พบ
+    """
+    path = shutil.which(executable)
+    if path is None:
+        return None
+    try:
+        banner = subprocess.run([path, '-v'], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return path if 'Microsoft' in banner else None
+
+
+def _resolve_method(method, engine):
+    """เลือกวิธีโหลดจริงเมื่อ method='auto'"""
+    if method not in LOAD_METHODS:
+        raise ValueError(f"Unknown load method: {method} (expected one of {LOAD_METHODS})")
+    if method != 'auto':
+        return method
+    if engine.dialect.name == 'mssql':
+        return 'bcp' if find_bcp() else 'multi'
+    return 'executemany'
+
+
+def _column_values(df):
+    """ค่าของแต่ละคอลัมน์เป็น list ของ Python scalar (NaN/NaT -> None) แปลงทีละคอลัมน์แทนทีละแถว"""
+    columns = []
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = np.array(series.dt.to_pydatetime(), dtype=object)
+        else:
+            values = series.to_numpy(dtype=object)
+        missing = series.isna().to_numpy()
+        if missing.any():
+            values = values.copy()
+            values[missing] = None
+        columns.append(values.tolist())
+    return columns
+
+
+def _insert_sql(engine, table_name, columns, rows):
+    """INSERT ... VALUES แบบ positional parameter ของ driver (rows แถวต่อ statement)"""
+    preparer = engine.dialect.identifier_preparer
+    marker = PARAM_MARKERS[engine.dialect.paramstyle]
+    row = '(' + ', '.join([marker] * len(columns)) + ')'
+    column_list = ', '.join(preparer.quote(column) for column in columns)
+    return f"INSERT INTO {preparer.quote(table_name)} ({column_list}) VALUES " + ', '.join([row] * rows)
+
+
+def _insert_rows(df, table, engine, method, batch_rows):
+    """insert แถวทีละ batch ด้วย executemany หรือ multi-row VALUES"""
+    columns = list(df.columns)
+    rows = list(zip(*_column_values(df)))
+    if method == 'multi':
+        batch_rows = max(1, min(batch_rows, MAX_VALUES_ROWS, MAX_STATEMENT_PARAMETERS // max(len(columns), 1)))
+    
+    with engine.begin() as connection:
+        if engine.dialect.paramstyle not in PARAM_MARKERS:
+            # driver ที่ใช้ named parameter - ให้ SQLAlchemy สร้าง statement เอง
+            records = [dict(zip(columns, row)) for row in rows]
+            for start in range(0, len(records), batch_rows):
+                batch = records[start:start + batch_rows]
+                if method == 'multi':
+                    connection.execute(table.insert().values(batch))
+                else:
+                    connection.execute(table.insert(), batch)
+            return
+        
+        statements = {}
+        for start in range(0, len(rows), batch_rows):
+            batch = rows[start:start + batch_rows]
+            if method == 'multi':
+                if len(batch) not in statements:
+                    statements[len(batch)] = _insert_sql(engine, table.name, columns, len(batch))
+                connection.exec_driver_sql(statements[len(batch)], tuple(chain.from_iterable(batch)))
+            else:
+                if 1 not in statements:
+                    statements[1] = _insert_sql(engine, table.name, columns, 1)
+                connection.exec_driver_sql(statements[1], batch)
+
+
+def _stage_file(df, path):
+    """
+    เขียนข้อมูลเป็นไฟล์ tab-delimited สำหรับ bcp / BULK INSERT (ค่าว่าง = NULL)
+    
+    Raises:
+        ValueError: มีข้อความที่มี tab หรือขึ้นบรรทัดใหม่ (แบ่ง field ไม่ได้)
+    """
+    for column in df.columns:
+        if not (pd.api.types.is_numeric_dtype(df[column]) or pd.api.types.is_datetime64_any_dtype(df[column])):
+            if df[column].dropna().astype(str).str.contains(r'[\t\r\n]').any():
+                raise ValueError(f"Column '{column}' contains tab/newline characters")
+    df.to_csv(path, sep='\t', header=False, index=False, na_rep='', date_format='%Y-%m-%d %H:%M:%S',
+              lineterminator='\n')
+
+
+def _bcp_command(bcp, table_name, path, url, batch_rows):
+    """
+    คำสั่ง bcp และ environment ของ process
+    
+    รหัสผ่านส่งผ่าน SQLCMDPASSWORD ใน environment ของ bcp เท่านั้น (ไม่อยู่ใน argv ที่ผู้ใช้อื่นเห็นได้จาก ps)
+    URL ที่ไม่มีรหัสผ่านใช้ trusted connection (-T)
+    
+    Returns:
+        tuple: (command: list, env: dict)
+    """
+    server = url.host if url.port is None else f'{url.host},{url.port}'
+    command = [bcp, table_name, 'in', path, '-S', server, '-d', url.database]
+    env = dict(os.environ)
+    if url.password:
+        command += ['-U', url.username]
+        env['SQLCMDPASSWORD'] = str(url.password)
+    else:
+        command += ['-T']
+    command += ['-c', '-t', '\t', '-r', '\n', '-b', str(batch_rows)]
+    return command, env
+
+
+def _load_with_bcp(df, table_name, engine, batch_rows):
+    """โหลดผ่าน bcp (mssql-tools) จากไฟล์ที่ stage ไว้"""
+    bcp = find_bcp()
+    with tempfile.TemporaryDirectory() as staging_dir:
+        path = os.path.join(staging_dir, f'{table_name}.tsv')
+        _stage_file(df, path)
+        command, env = _bcp_command(bcp, table_name, path, engine.url, batch_rows)
+        result = subprocess.run(command, capture_output=True, text=True, env=env)
+        if result.returncode != 0:
+            raise ValueError(f"bcp failed: {result.stdout.strip()} {result.stderr.strip()}")
+
+
+def _bulk_insert_sql(table_name, path):
+    """
+    คำสั่ง BULK INSERT (ชื่อไฟล์รับเป็น parameter ไม่ได้) - escape ']' ในชื่อตารางและ "'" ใน path
+    
+    Raises:
+        ValueError: path มีตัวอักษรควบคุม (เช่นขึ้นบรรทัดใหม่)
+    """
+    if any(ord(character) < 32 for character in path):
+        raise ValueError(f"Invalid staging path for BULK INSERT: {path!r}")
+    table = table_name.replace(']', ']]')
+    source = path.replace("'", "''")
+    return (f"BULK INSERT [{table}] FROM N'{source}' "
+            "WITH (FIELDTERMINATOR = '\\t', ROWTERMINATOR = '0x0a', KEEPNULLS, TABLOCK)")
+
+
+def _load_with_bulk_insert(df, table_name, engine, staging_dir):
+    """โหลดด้วย BULK INSERT จากไฟล์ใน staging_dir (ต้องเป็น path ที่ SQL Server อ่านได้)"""
+    path = os.path.abspath(os.path.join(staging_dir, f'{table_name}.tsv'))
+    statement = _bulk_insert_sql(table_name, path)
+    _stage_file(df, path)
+    try:
+        with engine.begin() as connection:
+            connection.exec_driver_sql(statement)
+    finally:
+        os.unlink(path)
+
+
+def bulk_load_table(df, table_name, engine, method='auto', if_exists='replace', batch_rows=DEFAULT_BATCH_ROWS,
+                    staging_dir=None, column_types=None):
+    """
+    โหลด DataFrame เข้าตารางใน database แบบ bulk
+    
+    สร้างตารางด้วยประเภทจาก sql_column_types() แล้วโหลดตาม method:
+    - 'executemany': insert ทีละ batch ด้วย executemany ของ driver
+      (SQL Server ผ่าน pyodbc ควรสร้าง engine ด้วย fast_executemany=True)
+    - 'multi': INSERT ... VALUES หลายแถวต่อ statement (จำกัดตาม parameter limit ของ SQL Server)
+    - 'bcp': stage เป็นไฟล์แล้วโหลดด้วย bcp ของ mssql-tools (เฉพาะ SQL Server)
+    - 'bulk_insert': stage ไฟล์ใน staging_dir แล้วสั่ง BULK INSERT (เฉพาะ SQL Server ที่อ่าน path นั้นได้)
+    - 'auto': SQL Server ใช้ bcp ถ้ามี ไม่เช่นนั้น multi / database อื่นใช้ executemany
+    
+    Args:
+        df: DataFrame ที่จะโหลด
+        table_name: ชื่อตาราง
+        engine: SQLAlchemy engine
+        method: วิธีโหลด (default: 'auto')
+        if_exists: 'replace', 'append' หรือ 'fail' เหมือน DataFrame.to_sql (default: 'replace')
+        batch_rows: จำนวนแถวต่อ batch (default: DEFAULT_BATCH_ROWS)
+        staging_dir: directory ที่ database server อ่านได้ สำหรับ bulk_insert (default: None)
+        column_types: dict {คอลัมน์: SQLAlchemy type} ที่ใช้แทนประเภทจาก sql_column_types() เช่น id ที่
+            ต้องรับค่าที่ append ภายหลัง (default: None)
+    
+    Returns:
+        dict: {'table', 'rows', 'method', 'seconds'}
+    """
+    start = time.perf_counter()
+    method = _resolve_method(method, engine)
+    if method == 'bcp' and find_bcp() is None:
+        raise ValueError("SQL Server bcp utility not found")
+    if method == 'bulk_insert' and staging_dir is None:
+        raise ValueError("bulk_insert requires a staging_dir shared with the database server")
+    column_types = {**sql_column_types(df), **(column_types or {})}
+    
+    # สร้างตาราง (replace/append/fail ตาม pandas) ด้วยประเภทที่กำหนดเอง
+    df.head(0).to_sql(table_name, con=engine, if_exists=if_exists, index=False, dtype=column_types)
+    table = Table(table_name, MetaData(), *[Column(column, column_types[column]) for column in df.columns])
+    
+    if len(df) > 0:
+        if method == 'bcp':
+            _load_with_bcp(df, table_name, engine, batch_rows)
+        elif method == 'bulk_insert':
+            _load_with_bulk_insert(df, table_name, engine, staging_dir)
+        else:
+            _insert_rows(df, table, engine, method, batch_rows)
+    
+    return {'table': table_name, 'rows': len(df), 'method': method, 'seconds': time.perf_counter() - start}
+
+
+if __name__ == "__main__":
+    # Example usage
+    from sqlalchemy import create_engine
+    
+    try:
+        engine = create_engine('sqlite://')
+        df = pd.DataFrame({'loan_amnt': [1000.0, 2000.0], 'home_ownership': ['RENT', 'OWN']})
+        stats = bulk_load_table(df, 'example', engine)
+        print(f"Loaded {stats['rows']} rows into {stats['table']} with {stats['method']} in {stats['seconds']:.3f}s")
+    except Exception as e:
+        print(f"Error: {e}")
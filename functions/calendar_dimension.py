@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Calendar Dimension Functions
+ฟังก์ชันสำหรับสร้าง calendar dimension รายเดือนล่วงหน้า และคำนวณ id ของวันที่ด้วยเลขคณิต (year * 12 + month)
+"""
+
+import numpy as np
+import pandas as pd
+import warnings
+warnings.filterwarnings('ignore')
+
+# id ของเดือนแรกของ datetime64 (มกราคม 1970) = 1970 * 12 + 1
+_EPOCH_MONTH_ID = 1970 * 12 + 1
+
+
+def calendar_month_ids(dates):
+    """
+    คำนวณ id ของเดือนของแต่ละวันที่ (year * 12 + month) โดยไม่ต้อง lookup กับ dimension table
+    
+    คำนวณเฉพาะวันที่ที่ไม่ซ้ำแล้วกระจายกลับด้วย codes ของ factorize (แปลง datetime64 เป็นเดือน
+    ทีละแถวช้ากว่า factorize หลายเท่า)
+    
+    Args:
+        dates: Series / array ของวันที่ (datetime64, category หรือข้อความที่ pd.to_datetime แปลงได้)
+    
+    Returns:
+        numpy array int64 ของ id ตามลำดับแถว
+    
+    Raises:
+        ValueError: มีวันที่ว่าง (NaT)
+    """
+    codes, uniques = pd.factorize(dates)
+    if (codes == -1).any():
+        raise ValueError("Calendar ids cannot be computed for missing dates")
+    if not pd.api.types.is_datetime64_any_dtype(uniques):
+        uniques = pd.to_datetime(np.asarray(uniques))
+    months = np.asarray(uniques, dtype='datetime64[ns]').astype('datetime64[M]')
+    return (months.astype(np.int64) + _EPOCH_MONTH_ID)[codes]
+
+
+def calendar_year_range(month_ids):
+    """
+    ช่วงปีที่ครอบคลุม id ทั้งหมด
+    
+    Returns:
+        tuple: (ปีแรก, ปีสุดท้าย) หรือ None ถ้าไม่มี id
+    """
+    if len(month_ids) == 0:
+        return None
+    return int((month_ids.min() - 1) // 12), int((month_ids.max() - 1) // 12)
+
+
+def build_calendar_dimension(min_year, max_year, date_column='issue_d', id_column='issue_d_id'):
+    """
+    สร้าง calendar dimension รายเดือนครบทุกเดือนของ min_year..max_year (ไม่ขึ้นกับข้อมูล)
+    
+    Args:
+        min_year: ปีแรก
+        max_year: ปีสุดท้าย
+        date_column: ชื่อคอลัมน์วันที่ (วันแรกของเดือน) (default: 'issue_d')
+        id_column: ชื่อคอลัมน์ id = year * 12 + month (default: 'issue_d_id')
+    
+    Returns:
+        DataFrame: date_column, id_column, month, year, quarter, period (YYYYMM) เรียงตามเดือน
+    """
+    years = np.repeat(np.arange(min_year, max_year + 1, dtype=np.int64), 12)
+    months = np.tile(np.arange(1, 13, dtype=np.int64), max_year - min_year + 1)
+    month_ids = years * 12 + months
+    dates = (month_ids - _EPOCH_MONTH_ID).astype('datetime64[M]').astype('datetime64[ns]')
+    return pd.DataFrame({
+        date_column: dates,
+        id_column: month_ids,
+        'month': months.astype(np.int32),
+        'year': years.astype(np.int32),
+        'quarter': ((months - 1) // 3 + 1).astype(np.int32),
+        'period': years * 100 + months
+    })
+
+
+if __name__ == "__main__":
+    # Example usage
+    try:
+        dates = pd.to_datetime(pd.Series(['2016-01-01', '2017-06-01', '2016-01-01']))
+        print(f"Calendar ids: {calendar_month_ids(dates).tolist()}")
+        print(build_calendar_dimension(2016, 2016))
+    except Exception as e:
+        print(f"Error: {e}")
@@ -10,17 +10,85 @@ import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
+# จำนวนแถวต่อช่วงที่ใช้นับ null (mask ชั่วคราวมีขนาดไม่เกินนี้ ไม่ขึ้นกับขนาดของ DataFrame)
+NULL_COUNT_BLOCK_ROWS = 65536
 
-def clean_missing_values(df, max_null_percentage=30):
+
+def _column_null_count(series):
+    """นับ null ของคอลัมน์ทีละช่วงแถว (integer / bool แบบ numpy ไม่มี null จึงไม่ต้องสแกน)"""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biu':
+        return 0
+    values = series.array
+    return sum(int(pd.isna(values[start:start + NULL_COUNT_BLOCK_ROWS]).sum())
+               for start in range(0, len(values), NULL_COUNT_BLOCK_ROWS))
+
+
+def count_missing_values(df, null_stats=None):
+    """
+    นับจำนวน missing values ของแต่ละคอลัมน์ (สะสมต่อเนื่องได้ทีละ chunk)
+    
+    นับทีละคอลัมน์ทีละช่วงแถว ไม่สร้าง mask ขนาด rows x columns แบบ df.isnull()
+    
+    Args:
+        df: DataFrame (หรือ chunk หนึ่งของไฟล์)
+        null_stats: สถิติที่สะสมไว้จาก chunk ก่อนหน้า (default: None = เริ่มใหม่)
+        
+    Returns:
+        dict: {'rows': จำนวนแถวทั้งหมด, 'null_counts': Series จำนวน null ต่อคอลัมน์}
+    """
+    null_counts = pd.Series([_column_null_count(df.iloc[:, position]) for position in range(len(df.columns))],
+                            index=df.columns, dtype='int64')
+    if null_stats is None:
+        return {'rows': len(df), 'null_counts': null_counts}
+    
+    return {
+        'rows': null_stats['rows'] + len(df),
+        'null_counts': null_stats['null_counts'].add(null_counts, fill_value=0).astype('int64')
+    }
+
+
+def columns_within_null_limit(null_stats, max_null_percentage=30):
+    """
+    เลือกคอลัมน์ที่มี missing values ไม่เกินเปอร์เซ็นต์ที่กำหนดจากสถิติที่นับไว้
+    
+    Args:
+        null_stats: ผลลัพธ์จาก count_missing_values()
+        max_null_percentage: เปอร์เซ็นต์สูงสุดของ null ที่ยอมรับได้ (default: 30)
+        
+    Returns:
+        list: ชื่อคอลัมน์ที่ผ่านเกณฑ์ (เรียงตามลำดับเดิม)
+    """
+    if null_stats['rows'] == 0:
+        return null_stats['null_counts'].index.tolist()
+    
+    missing_percentage = null_stats['null_counts'] / null_stats['rows'] * 100
+    return missing_percentage[missing_percentage <= max_null_percentage].index.tolist()
+
+
+def _select_columns(df, columns):
+    """เลือกคอลัมน์โดยใช้ข้อมูลร่วมกับ df (df[columns] จะ copy ทุกคอลัมน์ที่เลือก)"""
+    if len(columns) == len(df.columns):
+        return df
+    if not df.columns.is_unique:
+        return df[columns]
+    return pd.DataFrame({column: df[column] for column in columns}, index=df.index, columns=columns, copy=False)
+
+
+def clean_missing_values(df, max_null_percentage=30, null_stats=None):
     """
     ลบคอลัมน์ที่มี missing values เกินเปอร์เซ็นต์ที่กำหนด
     
+    ไม่ copy ข้อมูล: null นับทีละคอลัมน์ด้วย count_missing_values() และคอลัมน์ที่เหลือใช้ข้อมูลร่วมกับ
+    df (ถ้าไม่มีคอลัมน์ถูกลบจะคืน df เดิม) หน่วยความจำเพิ่มจึงขึ้นกับจำนวนคอลัมน์เท่านั้น
+    
     Args:
         df: DataFrame ต้นฉบับ
         max_null_percentage: เปอร์เซ็นต์สูงสุดของ null ที่ยอมรับได้ (default: 30)
+        null_stats: สถิติจาก count_missing_values() ที่นับไว้ก่อนกรองแถวระหว่างโหลด
+            (default: None = คำนวณจาก df)
         
     Returns:
-        DataFrame ที่กรองคอลัมน์ที่มี null values มากแล้ว
+        DataFrame ที่กรองคอลัมน์ที่มี null values มากแล้ว (ใช้ข้อมูลร่วมกับ df)
     """
     if df.empty:
         print("Warning: Input DataFrame is empty")
@@ -28,14 +96,12 @@ def clean_missing_values(df, max_null_percentage=30):
     
     original_columns = len(df.columns)
     
-    # คำนวณ percentage ของ missing values ของแต่ละคอลัมน์
-    missing_percentage = df.isnull().mean() * 100
-    
-    # กรองคอลัมน์ที่มี null เกินกว่า max_null_percentage ออกไป
-    columns_to_keep = missing_percentage[missing_percentage <= max_null_percentage].index.tolist()
+    # ใช้สถิติของไฟล์ทั้งหมดถ้ามี (รวมแถวที่ถูกกรองทิ้งไปแล้ว) ไม่เช่นนั้นนับจาก df
+    kept = set(columns_within_null_limit(null_stats or count_missing_values(df), max_null_percentage))
+    columns_to_keep = [column for column in df.columns if column in kept]
     
-    # สร้าง DataFrame ใหม่จากคอลัมน์ที่เลือก
-    filtered_df = df[columns_to_keep]
+    # เลือกคอลัมน์ที่ผ่านเกณฑ์โดยไม่ copy ข้อมูล
+    filtered_df = _select_columns(df, columns_to_keep)
     
     removed_columns = original_columns - len(filtered_df.columns)
     
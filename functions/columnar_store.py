@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Columnar Store Functions
+ฟังก์ชันสำหรับบันทึก / โหลด DataFrame เป็นไฟล์ .npy ทีละคอลัมน์ (memory-map ได้ ไม่ใช้ pickle)
+"""
+
+import json
+import os
+import numpy as np
+import pandas as pd
+import warnings
+warnings.filterwarnings('ignore')
+
+LAYOUT_FILE = 'layout.json'
+
+
+def save_array(directory, name, values):
+    """บันทึก array เป็น .npy แบบ atomic และคืนขนาดไฟล์"""
+    path = os.path.join(directory, f'{name}.npy')
+    temp_file = f'{path}.{os.getpid()}.tmp'
+    with open(temp_file, 'wb') as f:
+        np.save(f, values, allow_pickle=False)
+    os.replace(temp_file, path)
+    return os.path.getsize(path)
+
+
+def _encode_strings(values):
+    """แปลง list ของ str เป็น (bytes UTF-8 ต่อกัน, offsets ตามจำนวนตัวอักษร) เพื่อเก็บโดยไม่ใช้ pickle"""
+    lengths = np.fromiter((len(value) for value in values), dtype=np.int64, count=len(values))
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    blob = np.frombuffer(''.join(values).encode('utf-8'), dtype=np.uint8)
+    return blob, offsets
+
+
+def _decode_strings(blob, offsets):
+    """แปลง bytes UTF-8 + offsets กลับเป็น object array ของ str"""
+    text = blob.tobytes().decode('utf-8')
+    strings = np.empty(len(offsets) - 1, dtype=object)
+    strings[:] = [text[start:stop] for start, stop in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+    return strings
+
+
+def store_column(directory, name, series):
+    """
+    บันทึกคอลัมน์หนึ่งลง directory
+    
+    - ตัวเลข / bool -> .npy (memory-map ได้)
+    - datetime64 -> int64 .npy
+    - ข้อความ / category -> codes .npy + unique values เป็น UTF-8 bytes
+    
+    Returns:
+        dict ข้อมูลของคอลัมน์ (kind, dtype, bytes, files) หรือ None ถ้าเก็บคอลัมน์นี้ไม่ได้
+        (ข้อความที่ไม่ใช่ str ทั้งหมด)
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufc':
+        size = save_array(directory, name, series.to_numpy())
+        return {'kind': 'array', 'dtype': str(dtype), 'bytes': size, 'files': [f'{name}.npy']}
+    
+    if isinstance(dtype, np.dtype) and dtype.kind == 'M':
+        size = save_array(directory, name, series.to_numpy().view('int64'))
+        return {'kind': 'datetime', 'dtype': str(dtype), 'bytes': size, 'files': [f'{name}.npy']}
+    
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes, uniques, kind = series.cat.codes.to_numpy(), dtype.categories, 'category'
+    else:
+        codes, uniques = pd.factorize(series)
+        kind = 'strings'
+    
+    uniques = list(uniques)
+    if not all(isinstance(value, str) for value in uniques):
+        return None
+    
+    blob, offsets = _encode_strings(uniques)
+    size = save_array(directory, name, codes)
+    size += save_array(directory, f'{name}.blob', blob)
+    size += save_array(directory, f'{name}.offsets', offsets)
+    info = {'kind': kind, 'dtype': str(dtype), 'bytes': size,
+            'files': [f'{name}.npy', f'{name}.blob.npy', f'{name}.offsets.npy']}
+    if kind == 'category':
+        info['ordered'] = bool(dtype.ordered)
+    return info
+
+
+def load_column(directory, name, info, mmap_mode='r', start=None, stop=None, uniques_cache=None):
+    """
+    โหลดคอลัมน์ (หรือช่วงแถว start:stop) ที่บันทึกด้วย store_column()
+    
+    Args:
+        directory: directory ที่เก็บคอลัมน์
+        name: ชื่อไฟล์ของคอลัมน์ (ไม่รวม .npy)
+        info: dict ที่ store_column() คืนมา
+        mmap_mode: mode ของ np.load (default: 'r' = memory-map อ่านอย่างเดียว)
+        start, stop: ช่วงแถวที่ต้องการ (default: None = ทั้งคอลัมน์)
+        uniques_cache: dict สำหรับเก็บ unique values ที่ decode แล้วข้ามหลาย chunk (default: None)
+    
+    Returns:
+        numpy array หรือ pandas array ของคอลัมน์
+    """
+    values = np.load(os.path.join(directory, f'{name}.npy'), mmap_mode=mmap_mode)[start:stop]
+    
+    if info['kind'] == 'array':
+        return values
+    if info['kind'] == 'datetime':
+        return np.asarray(values).view(info['dtype'])
+    
+    uniques = None if uniques_cache is None else uniques_cache.get(name)
+    if uniques is None:
+        uniques = _decode_strings(np.load(os.path.join(directory, f'{name}.blob.npy')),
+                                  np.load(os.path.join(directory, f'{name}.offsets.npy')))
+        if uniques_cache is not None:
+            uniques_cache[name] = uniques
+    
+    if info['kind'] == 'category':
+        categories = pd.CategoricalDtype(uniques, ordered=info['ordered'])
+        return pd.Categorical.from_codes(np.asarray(values), dtype=categories)
+    
+    # code -1 (ค่าว่าง) ชี้ไปที่ NaN ตัวท้าย
+    strings = np.append(uniques, np.nan)[values]
+    if info['dtype'] != 'object':
+        return pd.array(strings, dtype=info['dtype'])
+    return strings
+
+
+
+def save_frame(df, directory):
+    """
+    บันทึก DataFrame ทั้งตารางลง directory (หนึ่งคอลัมน์ต่อไฟล์ + layout.json)
+    
+    Args:
+        df: DataFrame ที่จะบันทึก
+        directory: directory ปลายทาง (สร้างให้ถ้ายังไม่มี)
+    
+    Returns:
+        dict: layout {'rows': จำนวนแถว, 'columns': [{'name': ชื่อคอลัมน์, ...ข้อมูลจาก store_column()}]}
+    """
+    os.makedirs(directory, exist_ok=True)
+    columns = []
+    for position, column in enumerate(df.columns):
+        info = store_column(directory, str(position), df[column])
+        if info is None:
+            raise ValueError(f"Column '{column}' ({df[column].dtype}) cannot be stored")
+        columns.append({'name': column, 'file': str(position), **info})
+    
+    layout = {'rows': len(df), 'columns': columns}
+    with open(os.path.join(directory, LAYOUT_FILE), 'w', encoding='utf-8') as f:
+        json.dump(layout, f, indent=2)
+    return layout
+
+
+def load_frame(directory, mmap_mode='r'):
+    """
+    โหลด DataFrame ที่บันทึกด้วย save_frame()
+    
+    Args:
+        directory: directory ที่บันทึกไว้
+        mmap_mode: mode ของ np.load สำหรับคอลัมน์ตัวเลข (default: 'r' = memory-map อ่านอย่างเดียว)
+    
+    Returns:
+        DataFrame
+    """
+    with open(os.path.join(directory, LAYOUT_FILE), 'r', encoding='utf-8') as f:
+        layout = json.load(f)
+    
+    data = {column['name']: load_column(directory, column['file'], column, mmap_mode)
+            for column in layout['columns']}
+    return pd.DataFrame(data, index=pd.RangeIndex(layout['rows']), copy=False)
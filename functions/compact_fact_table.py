@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compact Fact Table Functions
+ฟังก์ชันสำหรับลดหน่วยความจำของ fact table (downcast ตัวเลข / id และเก็บข้อความซ้ำเป็น category)
+"""
+
+import numpy as np
+import pandas as pd
+import warnings
+warnings.filterwarnings('ignore')
+
+# จำนวน unique values สูงสุดของคอลัมน์ข้อความที่แปลงเป็น category (codes ยังเป็น int16)
+MAX_CATEGORIES = np.iinfo(np.int16).max
+
+# จำนวนตำแหน่งทศนิยมของจำนวนเงินที่ต้องคงค่าเดิมเมื่อเก็บเป็น float32
+MONEY_DECIMALS = 2
+
+
+def frame_memory_bytes(df):
+    """หน่วยความจำทั้งหมดของคอลัมน์ (รวมข้อความ ไม่รวม index) เป็น bytes"""
+    return int(df.memory_usage(deep=True, index=False).sum())
+
+
+def _float32_safe(values, decimals):
+    """float32 เก็บค่าได้ตรงเมื่อปัดเศษ decimals ตำแหน่ง (ค่าต้นฉบับต้องไม่มีทศนิยมเกินด้วย)"""
+    rounded = np.round(values, decimals)
+    if not np.array_equal(rounded, values, equal_nan=True):
+        return False
+    restored = np.round(values.astype(np.float32).astype(np.float64), decimals)
+    return np.array_equal(restored, values, equal_nan=True)
+
+
+def compact_fact_table(fact_table, decimals=MONEY_DECIMALS, max_categories=MAX_CATEGORIES):
+    """
+    แปลง fact table เป็นประเภทที่เล็กที่สุดที่ยังเก็บค่าเดิมได้หลังแปลงกลับด้วย restore_fact_table()
+    
+    ผลลัพธ์ใช้ภายใน pipeline เท่านั้น: float32 ไม่ได้เก็บค่าเดิมตรงตัว (1285.32 อ่านได้ 1285.319946)
+    และผลรวมใน float32 คลาดเคลื่อน ทุกจุดที่ส่งข้อมูลออก (แสดงผล, bundle, deploy) ต้องเรียก
+    restore_fact_table() ก่อน
+    
+    - integer (surrogate id, fact_id) -> int8 / int16 / int32 ตามช่วงค่า
+    - float -> float32 เมื่อทุกค่ามีทศนิยมไม่เกิน decimals ตำแหน่งและ float32 คืนค่าเดิมได้
+      (จำนวนเงินไม่เกินราว 130,000 ที่ความละเอียดระดับสตางค์) ไม่เช่นนั้นคง float64
+    - ข้อความที่มี unique values ไม่เกิน max_categories (เช่น term, int_rate) -> category
+    
+    Args:
+        fact_table: DataFrame ของ fact table
+        decimals: จำนวนตำแหน่งทศนิยมที่ต้องคงไว้ของคอลัมน์ float (default: MONEY_DECIMALS)
+        max_categories: unique values สูงสุดของคอลัมน์ที่แปลงเป็น category (default: MAX_CATEGORIES)
+    
+    Returns:
+        DataFrame ใหม่ที่แปลงประเภทแล้ว (ไม่แก้ต้นฉบับ)
+    """
+    columns = {}
+    for column in fact_table.columns:
+        series = fact_table[column]
+        if pd.api.types.is_integer_dtype(series):
+            series = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series) and series.dtype != np.float32:
+            if _float32_safe(series.to_numpy(dtype=np.float64), decimals):
+                series = series.astype(np.float32)
+        elif (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)) \
+                and not isinstance(series.dtype, pd.CategoricalDtype):
+            if series.nunique() <= max_categories:
+                series = series.astype('category')
+        columns[column] = series
+    return pd.DataFrame(columns, index=fact_table.index)
+
+
+def restore_fact_table(fact_table, decimals=MONEY_DECIMALS):
+    """
+    แปลง fact table ที่ผ่าน compact_fact_table() กลับเป็นประเภทปกติพร้อมค่าเดิม
+    
+    - float32 -> float64 ปัดเศษ decimals ตำแหน่ง (ได้ค่าระดับสตางค์เดิมตรงตัว)
+    - category -> ประเภทของ categories (ข้อความ)
+    - integer -> int64
+    
+    Args:
+        fact_table: DataFrame ของ fact table (แบบ compact หรือไม่ก็ได้ - คอลัมน์ประเภทปกติคงเดิม)
+        decimals: จำนวนตำแหน่งทศนิยมที่ใช้ตอน compact (default: MONEY_DECIMALS)
+    
+    Returns:
+        DataFrame ใหม่ที่แปลงประเภทแล้ว (ไม่แก้ต้นฉบับ)
+    """
+    columns = {}
+    for column in fact_table.columns:
+        series = fact_table[column]
+        if series.dtype == np.float32:
+            series = series.astype(np.float64).round(decimals)
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(series.dtype.categories.dtype)
+        elif isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iu' and series.dtype != np.int64:
+            series = series.astype(np.int64)
+        columns[column] = series
+    return pd.DataFrame(columns, index=fact_table.index)
+
+
+def concat_compact_frames(frames, max_categories=MAX_CATEGORIES):
+    """
+    ต่อ fact chunks ที่ผ่าน compact_fact_table() โดยคงประเภทแคบไว้ (ผลเหมือน compact ทั้งตารางครั้งเดียว)
+    
+    คอลัมน์ที่เป็น category ในบาง chunk ถูกรวม unique values ของทุก chunk เป็น categories เดียวกันก่อนต่อ
+    (pd.concat จะแปลงเป็น object ถ้า categories ต่างกัน) ถ้ารวมแล้วเกิน max_categories จะคืนเป็นข้อความ
+    ส่วนตัวเลขใช้ประเภทที่กว้างที่สุดของทุก chunk
+    
+    Args:
+        frames: list ของ DataFrame ที่มีคอลัมน์เดียวกัน
+        max_categories: unique values สูงสุดของคอลัมน์ category (default: MAX_CATEGORIES)
+    
+    Returns:
+        DataFrame ที่ต่อกันแล้ว (index ใหม่ 0..n-1)
+    """
+    if not frames:
+        return pd.DataFrame()
+    
+    frames = list(frames)
+    for column in frames[0].columns:
+        dtypes = [frame[column].dtype for frame in frames]
+        if not any(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+            continue
+        uniques = [np.asarray(dtype.categories if isinstance(dtype, pd.CategoricalDtype)
+                              else frame[column].dropna().unique(), dtype=object)
+                   for frame, dtype in zip(frames, dtypes)]
+        categories = pd.Index(np.unique(np.concatenate(uniques)))
+        target = pd.CategoricalDtype(categories) if len(categories) <= max_categories else object
+        frames = [frame.assign(**{column: frame[column].astype(target)}) for frame in frames]
+    return pd.concat(frames, ignore_index=True)
+
+
+if __name__ == "__main__":
+    # Example usage
+    try:
+        fact_table = pd.DataFrame({
+            'loan_amnt': [1000.0, 2500.5, 40000.0],
+            'term': [' 36 months', ' 60 months', ' 36 months'],
+            'home_ownership_id': [1, 2, 1],
+            'fact_id': [1, 2, 3]
+        })
+        compact = compact_fact_table(fact_table)
+        print(compact.dtypes)
+        print(f"Bytes per row: {frame_memory_bytes(fact_table) / len(fact_table):.1f} -> "
+              f"{frame_memory_bytes(compact) / len(compact):.1f}")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Parsed CSV Cache Function
+ฟังก์ชันสำหรับเก็บผลการ parse ไฟล์ CSV เป็นไฟล์ .npy ทีละคอลัมน์ (content-addressed)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import pandas as pd
+import warnings
+from .file_fingerprint import file_fingerprint
+from .columnar_store import store_column, load_column
+warnings.filterwarnings('ignore')
+
+# เปลี่ยนเมื่อรูปแบบไฟล์ใน cache เปลี่ยน (entry เก่าจะไม่ถูกใช้อีก)
+CACHE_VERSION = 1
+
+# ขนาดรวมสูงสุดของ cache ก่อนลบ entry ที่ใช้ล่าสุดนานที่สุด (LRU)
+DEFAULT_MAX_CACHE_BYTES = 1024 ** 3
+
+META_FILE = 'meta.json'
+FINGERPRINT_MEMO = 'fingerprints.json'
+
+
+def _entry_dir(cache_dir, fingerprint, delimiter, has_headers):
+    """path ของ entry จาก hash ของเนื้อหาไฟล์ + ขนาด + mtime + ตัวเลือกการ parse"""
+    key_source = {
+        'version': CACHE_VERSION,
+        'pandas': pd.__version__,
+        'sha256': fingerprint['sha256'],
+        'size': fingerprint['size'],
+        'mtime_ns': fingerprint['mtime_ns'],
+        'delimiter': delimiter,
+        'has_headers': has_headers
+    }
+    key = hashlib.sha256(json.dumps(key_source, sort_keys=True).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, key[:32])
+
+
+def _read_meta(entry_dir):
+    """อ่าน meta.json ของ entry (None ถ้าไม่มีหรือเสีย)"""
+    try:
+        with open(os.path.join(entry_dir, META_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(entry_dir, meta):
+    """เขียน meta.json แบบ atomic"""
+    temp_file = os.path.join(entry_dir, f'{META_FILE}.{os.getpid()}.tmp')
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(temp_file, os.path.join(entry_dir, META_FILE))
+
+
+def _selected_columns(file_columns, usecols):
+    """คอลัมน์ที่ต้องการตามลำดับในไฟล์ (usecols เป็น list, callable หรือ None)"""
+    if usecols is None:
+        return list(file_columns)
+    if callable(usecols):
+        return [column for column in file_columns if usecols(column)]
+    wanted = set(usecols)
+    return [column for column in file_columns if column in wanted]
+
+
+def _directory_size(path):
+    """ขนาดรวมของไฟล์ใน directory"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def _cache_entries(cache_dir):
+    """รายการ entry ทั้งหมดใน cache: [(entry_dir, meta)]"""
+    if not os.path.isdir(cache_dir):
+        return []
+    entries = []
+    for name in os.listdir(cache_dir):
+        entry_dir = os.path.join(cache_dir, name)
+        if os.path.isdir(entry_dir):
+            entries.append((entry_dir, _read_meta(entry_dir)))
+    return entries
+
+
+def invalidate_csv_cache(cache_dir, file_path=None):
+    """
+    ลบ entry ออกจาก cache
+    
+    Args:
+        cache_dir: directory ของ cache
+        file_path: ลบเฉพาะ entry ของไฟล์นี้ (default: None = ลบทั้งหมด)
+    
+    Returns:
+        int: จำนวน entry ที่ลบ
+    """
+    source = None if file_path is None else os.path.abspath(file_path)
+    removed = 0
+    for entry_dir, meta in _cache_entries(cache_dir):
+        if source is None or meta is None or meta.get('source') == source:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def evict_csv_cache(cache_dir, max_bytes=DEFAULT_MAX_CACHE_BYTES, keep=None):
+    """
+    ลบ entry ที่ใช้ล่าสุดนานที่สุดจนขนาดรวมของ cache ไม่เกิน max_bytes
+    
+    Args:
+        cache_dir: directory ของ cache
+        max_bytes: ขนาดรวมสูงสุด (default: DEFAULT_MAX_CACHE_BYTES)
+        keep: entry_dir ที่ห้ามลบ เช่น entry ที่เพิ่งใช้ (default: None)
+    
+    Returns:
+        int: จำนวน entry ที่ลบ
+    """
+    entries = []
+    for entry_dir, _ in _cache_entries(cache_dir):
+        try:
+            last_used = os.path.getmtime(os.path.join(entry_dir, META_FILE))
+        except OSError:
+            last_used = 0
+        entries.append((last_used, entry_dir, _directory_size(entry_dir)))
+    
+    total = sum(size for _, _, size in entries)
+    removed = 0
+    for _, entry_dir, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        if keep is not None and os.path.abspath(entry_dir) == os.path.abspath(keep):
+            continue
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def _prepare_entry(file_path, cache_dir, delimiter, has_headers, usecols, max_bytes):
+    """
+    หา entry ของไฟล์ใน cache และ parse เฉพาะคอลัมน์ที่ยังไม่มีเก็บเพิ่ม
+    
+    Returns:
+        tuple: (entry_dir, meta, columns ที่ต้องการ, DataFrame ของคอลัมน์ที่เก็บไม่ได้ หรือ None)
+    """
+    fingerprint = file_fingerprint(file_path, memo_file=os.path.join(cache_dir, FINGERPRINT_MEMO))
+    entry_dir = _entry_dir(cache_dir, fingerprint, delimiter, has_headers)
+    header = 0 if has_headers else None
+    
+    meta = _read_meta(entry_dir)
+    if meta is None:
+        # ไฟล์เปลี่ยนแล้ว - entry ของเนื้อหาเดิมของ path นี้ใช้ไม่ได้อีก
+        for stale_dir, stale_meta in _cache_entries(cache_dir):
+            if (stale_meta is not None and stale_meta.get('source') == fingerprint['path']
+                    and stale_meta.get('fingerprint') != fingerprint):
+                shutil.rmtree(stale_dir, ignore_errors=True)
+        file_columns = pd.read_csv(file_path, sep=delimiter, header=header, nrows=0).columns.tolist()
+        meta = {'source': fingerprint['path'], 'fingerprint': fingerprint, 'delimiter': delimiter,
+                'has_headers': has_headers, 'file_columns': file_columns, 'rows': None, 'columns': {}}
+        os.makedirs(entry_dir, exist_ok=True)
+    
+    columns = _selected_columns(meta['file_columns'], usecols)
+    missing = [column for column in columns if str(meta['file_columns'].index(column)) not in meta['columns']]
+    uncached = None
+    
+    if missing:
+        parsed = pd.read_csv(file_path, sep=delimiter, low_memory=False, header=header, usecols=missing)
+        meta['rows'] = len(parsed)
+        stored = []
+        for column in missing:
+            name = str(meta['file_columns'].index(column))
+            info = store_column(entry_dir, name, parsed[column])
+            if info is not None:
+                meta['columns'][name] = info
+                stored.append(column)
+        unstored = [column for column in missing if column not in stored]
+        uncached = parsed[unstored] if unstored else None
+    
+    # เขียน meta ทุกครั้งที่ใช้ (mtime ของ meta.json = เวลาใช้ล่าสุดสำหรับ LRU)
+    _write_meta(entry_dir, meta)
+    if missing:
+        evict_csv_cache(cache_dir, max_bytes, keep=entry_dir)
+    
+    return entry_dir, meta, columns, uncached
+
+
+def _frame_from_entry(entry_dir, meta, columns, uncached, mmap_mode, start=None, stop=None, uniques_cache=None):
+    """สร้าง DataFrame จากคอลัมน์ใน entry (แถว start:stop)"""
+    data = {}
+    for column in columns:
+        name = str(meta['file_columns'].index(column))
+        if name in meta['columns']:
+            data[column] = load_column(entry_dir, name, meta['columns'][name], mmap_mode,
+                                        start, stop, uniques_cache)
+        else:
+            data[column] = uncached[column].iloc[start:stop].to_numpy()
+    
+    start = start or 0
+    stop = meta['rows'] or 0 if stop is None else stop
+    return pd.DataFrame(data, index=pd.RangeIndex(start, stop), copy=False)
+
+
+def _cached_chunks(entry_dir, meta, columns, uncached, mmap_mode, chunksize):
+    """อ่าน entry ทีละ chunk (แปลงข้อความกลับเฉพาะแถวของ chunk)"""
+    uniques_cache = {}
+    rows = meta['rows'] or 0
+    for start in range(0, rows, chunksize):
+        yield _frame_from_entry(entry_dir, meta, columns, uncached, mmap_mode,
+                                start, min(start + chunksize, rows), uniques_cache)
+
+
+def read_csv_cached(file_path, cache_dir, delimiter=',', has_headers=True, usecols=None, chunksize=None,
+                    mmap_mode='r', max_bytes=DEFAULT_MAX_CACHE_BYTES):
+    """
+    อ่านไฟล์ CSV ผ่าน cache แบบ columnar
+    
+    key ของ cache คือ sha256 + ขนาด + mtime ของไฟล์ รวมกับ delimiter / header และเวอร์ชันของ
+    pandas คอลัมน์ถูกเก็บแยกไฟล์ .npy ครั้งถัดไปจึงโหลดได้ทันที (คอลัมน์ตัวเลขถูก memory-map
+    แทนการอ่านทั้งไฟล์) และถ้าขอคอลัมน์ที่ยังไม่มีจะ parse เฉพาะคอลัมน์นั้นเพิ่มเข้า entry เดิม
+    
+    Args:
+        file_path: path ของไฟล์ CSV
+        cache_dir: directory ของ cache
+        delimiter: ตัวแบ่งคอลัมน์ (default: ',')
+        has_headers: มี header หรือไม่ (default: True)
+        usecols: list หรือ callable ของคอลัมน์ที่ต้องการ (default: None = ทุกคอลัมน์)
+        chunksize: จำนวนแถวต่อ chunk (default: None = ทั้งไฟล์)
+        mmap_mode: mode ของ np.load สำหรับคอลัมน์ตัวเลข (default: 'r' = memory-map อ่านอย่างเดียว)
+        max_bytes: ขนาดรวมสูงสุดของ cache (default: DEFAULT_MAX_CACHE_BYTES)
+    
+    Returns:
+        DataFrame หรือ iterator ของ DataFrame ทีละ chunk เมื่อกำหนด chunksize
+    """
+    entry_dir, meta, columns, uncached = _prepare_entry(file_path, cache_dir, delimiter, has_headers,
+                                                        usecols, max_bytes)
+    if chunksize is not None:
+        return _cached_chunks(entry_dir, meta, columns, uncached, mmap_mode, chunksize)
+    return _frame_from_entry(entry_dir, meta, columns, uncached, mmap_mode)
+
+
+if __name__ == "__main__":
+    # Example usage
+    file_path = '../dataops-foundation-jenkins/data/LoanStats_web_small.csv'
+    
+    try:
+        df = read_csv_cached(file_path, '.etl_cache')
+        print(f"Loaded data: {len(df):,} rows, {len(df.columns)} columns")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Database Engine Function
+ฟังก์ชันสำหรับสร้าง SQLAlchemy engine แบบมี connection pool และใช้ซ้ำข้ามการเรียก
+"""
+
+import threading
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+import warnings
+warnings.filterwarnings('ignore')
+
+# ขนาด connection pool (พอสำหรับโหลดทุกตารางของ Star Schema พร้อมกัน)
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 5
+
+# เวลา (วินาที) ก่อน connection ใน pool ถูกสร้างใหม่
+DEFAULT_POOL_RECYCLE = 1800
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(database_url, pool_size=DEFAULT_POOL_SIZE, max_overflow=DEFAULT_MAX_OVERFLOW,
+               pool_recycle=DEFAULT_POOL_RECYCLE):
+    """
+    คืน engine ของ database_url (สร้างครั้งแรกครั้งเดียว แล้วใช้ซ้ำในการเรียกครั้งถัดไปของ process)
+    
+    engine มี pool_pre_ping (ตรวจ connection ที่ค้างใน pool ก่อนใช้) และเปิด fast_executemany
+    เมื่อใช้ driver pyodbc - SQLite ใช้ pool ตามค่า default ของ SQLAlchemy
+    
+    Args:
+        database_url: SQLAlchemy URL
+        pool_size: จำนวน connection ที่เก็บไว้ใน pool (default: DEFAULT_POOL_SIZE)
+        max_overflow: จำนวน connection ที่เปิดเพิ่มได้ชั่วคราว (default: DEFAULT_MAX_OVERFLOW)
+        pool_recycle: อายุสูงสุดของ connection เป็นวินาที (default: DEFAULT_POOL_RECYCLE)
+    
+    Returns:
+        SQLAlchemy engine
+    """
+    url = make_url(database_url)
+    key = (url.render_as_string(hide_password=False), pool_size, max_overflow, pool_recycle)
+    
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            options = {}
+            if url.get_backend_name() != 'sqlite':
+                options.update(pool_size=pool_size, max_overflow=max_overflow, pool_recycle=pool_recycle,
+                               pool_pre_ping=True)
+            if url.get_driver_name() == 'pyodbc':
+                options['fast_executemany'] = True
+            engine = create_engine(url, **options)
+            _engines[key] = engine
+    return engine
+
+
+def dispose_engines():
+    """
+    ปิด connection ทั้งหมดของ engine ที่สร้างด้วย get_engine() และล้าง cache
+    
+    Returns:
+        int: จำนวน engine ที่ปิด
+    """
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.dispose()
+    return len(engines)
+
+
+if __name__ == "__main__":
+    # Example usage
+    from sqlalchemy import text
+    
+    try:
+        engine = get_engine('sqlite://')
+        with engine.connect() as connection:
+            print(f"SELECT 1 -> {connection.execute(text('SELECT 1')).scalar()}")
+        print(f"Same engine on the next call: {get_engine('sqlite://') is engine}")
+        print(f"Disposed {dispose_engines()} engines")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+File Fingerprint Function
+ฟังก์ชันสำหรับสร้างลายนิ้วมือ (sha256 + ขนาด + mtime) ของไฟล์ข้อมูล
+"""
+
+import hashlib
+import json
+import os
+
+# ขนาด block ที่อ่านต่อครั้งตอนคำนวณ hash
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _sha256(file_path):
+    """คำนวณ sha256 ของไฟล์ทีละ block"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_fingerprint(file_path, memo_file=None):
+    """
+    สร้าง fingerprint ของไฟล์สำหรับใช้เป็น key ของ cache / manifest
+    
+    ถ้ากำหนด memo_file จะจำ sha256 ของแต่ละ path ไว้ และใช้ค่าเดิมเมื่อขนาดและ mtime
+    ของไฟล์ไม่เปลี่ยน (ไม่ต้องอ่านไฟล์ทั้งไฟล์ซ้ำทุกครั้ง)
+    
+    Args:
+        file_path: path ของไฟล์
+        memo_file: path ของไฟล์ JSON ที่เก็บ hash ที่คำนวณไว้ (default: None = คำนวณใหม่ทุกครั้ง)
+    
+    Returns:
+        dict: {'path': absolute path, 'size': ขนาด (bytes), 'mtime_ns': เวลาแก้ไข, 'sha256': hash ของเนื้อหา}
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    fingerprint = {'path': path, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    
+    memo = {}
+    if memo_file is not None and os.path.exists(memo_file):
+        try:
+            with open(memo_file, 'r', encoding='utf-8') as f:
+                memo = json.load(f)
+        except (OSError, ValueError):
+            memo = {}
+    
+    known = memo.get(path)
+    if known and known.get('size') == fingerprint['size'] and known.get('mtime_ns') == fingerprint['mtime_ns']:
+        fingerprint['sha256'] = known['sha256']
+        return fingerprint
+    
+    fingerprint['sha256'] = _sha256(path)
+    
+    if memo_file is not None:
+        memo[path] = fingerprint
+        os.makedirs(os.path.dirname(os.path.abspath(memo_file)), exist_ok=True)
+        temp_file = f'{memo_file}.{os.getpid()}.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(memo, f, indent=2)
+        os.replace(temp_file, memo_file)
+    
+    return fingerprint
+
+
+if __name__ == "__main__":
+    # Example usage
+    file_path = '../dataops-foundation-jenkins/data/LoanStats_web_small.csv'
+    
+    try:
+        print(file_fingerprint(file_path))
+    except Exception as e:
+        print(f"Error: {e}")
@@ -9,10 +9,45 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import warnings
+from .parse_date_column import parse_date_column
 warnings.filterwarnings('ignore')
 
 
-def filter_issue_date_range(df: pd.DataFrame, date_column: str = 'issue_d', min_year: int = 2016, max_year: int = 2019) -> pd.DataFrame:
+def issue_date_in_range(dates, min_year: int = 2016, max_year: int = 2019, use_date_cache: bool = True) -> pd.Series:
+    """
+    คืน mask ของแถวที่วันที่อยู่ในช่วงปีที่กำหนด โดยไม่ copy หรือแปลงคอลัมน์อื่น
+    
+    ใช้เป็น predicate ระหว่างอ่านไฟล์ได้ (เช่น row_filter ของ load_data()) เพราะ parse
+    เฉพาะ unique values ของข้อความวันที่ดิบ ความหมายเหมือน filter_issue_date_range():
+    ค่าว่างไม่ผ่าน และถ้าแปลงวันที่ไม่ได้จะคงทุกแถวไว้
+    
+    Args:
+        dates: Series ของวันที่ (ข้อความดิบ, category หรือ datetime)
+        min_year: ปีขั้นต่ำ (default: 2016)
+        max_year: ปีสูงสุด (default: 2019)
+        use_date_cache: เก็บผลการแปลงวันที่ใน LRU cache ระดับ process (default: True)
+        
+    Returns:
+        Series ของ bool (index เดียวกับ dates)
+    """
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        if dates.isna().all():
+            # chunk ที่ไม่มีวันที่เลยถูกอ่านเป็นตัวเลข - ไม่มีแถวใดอยู่ในช่วง
+            return pd.Series(False, index=dates.index)
+        if not (pd.api.types.is_object_dtype(dates.dtype) or pd.api.types.is_string_dtype(dates.dtype)
+                or isinstance(dates.dtype, pd.CategoricalDtype)):
+            return pd.Series(True, index=dates.index)
+        try:
+            dates = parse_date_column(dates, date_format='%b-%Y', use_cache=use_date_cache)
+        except ValueError:
+            return pd.Series(True, index=dates.index)
+    
+    years = dates.dt.year
+    return (years >= min_year) & (years <= max_year)
+
+
+def filter_issue_date_range(df: pd.DataFrame, date_column: str = 'issue_d', min_year: int = 2016, max_year: int = 2019,
+                            verbose: bool = True, use_date_cache: bool = True) -> pd.DataFrame:
     """
     กรองข้อมูลตามช่วงปีที่กำหนด (default: 2016-2019)
     
@@ -21,6 +56,8 @@ def filter_issue_date_range(df: pd.DataFrame, date_column: str = 'issue_d', min_
         date_column: ชื่อคอลัมน์วันที่ (default: 'issue_d')
         min_year: ปีขั้นต่ำ (default: 2016)
         max_year: ปีสูงสุด (default: 2019)
+        verbose: แสดงสรุปจำนวนแถวที่ถูกกรอง (default: True)
+        use_date_cache: เก็บผลการแปลงวันที่ใน LRU cache ระดับ process (default: True)
         
     Returns:
         DataFrame ที่กรองตามช่วงปีแล้ว
@@ -31,29 +68,30 @@ def filter_issue_date_range(df: pd.DataFrame, date_column: str = 'issue_d', min_
     
     original_rows = len(df)
     
-    # แปลงเป็น datetime ถ้ายังไม่ได้แปลง
-    if not pd.api.types.is_datetime64_any_dtype(df[date_column]):
-        if df[date_column].dtype == 'object':
+    # แปลงเป็น datetime ถ้ายังไม่ได้แปลง (parse เฉพาะ unique values แล้ว map กลับ)
+    dates = df[date_column]
+    converted = False
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        if (pd.api.types.is_object_dtype(dates.dtype) or pd.api.types.is_string_dtype(dates.dtype)
+                or isinstance(dates.dtype, pd.CategoricalDtype)):
             try:
-                df = df.copy()
-                df[date_column] = pd.to_datetime(df[date_column], format='%b-%Y')
-            except:
-                try:
-                    df[date_column] = pd.to_datetime(df[date_column])
-                except:
-                    print(f"Error: Cannot convert {date_column} to datetime")
-                    return df
+                dates = parse_date_column(dates, date_format='%b-%Y', use_cache=use_date_cache)
+                converted = True
+            except ValueError:
+                print(f"Error: Cannot convert {date_column} to datetime")
+                return df
     
-    # กรองตามช่วงปี
-    df_filtered = df[
-        (df[date_column].dt.year >= min_year) & 
-        (df[date_column].dt.year <= max_year)
-    ].copy()
+    # กรองตามช่วงปี (copy เฉพาะแถวที่ผ่านเงื่อนไข)
+    years = dates.dt.year
+    in_range = (years >= min_year) & (years <= max_year)
+    df_filtered = df[in_range].copy()
+    if converted:
+        df_filtered[date_column] = dates[in_range]
     
     filtered_rows = len(df_filtered)
     removed_rows = original_rows - filtered_rows
     
-    if removed_rows > 0:
+    if removed_rows > 0 and verbose:
         print(f"Date filtering: removed {removed_rows:,} rows outside {min_year}-{max_year}")
         print(f"Remaining records: {filtered_rows:,} ({filtered_rows/original_rows*100:.1f}%)")
     
@@ -5,51 +5,351 @@ Column Type Guessing Function
 ฟังก์ชันสำหรับเดาประเภทข้อมูลของแต่ละคอลัมน์จากไฟล์ CSV
 """
 
+import hashlib
+import json
+import os
 import re
+import multiprocessing
 import pandas as pd
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from .file_fingerprint import file_fingerprint
+from .load_data import load_data
+from .sample_csv_rows import sample_csv_rows
 warnings.filterwarnings('ignore')
 
+# Compiled once; same prefix patterns (re.match semantics) as the original per-value checks
+DATETIME_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
 
-def guess_column_types(file_path, delimiter=',', has_headers=True):
+# จำนวน unique values ที่ตรวจต่อรอบ (หยุดทันทีเมื่อเจอค่าที่ไม่ตรง pattern)
+MATCH_BATCH_SIZE = 4096
+
+# DataFrame ที่ process ลูกของ _infer_column_types(workers=) อ่านร่วมกันหลัง fork
+_SHARED_FRAME = None
+
+# เปลี่ยนเมื่อกฎการเดาประเภทเปลี่ยน (ผลที่จำไว้บน disk จะไม่ถูกใช้อีก)
+TYPES_MEMO_VERSION = 1
+
+# จำนวนผลลัพธ์สูงสุดที่จำไว้ (LRU) ทั้งในหน่วยความจำของ process และใน memo_dir
+TYPES_MEMO_SIZE = 256
+
+FINGERPRINT_MEMO = 'fingerprints.json'
+
+# ผลลัพธ์ที่จำไว้ใน process: (path, size, mtime_ns, options) -> (column_types, confidence)
+_TYPES_MEMO = OrderedDict()
+
+
+def _all_values_match(values, pattern):
     """
-    เดาประเภทข้อมูลของแต่ละคอลัมน์จากไฟล์ CSV
+    ตรวจว่าทุกค่าใน Series (string) ตรงกับ pattern แบบ vectorized ทีละ batch
     
-    Args:
-        file_path: path ของไฟล์ CSV
-        delimiter: ตัวแบ่งคอลัมน์ (default: ',')
-        has_headers: มี header หรือไม่ (default: True)
-        
     Returns:
-        tuple: (success: bool, result: dict หรือ error_message: str)
+        bool: True ถ้าทุกค่าตรง pattern (หยุดที่ batch แรกที่มีค่าไม่ตรง)
+    """
+    for start in range(0, len(values), MATCH_BATCH_SIZE):
+        batch = values.iloc[start:start + MATCH_BATCH_SIZE]
+        if not batch.str.match(pattern).all():
+            return False
+    return True
+
+
+def _detect_date_type(series):
+    """
+    ตรวจรูปแบบวันที่/เวลาของคอลัมน์โดยตรวจเฉพาะ unique values
+    
+    ให้ผลเหมือนการเรียก re.match กับทุกค่า (รวมถึงกรณีคอลัมน์ว่างทั้งหมด
+    ที่ all() คืนค่า True และได้ 'datetime64')
+    
+    Returns:
+        'datetime64', 'date' หรือ None ถ้าไม่ใช่รูปแบบวันที่
+    """
+    # str() ของตัวเลข/boolean ไม่มีทางขึ้นต้นด้วย YYYY-MM-DD
+    if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return 'datetime64' if series.isna().all() else None
+    
+    # str() ของ Timestamp อยู่ในรูป 'YYYY-MM-DD HH:MM:SS' เสมอ
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 'datetime64'
+    
+    # ตรวจค่าช่วงแรกก่อน เพื่อหยุดได้ทันทีโดยไม่ต้อง hash ทั้งคอลัมน์
+    head = series.iloc[:MATCH_BATCH_SIZE].dropna().astype(str)
+    if not _all_values_match(head, DATE_PATTERN):
+        return None
+    
+    uniques = pd.Series(series.unique()).dropna()
+    if len(uniques) == 0:
+        return 'datetime64'
+    uniques = uniques.astype(str)
+    
+    # datetime pattern ขึ้นต้นด้วย date pattern จึงตรวจ date ก่อนแล้วค่อยตรวจ datetime
+    if not _all_values_match(uniques, DATE_PATTERN):
+        return None
+    if _all_values_match(uniques, DATETIME_PATTERN):
+        return 'datetime64'
+    return 'date'
+
+
+def _infer_column_type(series):
+    """เดาประเภทข้อมูลของคอลัมน์เดียว"""
+    # Check "YYYY-MM-DD HH:MM:SS" / "YYYY-MM-DD" formats on unique values only
+    date_type = _detect_date_type(series)
+    
+    # Assign data type based on format detection
+    if date_type is not None:
+        return date_type
+    return pd.api.types.infer_dtype(series, skipna=True)
+
+
+def _infer_inherited_batch(positions):
+    """งานของแต่ละ process: เดาประเภทของคอลัมน์ตามตำแหน่งใน DataFrame ที่ได้รับต่อมาตอน fork"""
+    return [(position, _infer_column_type(_SHARED_FRAME.iloc[:, position])) for position in positions]
+
+
+def _infer_column_types(df, workers=None):
     """
+    เดาประเภทข้อมูลของทุกคอลัมน์ใน DataFrame
+    
+    เมื่อ workers > 1 แบ่งคอลัมน์เป็น workers กลุ่ม (สลับกันเพื่อให้แต่ละกลุ่มมีคอลัมน์หลายแบบ)
+    แล้วเดาพร้อมกันบน process pool แบบ fork: process ลูกเห็นหน้าหน่วยความจำของ DataFrame เดียวกัน
+    (copy-on-write) จึงส่งไปเพียงตำแหน่งคอลัมน์ ไม่ต้อง pickle หรือคัดลอกข้อมูล
+    (ระบบที่ไม่มี fork จะตรวจทีละคอลัมน์ตามปกติ)
+    """
+    global _SHARED_FRAME
+    
+    if (not workers or workers <= 1 or len(df.columns) < 2
+            or 'fork' not in multiprocessing.get_all_start_methods()):
+        return {column: _infer_column_type(df[column]) for column in df.columns}
+    
+    n_batches = min(workers, len(df.columns))
+    batches = [range(i, len(df.columns), n_batches) for i in range(n_batches)]
+    _SHARED_FRAME = df
     try:
-        # Read the CSV file using the specified delimiter and header settings
-        df = pd.read_csv(file_path, sep=delimiter, low_memory=False, header=0 if has_headers else None)
+        with ProcessPoolExecutor(max_workers=n_batches, mp_context=multiprocessing.get_context('fork')) as executor:
+            inferred = dict(pair for batch in executor.map(_infer_inherited_batch, batches) for pair in batch)
+    finally:
+        _SHARED_FRAME = None
+    
+    return {column: inferred[position] for position, column in enumerate(df.columns)}
+
+
+def _sample_confidence(sample_df, is_complete):
+    """
+    ความมั่นใจของประเภทข้อมูลที่เดาจากตัวอย่าง (0.0 - 1.0)
+    
+    ใช้ rule of three: เมื่อค่า non-null n ค่าในตัวอย่างสอดคล้องกันทั้งหมด
+    สัดส่วนค่าที่อาจขัดแย้งในทั้งไฟล์มีขอบบน (95%) ประมาณ 3/n
+    """
+    if is_complete:
+        return {column: 1.0 for column in sample_df.columns}
+    non_null_counts = sample_df.count()
+    return {column: max(0.0, 1.0 - 3.0 / n) if n > 0 else 0.0 for column, n in non_null_counts.items()}
 
-        # Initialize a dictionary to store column data types
-        column_types = {}
 
-        # Loop through columns and infer data types
-        for column in df.columns:
-            # Check for datetime format "YYYY-MM-DD HH:MM:SS"
-            is_datetime = all(re.match(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', str(value)) for value in df[column].dropna())
+def _sample_frame(df, sample_size, sample_strategy, random_state):
+    """สุ่มตัวอย่างแถวจาก DataFrame ที่โหลดไว้แล้ว (strategy เดียวกับการสุ่มจากไฟล์)"""
+    if len(df) <= sample_size:
+        return df, True
+    if sample_strategy == 'head':
+        return df.iloc[:sample_size], False
+    if sample_strategy == 'reservoir':
+        return df.sample(n=sample_size, random_state=random_state).sort_index(), False
+    step = len(df) / sample_size
+    return df.iloc[[int(i * step) for i in range(sample_size)]], False
 
-            # Check for date format "YYYY-MM-DD"
-            is_date = all(re.match(r'\d{4}-\d{2}-\d{2}', str(value)) for value in df[column].dropna())
 
-            # Assign data type based on format detection
-            if is_datetime:
-                inferred_type = 'datetime64'
-            elif is_date:
-                inferred_type = 'date'
+def clear_column_types_memo(memo_dir=None):
+    """
+    ล้างผลลัพธ์ของ guess_column_types() ที่จำไว้ใน process (และใน memo_dir ถ้ากำหนด)
+    
+    Returns:
+        int: จำนวนไฟล์ผลลัพธ์ที่ลบจาก memo_dir
+    """
+    _TYPES_MEMO.clear()
+    removed = 0
+    if memo_dir is not None and os.path.isdir(memo_dir):
+        for name in os.listdir(memo_dir):
+            if name.endswith('.json') and name != FINGERPRINT_MEMO:
+                os.remove(os.path.join(memo_dir, name))
+                removed += 1
+    return removed
+
+
+def _memo_options(delimiter, has_headers, sample_size, sample_strategy, verify_threshold, random_state):
+    """ตัวเลือกที่เปลี่ยนผลของ guess_column_types() (workers ไม่เปลี่ยนผลจึงไม่อยู่ใน key)"""
+    options = {'delimiter': delimiter, 'has_headers': has_headers, 'sample_size': sample_size}
+    if sample_size is not None:
+        options.update(sample_strategy=sample_strategy, verify_threshold=verify_threshold, random_state=random_state)
+    return options
+
+
+def _memo_file(memo_dir, fingerprint, options):
+    """ไฟล์ผลลัพธ์ใน memo_dir จาก hash ของ path + ขนาด + mtime + sha256 ของเนื้อหา + ตัวเลือก"""
+    key_source = dict(fingerprint, version=TYPES_MEMO_VERSION, pandas=pd.__version__, options=options)
+    key = hashlib.sha256(json.dumps(key_source, sort_keys=True).encode('utf-8')).hexdigest()
+    return os.path.join(memo_dir, f'{key[:32]}.json')
+
+
+def _read_memo_file(path):
+    """อ่านผลลัพธ์จาก memo_dir และ touch ไฟล์ (mtime = เวลาใช้ล่าสุดสำหรับ LRU) - None ถ้าไม่มีหรือเสีย"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        os.utime(path)
+        return dict(map(tuple, entry['column_types'])), dict(map(tuple, entry['confidence']))
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _write_memo_file(memo_dir, path, column_types, confidence):
+    """
+    เขียนผลลัพธ์ลง memo_dir แบบ atomic แล้วลบไฟล์ที่ใช้ล่าสุดนานที่สุดเมื่อเกิน TYPES_MEMO_SIZE
+    
+    เก็บเป็นรายการคู่ (ชื่อคอลัมน์, ค่า) เพื่อให้ชื่อคอลัมน์ที่เป็นตัวเลข (has_headers=False) ไม่กลายเป็น string
+    """
+    temp_file = f'{path}.{os.getpid()}.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump({'column_types': list(column_types.items()), 'confidence': list(confidence.items())}, f)
+    os.replace(temp_file, path)
+    
+    entries = []
+    for name in os.listdir(memo_dir):
+        if name.endswith('.json') and name != FINGERPRINT_MEMO:
+            try:
+                entries.append((os.path.getmtime(os.path.join(memo_dir, name)), name))
+            except OSError:
+                pass
+    for _, name in sorted(entries)[:max(0, len(entries) - TYPES_MEMO_SIZE)]:
+        try:
+            os.remove(os.path.join(memo_dir, name))
+        except OSError:
+            pass
+
+
+def _remember_types(memo_key, column_types, confidence):
+    """จำผลลัพธ์ไว้ใน process และลบผลที่ใช้ล่าสุดนานที่สุดเมื่อเกิน TYPES_MEMO_SIZE"""
+    _TYPES_MEMO[memo_key] = (column_types, confidence)
+    _TYPES_MEMO.move_to_end(memo_key)
+    while len(_TYPES_MEMO) > TYPES_MEMO_SIZE:
+        _TYPES_MEMO.popitem(last=False)
+
+
+def _guess_column_types(file_path, delimiter, has_headers, sample_size, sample_strategy, verify_threshold,
+                        random_state, workers):
+    """เดาประเภทข้อมูล (ไม่ใช้ memo) - คืน (column_types, confidence)"""
+    is_frame = isinstance(file_path, pd.DataFrame)
+    
+    if sample_size is None:
+        # Reuse an already-loaded frame, otherwise read the CSV file once
+        df = file_path if is_frame else load_data(file_path, delimiter=delimiter, has_headers=has_headers)
+        column_types = _infer_column_types(df, workers)
+        return column_types, {column: 1.0 for column in column_types}
+    
+    if is_frame:
+        sample_df, is_complete = _sample_frame(file_path, sample_size, sample_strategy, random_state)
+    else:
+        sample_df, is_complete = sample_csv_rows(file_path, sample_size=sample_size,
+                                                 strategy=sample_strategy, delimiter=delimiter,
+                                                 has_headers=has_headers, random_state=random_state)
+    column_types = _infer_column_types(sample_df, workers)
+    confidence = _sample_confidence(sample_df, is_complete)
+    
+    # Fully check only the columns whose sample was not convincing
+    if verify_threshold is not None:
+        low_confidence = [column for column, value in confidence.items() if value < verify_threshold]
+        if low_confidence:
+            if is_frame:
+                verify_df = file_path[low_confidence]
             else:
-                inferred_type = pd.api.types.infer_dtype(df[column], skipna=True)
+                verify_df = load_data(file_path, delimiter=delimiter, has_headers=has_headers,
+                                      usecols=low_confidence)
+            column_types.update(_infer_column_types(verify_df, workers))
+            confidence.update({column: 1.0 for column in low_confidence})
+    return column_types, confidence
+
+
+def _memoized_guess(file_path, options, memoize, memo_dir, guess):
+    """
+    คืนผลของ guess() จาก memo ถ้าไฟล์ไม่เปลี่ยน ไม่เช่นนั้นเดาใหม่แล้วจำไว้
+    
+    memo ใน process ใช้ key เป็น path + ขนาด + mtime (ไม่อ่านไฟล์เลย) ส่วน memo_dir ใช้ fingerprint
+    ที่มี sha256 ของเนื้อหาด้วย (sha256 ถูกจำไว้ใน memo_dir/fingerprints.json ตามขนาด + mtime)
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    memo_key = (path, stat.st_size, stat.st_mtime_ns, json.dumps(options, sort_keys=True))
+    if memoize and memo_key in _TYPES_MEMO:
+        _TYPES_MEMO.move_to_end(memo_key)
+        return _TYPES_MEMO[memo_key]
+    
+    result = None
+    if memo_dir is not None:
+        os.makedirs(memo_dir, exist_ok=True)
+        fingerprint = file_fingerprint(path, memo_file=os.path.join(memo_dir, FINGERPRINT_MEMO))
+        memo_file = _memo_file(memo_dir, fingerprint, options)
+        result = _read_memo_file(memo_file)
+    
+    if result is None:
+        result = guess()
+        if memo_dir is not None:
+            _write_memo_file(memo_dir, memo_file, *result)
+    
+    if memoize:
+        _remember_types(memo_key, *result)
+    return result
 
-            column_types[column] = inferred_type
 
+def guess_column_types(file_path, delimiter=',', has_headers=True, sample_size=None, sample_strategy='head',
+                       verify_threshold=None, random_state=42, return_confidence=False, workers=None,
+                       memoize=False, memo_dir=None):
+    """
+    เดาประเภทข้อมูลของแต่ละคอลัมน์จากไฟล์ CSV หรือ DataFrame ที่โหลดไว้แล้ว
+    
+    เมื่อกำหนด sample_size จะเดาจากแถวตัวอย่างเท่านั้น (ดู sample_csv_rows) และคำนวณ
+    ความมั่นใจรายคอลัมน์ ถ้ากำหนด verify_threshold คอลัมน์ที่ความมั่นใจต่ำกว่าค่านี้
+    จะถูกตรวจซ้ำจากข้อมูลทั้งหมด (อ่านเฉพาะคอลัมน์เหล่านั้น)
+    
+    Args:
+        file_path: path ของไฟล์ CSV หรือ DataFrame ที่โหลดไว้แล้ว (จะไม่อ่านไฟล์ซ้ำ)
+        delimiter: ตัวแบ่งคอลัมน์ (default: ',') - ใช้เมื่อส่ง path เท่านั้น
+        has_headers: มี header หรือไม่ (default: True) - ใช้เมื่อส่ง path เท่านั้น
+        sample_size: จำนวนแถวตัวอย่าง (default: None = ตรวจทุกแถว)
+        sample_strategy: 'head', 'reservoir' หรือ 'stratified' (default: 'head')
+        verify_threshold: ตรวจซ้ำทั้งคอลัมน์ถ้าความมั่นใจ < ค่านี้ (default: None = ไม่ตรวจซ้ำ)
+        random_state: seed สำหรับการสุ่ม (default: 42)
+        return_confidence: คืนค่าความมั่นใจรายคอลัมน์ด้วย (default: False)
+        workers: จำนวน process ที่เดาประเภทพร้อมกันทีละกลุ่มคอลัมน์ (ใช้หน่วยความจำของ DataFrame ร่วมกัน)
+            คุ้มกับไฟล์ที่มีหลายคอลัมน์และหลายแถว (default: None = ตรวจทีละคอลัมน์ใน process นี้)
+        memoize: จำผลลัพธ์ใน process (LRU) ตาม path + ขนาด + mtime + ตัวเลือก - เรียกซ้ำกับไฟล์ที่ไม่เปลี่ยน
+            คืนผลทันทีโดยไม่อ่านไฟล์ (default: False) - ใช้เมื่อส่ง path เท่านั้น
+        memo_dir: directory ที่จำผลลัพธ์ข้าม process (LRU) ตาม path + ขนาด + mtime + sha256 ของเนื้อหา
+            + ตัวเลือก (default: None = ไม่จำลง disk) - ใช้เมื่อส่ง path เท่านั้น
+    
+    Returns:
+        tuple: (success: bool, result: dict หรือ error_message: str)
+        หรือ (success, result, confidence: dict) เมื่อ return_confidence=True
+    """
+    try:
+        def guess():
+            return _guess_column_types(file_path, delimiter, has_headers, sample_size, sample_strategy,
+                                       verify_threshold, random_state, workers)
+        
+        if isinstance(file_path, pd.DataFrame) or not (memoize or memo_dir is not None):
+            column_types, confidence = guess()
+        else:
+            options = _memo_options(delimiter, has_headers, sample_size, sample_strategy, verify_threshold,
+                                    random_state)
+            column_types, confidence = _memoized_guess(file_path, options, memoize, memo_dir, guess)
+            # คืนสำเนา - ผู้เรียกแก้ dict ได้โดยไม่กระทบผลที่จำไว้
+            column_types, confidence = dict(column_types), dict(confidence)
+        
+        if return_confidence:
+            return (True, column_types, confidence)
         return (True, column_types)  # Return success and column types
     except Exception as e:
+        if return_confidence:
+            return (False, str(e), {})
         return (False, str(e))  # Return error message
 
 
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Key Registry Functions
+ฟังก์ชันสำหรับเก็บ natural key -> surrogate id ของแต่ละ dimension บนดิสก์ (id คงเดิมข้ามการรัน)
+"""
+
+import json
+import os
+import shutil
+import warnings
+from contextlib import contextmanager
+from .columnar_store import save_frame, load_frame, LAYOUT_FILE
+from .build_dimension import dimension_key_index
+warnings.filterwarnings('ignore')
+
+try:
+    import fcntl
+except ImportError:  # Windows: ไม่มี flock - ผู้เรียกต้องไม่รันพร้อมกันบน registry เดียวกันเอง
+    fcntl = None
+
+LOCK_FILE = '.lock'
+
+
+@contextmanager
+def key_registry_lock(registry_dir):
+    """
+    ล็อก registry แบบ exclusive (flock บน registry_dir/.lock) ตลอดรอบ load -> assign -> save
+    
+    การรันพร้อมกันบน registry เดียวกัน (เช่น Jenkins สอง build ใน workspace เดียว) ต้องรอกันที่นี่
+    ไม่เช่นนั้นทั้งสองรอบอ่าน key ชุดเดิม ให้ id ถัดไปเดียวกันกับค่าใหม่ที่ต่างกัน และรอบที่ save ทีหลังทับอีกรอบ
+    
+    Args:
+        registry_dir: directory ของ key registry (สร้างให้ถ้ายังไม่มี) หรือ None = ไม่ล็อก
+    """
+    if registry_dir is None:
+        yield
+        return
+    os.makedirs(registry_dir, exist_ok=True)
+    with open(os.path.join(registry_dir, LOCK_FILE), 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _registry_path(registry_dir, name):
+    """directory ของ registry ของ dimension หนึ่ง"""
+    return os.path.join(os.path.abspath(registry_dir), name)
+
+
+def _stored_rows(path):
+    """จำนวน key ที่บันทึกไว้ หรือ None ถ้ายังไม่มี registry"""
+    layout_file = os.path.join(path, LAYOUT_FILE)
+    if not os.path.exists(layout_file):
+        return None
+    with open(layout_file, 'r', encoding='utf-8') as f:
+        return json.load(f)['rows']
+
+
+def load_key_registry(registry_dir, name):
+    """
+    โหลด key ของ dimension ที่บันทึกไว้ (id = ตำแหน่ง + 1 แบบเดียวกับ assign_surrogate_keys())
+    
+    Args:
+        registry_dir: directory ของ key registry
+        name: ชื่อ dimension
+    
+    Returns:
+        pd.Index / pd.MultiIndex ของ key หรือ None ถ้ายังไม่มี registry ของ dimension นี้
+    """
+    path = _registry_path(registry_dir, name)
+    if _stored_rows(path) is None:
+        return None
+    keys = load_frame(path, mmap_mode=None)
+    return dimension_key_index(keys, list(keys.columns))
+
+
+def save_key_registry(registry_dir, name, known_keys):
+    """
+    บันทึก key ของ dimension แทน registry เดิมแบบ atomic
+    
+    ต้องเรียกภายใน key_registry_lock() เดียวกับ load_key_registry() ที่ได้ key เดิมมา
+    
+    registry เพิ่มได้อย่างเดียว (key เดิมอยู่ตำแหน่งเดิมเสมอ) ถ้าจำนวน key เท่าที่บันทึกไว้
+    แสดงว่าไม่มี key ใหม่จึงไม่เขียนซ้ำ
+    
+    Args:
+        registry_dir: directory ของ key registry (สร้างให้ถ้ายังไม่มี)
+        name: ชื่อ dimension
+        known_keys: Index ของ key จาก assign_surrogate_keys()
+    
+    Returns:
+        int: จำนวน key ใหม่ที่บันทึกเพิ่ม
+    
+    Raises:
+        ValueError: known_keys มีน้อยกว่าที่บันทึกไว้ (key เดิมหายไป id จะเลื่อน)
+    """
+    path = _registry_path(registry_dir, name)
+    stored = _stored_rows(path) or 0
+    if len(known_keys) < stored:
+        raise ValueError(f"Key registry '{name}' has {stored} keys, refusing to overwrite with {len(known_keys)}")
+    if len(known_keys) == stored:
+        return 0
+    
+    temp_dir = f'{path}.{os.getpid()}.tmp'
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    save_frame(known_keys.to_frame(index=False), temp_dir)
+    
+    old_dir = f'{path}.{os.getpid()}.old'
+    if os.path.exists(path):
+        os.replace(path, old_dir)
+    os.replace(temp_dir, path)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    return len(known_keys) - stored
+
+
+if __name__ == "__main__":
+    # Example usage
+    import tempfile
+    import pandas as pd
+    from .build_dimension import assign_surrogate_keys
+    
+    try:
+        registry_dir = tempfile.mkdtemp()
+        with key_registry_lock(registry_dir):
+            _, keys = assign_surrogate_keys(pd.DataFrame({'loan_status': ['Current', 'Fully Paid']}), ['loan_status'])
+            print(f"Saved {save_key_registry(registry_dir, 'loan_status', keys)} new keys")
+        ids, _ = assign_surrogate_keys(pd.DataFrame({'loan_status': ['Fully Paid', 'Charged Off']}), ['loan_status'],
+                                       load_key_registry(registry_dir, 'loan_status'))
+        print(f"Ids in the next run: {ids.tolist()}")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Load Control Functions
+ฟังก์ชันสำหรับเก็บสถานะการโหลดแบบ incremental (watermark + checksum ต่อ partition) ใน control table
+"""
+
+import hashlib
+from datetime import datetime
+import pandas as pd
+from sqlalchemy import Table, Column, MetaData, inspect, select, delete, func
+from sqlalchemy.types import Unicode, BigInteger, Integer, DateTime
+import warnings
+warnings.filterwarnings('ignore')
+
+CONTROL_TABLE = 'etl_load_control'
+
+_metadata = MetaData()
+_control = Table(
+    CONTROL_TABLE, _metadata,
+    Column('table_name', Unicode(128), nullable=False),
+    Column('partition_key', Unicode(64), nullable=False),
+    Column('row_count', BigInteger, nullable=False),
+    Column('checksum', Unicode(64), nullable=False),
+    Column('batch_id', Integer, nullable=False),
+    Column('loaded_at', DateTime, nullable=False)
+)
+
+
+def partition_checksums(df, partition_column):
+    """
+    สรุปแต่ละ partition ของ DataFrame เป็นจำนวนแถว + sha256 ของเนื้อหา
+    
+    checksum คิดจากค่าของทุกคอลัมน์ตามลำดับแถว (ไม่รวม index) partition ที่เนื้อหาเหมือนเดิม
+    จึงได้ checksum เดิมเสมอ
+    
+    Args:
+        df: DataFrame ที่มีคอลัมน์ partition_column
+        partition_column: คอลัมน์ที่ใช้แบ่ง partition (ค่าถูกแปลงเป็นข้อความเป็น partition_key)
+    
+    Returns:
+        DataFrame: คอลัมน์ partition_key, row_count, checksum (เรียงตาม partition_key)
+    """
+    keys = df[partition_column].astype(str)
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    rows = []
+    for key, positions in keys.groupby(keys, sort=True).indices.items():
+        digest = hashlib.sha256(row_hashes[positions].tobytes()).hexdigest()
+        rows.append((key, len(positions), digest))
+    return pd.DataFrame(rows, columns=['partition_key', 'row_count', 'checksum'])
+
+
+def read_load_control(engine, table_name):
+    """
+    อ่านสถานะ partition ที่โหลดแล้วของตาราง
+    
+    Args:
+        engine: SQLAlchemy engine
+        table_name: ชื่อตารางปลายทาง
+    
+    Returns:
+        DataFrame: partition_key, row_count, checksum, batch_id, loaded_at (ว่างถ้ายังไม่เคยโหลด)
+    """
+    columns = ['partition_key', 'row_count', 'checksum', 'batch_id', 'loaded_at']
+    if not inspect(engine).has_table(CONTROL_TABLE):
+        return pd.DataFrame(columns=columns)
+    query = select(*[_control.c[column] for column in columns]).where(_control.c.table_name == table_name)
+    with engine.connect() as connection:
+        return pd.DataFrame(connection.execute(query).fetchall(), columns=columns)
+
+
+def load_watermark(engine, table_name):
+    """
+    high-water mark ของตาราง: partition_key สูงสุดและ batch_id ล่าสุดที่บันทึกไว้
+    
+    Returns:
+        tuple: (partition_key สูงสุด หรือ None, batch_id ล่าสุด หรือ 0)
+    """
+    if not inspect(engine).has_table(CONTROL_TABLE):
+        return None, 0
+    query = select(func.max(_control.c.partition_key), func.max(_control.c.batch_id)).where(
+        _control.c.table_name == table_name)
+    with engine.connect() as connection:
+        watermark, batch_id = connection.execute(query).one()
+    return watermark, batch_id or 0
+
+
+def record_load_control(engine, table_name, partitions, batch_id, replace_all=False, removed_keys=()):
+    """
+    บันทึก partition ที่โหลดสำเร็จลง control table (แทนที่ record เดิมของ partition เดียวกัน)
+    
+    Args:
+        engine: SQLAlchemy engine
+        table_name: ชื่อตารางปลายทาง
+        partitions: DataFrame จาก partition_checksums() ของ partition ที่โหลดรอบนี้
+        batch_id: หมายเลข batch ของรอบนี้
+        replace_all: ลบ record เดิมทั้งหมดของตารางก่อน เช่นหลัง full replace (default: False)
+        removed_keys: partition_key ที่ถูกลบออกจากตารางแล้ว - ลบ record ทิ้งใน transaction เดียวกัน (default: ())
+    
+    Returns:
+        int: จำนวน partition ที่บันทึก
+    """
+    _metadata.create_all(engine, tables=[_control], checkfirst=True)
+    loaded_at = datetime.now()
+    records = [{'table_name': table_name, 'partition_key': row.partition_key, 'row_count': int(row.row_count),
+                'checksum': row.checksum, 'batch_id': batch_id, 'loaded_at': loaded_at}
+               for row in partitions.itertuples(index=False)]
+    
+    with engine.begin() as connection:
+        condition = _control.c.table_name == table_name
+        if not replace_all:
+            keys = partitions['partition_key'].tolist() + list(removed_keys)
+            condition = condition & _control.c.partition_key.in_(keys)
+        connection.execute(delete(_control).where(condition))
+        if records:
+            connection.execute(_control.insert(), records)
+    return len(records)
+
+
+if __name__ == "__main__":
+    # Example usage
+    from sqlalchemy import create_engine
+    
+    try:
+        engine = create_engine('sqlite://')
+        df = pd.DataFrame({'issue_d': ['2016-01-01', '2016-01-01', '2016-02-01'], 'loan_amnt': [1000.0, 2000.0, 1500.0]})
+        partitions = partition_checksums(df, 'issue_d')
+        record_load_control(engine, 'loans_fact', partitions, batch_id=1)
+        print(read_load_control(engine, 'loans_fact'))
+        print(f"Watermark: {load_watermark(engine, 'loans_fact')}")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Data Loading Function
+ฟังก์ชันสำหรับโหลดไฟล์ CSV ครั้งเดียวแล้วใช้ DataFrame ร่วมกันทุกขั้นตอน
+"""
+
+import pandas as pd
+import warnings
+from .build_dtype_spec import apply_dtype_spec
+from .csv_cache import read_csv_cached
+warnings.filterwarnings('ignore')
+
+# จำนวนแถวต่อ chunk ที่ใช้อ่านภายในเมื่อกรองแถวระหว่างโหลดทั้งไฟล์ (row_filter)
+FILTER_CHUNKSIZE = 100000
+
+
+def _typed_chunks(reader, dtype_spec):
+    """แปลงแต่ละ chunk ตาม dtype spec ระหว่างอ่าน"""
+    for chunk in reader:
+        yield apply_dtype_spec(chunk, dtype_spec)
+
+
+def _filtered_chunks(reader, row_filter):
+    """กรองแถวของแต่ละ chunk ดิบด้วย row_filter (ก่อนแปลง dtype)"""
+    for chunk in reader:
+        mask = row_filter(chunk)
+        yield chunk if mask is None else chunk[mask]
+
+
+def _read_source(file_path, delimiter, has_headers, usecols, chunksize, cache_dir):
+    """อ่านไฟล์ CSV โดยตรง หรือผ่าน columnar cache เมื่อกำหนด cache_dir"""
+    if cache_dir is not None:
+        return read_csv_cached(file_path, cache_dir, delimiter=delimiter, has_headers=has_headers,
+                               usecols=usecols, chunksize=chunksize)
+    return pd.read_csv(file_path, sep=delimiter, low_memory=False, header=0 if has_headers else None,
+                       usecols=usecols, chunksize=chunksize)
+
+
+def load_data(file_path, delimiter=',', has_headers=True, usecols=None, chunksize=None, dtype_spec=None,
+              row_filter=None, cache_dir=None):
+    """
+    โหลดไฟล์ CSV เป็น DataFrame (parse ไฟล์เพียงครั้งเดียว)
+    
+    DataFrame ที่ได้สามารถส่งต่อให้ guess_column_types() และขั้นตอน transform
+    ได้โดยตรง ไม่ต้องอ่านไฟล์ซ้ำ
+    
+    Args:
+        file_path: path ของไฟล์ CSV
+        delimiter: ตัวแบ่งคอลัมน์ (default: ',')
+        has_headers: มี header หรือไม่ (default: True)
+        usecols: อ่านเฉพาะคอลัมน์ที่กำหนด (default: None = ทุกคอลัมน์)
+        chunksize: จำนวนแถวต่อ chunk (default: None = โหลดทั้งไฟล์)
+        dtype_spec: dtype spec จาก build_dtype_spec() (default: None = ให้ pandas เดาเอง)
+        row_filter: ฟังก์ชันรับ chunk ดิบแล้วคืน bool mask ของแถวที่เก็บไว้ หรือ None = เก็บทุกแถว
+            (default: None) แถวที่ไม่ผ่านจะถูกทิ้งก่อนแปลง dtype และก่อนรวมเป็น DataFrame เดียว
+            โดยไฟล์จะถูกอ่านทีละ FILTER_CHUNKSIZE แถวถ้าไม่ได้กำหนด chunksize
+        cache_dir: directory ของ columnar cache (ดู read_csv_cached()) ครั้งแรก parse แล้วเก็บ
+            ครั้งถัดไปโหลดจาก cache แทนการ parse ข้อความ (default: None = ไม่ใช้ cache)
+        
+    Returns:
+        DataFrame ที่โหลดจากไฟล์ หรือ iterator ของ DataFrame ทีละ chunk เมื่อกำหนด chunksize
+    """
+    if row_filter is not None:
+        return _load_filtered(file_path, delimiter, has_headers, usecols, chunksize, dtype_spec, row_filter,
+                              cache_dir)
+    
+    if cache_dir is not None:
+        result = _read_source(file_path, delimiter, has_headers, usecols, chunksize, cache_dir)
+    else:
+        result = pd.read_csv(file_path, sep=delimiter, low_memory=False, header=0 if has_headers else None,
+                             usecols=usecols, chunksize=chunksize,
+                             dtype=dtype_spec['dtype'] if dtype_spec else None)
+    
+    if dtype_spec is None:
+        return result
+    if chunksize is not None:
+        return _typed_chunks(result, dtype_spec)
+    return apply_dtype_spec(result, dtype_spec)
+
+
+def _load_filtered(file_path, delimiter, has_headers, usecols, chunksize, dtype_spec, row_filter, cache_dir):
+    """load_data() แบบกรองแถวระหว่างอ่าน: อ่านแบบ raw, กรอง แล้วจึงแปลง dtype เฉพาะแถวที่เหลือ"""
+    reader = _read_source(file_path, delimiter, has_headers, usecols, chunksize or FILTER_CHUNKSIZE, cache_dir)
+    chunks = _filtered_chunks(reader, row_filter)
+    
+    if chunksize is not None:
+        return chunks if dtype_spec is None else _typed_chunks(chunks, dtype_spec)
+    
+    chunks = list(chunks)
+    if chunks:
+        df = pd.concat(chunks, ignore_index=True)
+    else:
+        df = pd.read_csv(file_path, sep=delimiter, header=0 if has_headers else None, usecols=usecols, nrows=0)
+    return df if dtype_spec is None else apply_dtype_spec(df, dtype_spec)
+
+
+if __name__ == "__main__":
+    # Example usage
+    file_path = '../dataops-foundation-jenkins/data/LoanStats_web_small.csv'
+    
+    try:
+        df = load_data(file_path)
+        print(f"Loaded data: {len(df):,} rows, {len(df.columns)} columns")
+    except Exception as e:
+        print(f"Error: {e}")
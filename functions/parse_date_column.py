@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Date Column Parsing Function
+ฟังก์ชันสำหรับแปลงคอลัมน์วันที่โดย parse เฉพาะ unique values
+"""
+
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import warnings
+warnings.filterwarnings('ignore')
+
+# จำนวน (ค่า, format) สูงสุดที่เก็บใน LRU cache ระดับ process
+DATE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date_value(value, date_format):
+    """parse ค่าเดียวตาม format (ผลลัพธ์ถูก cache ไว้ทั้ง process) คืน None ถ้าไม่ตรง format"""
+    try:
+        return pd.to_datetime(value, format=date_format)
+    except (ValueError, TypeError):
+        return None
+
+
+def clear_date_cache():
+    """ล้าง LRU cache ของ parse_date_column()"""
+    _parse_date_value.cache_clear()
+
+
+def _parse_unique_values(uniques, date_format, use_cache):
+    """
+    parse unique values ตาม format ถ้ามีค่าใดไม่ตรง format จะ parse ใหม่ทั้งหมดแบบไม่ระบุ format
+    
+    Raises:
+        ValueError: ถ้า parse แบบไม่ระบุ format ก็ยังไม่สำเร็จ
+    """
+    if date_format is not None:
+        if use_cache:
+            parsed = [_parse_date_value(value, date_format) for value in uniques]
+            if all(value is not None for value in parsed):
+                return pd.DatetimeIndex(parsed)
+        else:
+            try:
+                return pd.DatetimeIndex(pd.to_datetime(uniques, format=date_format))
+            except (ValueError, TypeError):
+                pass
+    
+    try:
+        return pd.DatetimeIndex(pd.to_datetime(uniques))
+    except TypeError as e:
+        raise ValueError(str(e))
+
+
+def parse_date_column(series, date_format=None, use_cache=False):
+    """
+    แปลง Series เป็น datetime โดย parse เฉพาะ unique values แล้ว map กลับด้วย vectorized indexing
+    (ต้นทุนขึ้นกับจำนวน unique values ไม่ใช่จำนวนแถว)
+    
+    ให้ผลเหมือน pd.to_datetime(series, format=date_format) และถ้ามีค่าใดไม่ตรง format
+    จะ parse แบบไม่ระบุ format เหมือนเดิม
+    
+    Args:
+        series: Series ของค่าวันที่ (string / object / category)
+        date_format: format ของวันที่ เช่น '%b-%Y' (default: None = ให้ pandas เดา format)
+        use_cache: เก็บผลการ parse แต่ละค่าใน LRU cache ระดับ process (default: False)
+        
+    Returns:
+        Series ชนิด datetime64 (ค่า null -> NaT)
+        
+    Raises:
+        ValueError: ถ้าไม่สามารถแปลงเป็น datetime ได้
+    """
+    codes, uniques = pd.factorize(series)
+    parsed = _parse_unique_values(np.asarray(uniques, dtype=object), date_format, use_cache)
+    return pd.Series(parsed.take(codes, allow_fill=True, fill_value=pd.NaT),
+                     index=series.index, name=series.name)
+
+
+if __name__ == "__main__":
+    # Example usage
+    file_path = '../dataops-foundation-jenkins/data/LoanStats_web_small.csv'
+    
+    try:
+        df = pd.read_csv(file_path, low_memory=False, usecols=['issue_d'])
+        issue_d = parse_date_column(df['issue_d'], date_format='%b-%Y', use_cache=True)
+        print(f"Parsed {len(issue_d):,} rows from {df['issue_d'].nunique()} unique values")
+    except Exception as e:
+        print(f"Error: {e}")
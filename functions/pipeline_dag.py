@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Pipeline DAG Functions
+ฟังก์ชันสำหรับรัน pipeline เป็น DAG ของ node แบบ lazy และเก็บผลลัพธ์ของแต่ละ node ไว้ใช้ซ้ำ
+(key = hash ของ parameter ของ node + เนื้อหาไฟล์ input + key ของ node ต้นทาง)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+import warnings
+from .file_fingerprint import file_fingerprint
+from .columnar_store import save_frame, load_frame
+from .stage_metrics import measure_stage
+warnings.filterwarnings('ignore')
+
+# เปลี่ยนเมื่อรูปแบบไฟล์ใน cache เปลี่ยน (entry เก่าจะไม่ถูกใช้อีก)
+DAG_CACHE_VERSION = 1
+
+# ขนาดรวมสูงสุดของ cache ก่อนลบ entry ที่ใช้ล่าสุดนานที่สุด (LRU)
+DEFAULT_MAX_DAG_CACHE_BYTES = 2 * 1024 ** 3
+
+META_FILE = 'meta.json'
+VALUE_FILE = 'value.json'
+FINGERPRINT_MEMO = 'fingerprints.json'
+
+
+def dag_node(func, deps=(), params=(), files=(), cache=True, version=1):
+    """
+    สร้าง node ของ DAG
+    
+    Args:
+        func: ฟังก์ชันของ node - รับผลลัพธ์ของ deps ตามลำดับ และ params เป็น keyword arguments
+        deps: ชื่อ node ที่ต้องใช้ผลลัพธ์ (default: ())
+        params: ชื่อ parameter ที่ส่งให้ func และเป็นส่วนหนึ่งของ key (default: ())
+        files: parameter ใน params ที่เป็น path ของไฟล์ - key ใช้ sha256 ของเนื้อหาแทน path (default: ())
+        cache: เก็บผลลัพธ์ไว้ใช้ซ้ำ - ใช้ False กับ node ที่มี side effect (default: True)
+        version: เปลี่ยนเมื่อ logic ของ func เปลี่ยน (ผลลัพธ์เดิมใน cache จะไม่ถูกใช้) (default: 1)
+    
+    Returns:
+        dict: spec ของ node
+    """
+    unknown = set(files) - set(params)
+    if unknown:
+        raise ValueError(f"File parameters {sorted(unknown)} must also be listed in params")
+    return {'func': func, 'deps': tuple(deps), 'params': tuple(params), 'files': tuple(files),
+            'cache': cache, 'version': version}
+
+
+def _file_key(path, cache_dir):
+    """key ของไฟล์ input จากเนื้อหา (จำ sha256 ไว้ใน cache_dir เมื่อขนาด / mtime ไม่เปลี่ยน)"""
+    memo_file = os.path.join(cache_dir, FINGERPRINT_MEMO) if cache_dir else None
+    fingerprint = file_fingerprint(path, memo_file=memo_file)
+    return {'sha256': fingerprint['sha256'], 'size': fingerprint['size']}
+
+
+def dag_node_keys(graph, params, targets, cache_dir=None):
+    """
+    คำนวณ key ของ targets และทุก node ต้นทาง โดยไม่รัน node ใด
+    
+    Args:
+        graph: dict {ชื่อ node: dag_node()}
+        params: dict ของค่า parameter ทั้งหมด
+        targets: ชื่อ node ที่ต้องการ
+        cache_dir: directory ที่ใช้จำ sha256 ของไฟล์ input (default: None = hash ใหม่ทุกครั้ง)
+    
+    Returns:
+        dict: {ชื่อ node: key (hex)}
+    
+    Raises:
+        ValueError: node ไม่มีใน graph, DAG มี cycle หรือไม่มีค่าของ parameter
+    """
+    keys = {}
+    visiting = set()
+    
+    def key_of(name):
+        if name in keys:
+            return keys[name]
+        if name not in graph:
+            raise ValueError(f"Unknown DAG node: {name}")
+        if name in visiting:
+            raise ValueError(f"DAG has a cycle at node: {name}")
+        visiting.add(name)
+        node = graph[name]
+        missing = [param for param in node['params'] if param not in params]
+        if missing:
+            raise ValueError(f"Node '{name}' needs parameters {missing}")
+        key_source = {
+            'version': DAG_CACHE_VERSION,
+            'node': name,
+            'node_version': node['version'],
+            'params': {param: (_file_key(params[param], cache_dir) if param in node['files'] else params[param])
+                       for param in node['params']},
+            'deps': [key_of(dep) for dep in node['deps']]
+        }
+        visiting.discard(name)
+        keys[name] = hashlib.sha256(json.dumps(key_source, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        return keys[name]
+    
+    for target in targets:
+        key_of(target)
+    return keys
+
+
+def _store_value(value, directory, name):
+    """
+    บันทึกผลลัพธ์ของ node ลง directory (DataFrame / Series แบบ columnar, ที่เหลือเป็น JSON)
+    
+    Returns:
+        โครงสร้างที่ JSON serialize ได้สำหรับ _load_value()
+    
+    Raises:
+        TypeError / ValueError: ผลลัพธ์มีค่าที่เก็บไม่ได้ (node นั้นใช้ซ้ำได้เฉพาะในหน่วยความจำ)
+    """
+    if isinstance(value, pd.DataFrame):
+        encoded = {'type': 'frame', 'dir': name}
+        save_frame(value, os.path.join(directory, name))
+        if not value.index.equals(pd.RangeIndex(len(value))):
+            save_frame(pd.DataFrame({'index': value.index}), os.path.join(directory, f'{name}.index'))
+            encoded['index'] = f'{name}.index'
+        return encoded
+    if isinstance(value, pd.Series):
+        encoded = _store_value(value.to_frame('values'), directory, name)
+        return dict(encoded, type='series', name=value.name)
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError(f"Cannot persist dict with non-string keys in {name}")
+        return {'type': 'dict', 'items': {key: _store_value(item, directory, f'{name}.{position}')
+                                          for position, (key, item) in enumerate(value.items())}}
+    if isinstance(value, (tuple, list)):
+        return {'type': type(value).__name__,
+                'items': [_store_value(item, directory, f'{name}.{position}') for position, item in enumerate(value)]}
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {'type': 'json', 'value': value}
+    raise TypeError(f"Cannot persist {type(value).__name__} in {name}")
+
+
+def _load_value(encoded, directory):
+    """โหลดผลลัพธ์ที่บันทึกด้วย _store_value()"""
+    kind = encoded['type']
+    if kind in ('frame', 'series'):
+        frame = load_frame(os.path.join(directory, encoded['dir']), mmap_mode=None)
+        if 'index' in encoded:
+            frame.index = pd.Index(load_frame(os.path.join(directory, encoded['index']), mmap_mode=None)['index'])
+        return frame if kind == 'frame' else frame['values'].rename(encoded['name'])
+    if kind == 'dict':
+        return {key: _load_value(item, directory) for key, item in encoded['items'].items()}
+    if kind in ('tuple', 'list'):
+        items = [_load_value(item, directory) for item in encoded['items']]
+        return tuple(items) if kind == 'tuple' else items
+    return encoded['value']
+
+
+def _read_entry(cache_dir, key):
+    """โหลดผลลัพธ์ของ node จาก disk (None ถ้าไม่มีหรือเสีย) และบันทึกเวลาใช้ล่าสุดสำหรับ LRU"""
+    entry_dir = os.path.join(cache_dir, key[:32])
+    try:
+        with open(os.path.join(entry_dir, META_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('key') != key:
+            return None
+        with open(os.path.join(entry_dir, VALUE_FILE), 'r', encoding='utf-8') as f:
+            value = _load_value(json.load(f), entry_dir)
+        os.utime(os.path.join(entry_dir, META_FILE))
+    except (OSError, ValueError, KeyError):
+        return None
+    return {'value': value}
+
+
+def _write_entry(cache_dir, name, key, value):
+    """บันทึกผลลัพธ์ของ node ลง disk แบบ atomic (คืน False ถ้าผลลัพธ์เก็บลง disk ไม่ได้)"""
+    entry_dir = os.path.join(cache_dir, key[:32])
+    temp_dir = f'{entry_dir}.{os.getpid()}.tmp'
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    os.makedirs(temp_dir)
+    try:
+        encoded = _store_value(value, temp_dir, 'value')
+        with open(os.path.join(temp_dir, VALUE_FILE), 'w', encoding='utf-8') as f:
+            json.dump(encoded, f, indent=2)
+        with open(os.path.join(temp_dir, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump({'node': name, 'key': key}, f, indent=2)
+    except (TypeError, ValueError) as e:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        print(f"   ⚠️  {name}: result kept in memory only ({e})")
+        return False
+    shutil.rmtree(entry_dir, ignore_errors=True)
+    os.replace(temp_dir, entry_dir)
+    return True
+
+
+def evict_dag_cache(cache_dir, max_bytes=DEFAULT_MAX_DAG_CACHE_BYTES, keep=()):
+    """
+    ลบ entry ที่ใช้ล่าสุดนานที่สุดจนขนาดรวมของ cache ไม่เกิน max_bytes
+    
+    Args:
+        cache_dir: directory ของ cache
+        max_bytes: ขนาดรวมสูงสุด (default: DEFAULT_MAX_DAG_CACHE_BYTES)
+        keep: key ของ entry ที่ห้ามลบ เช่นของรอบที่เพิ่งรัน (default: ())
+    
+    Returns:
+        int: จำนวน entry ที่ลบ
+    """
+    if not os.path.isdir(cache_dir):
+        return 0
+    keep = {key[:32] for key in keep}
+    entries = []
+    for name in os.listdir(cache_dir):
+        entry_dir = os.path.join(cache_dir, name)
+        if not os.path.isfile(os.path.join(entry_dir, META_FILE)):
+            continue
+        size = sum(os.path.getsize(os.path.join(root, file)) for root, _, files in os.walk(entry_dir) for file in files)
+        entries.append((os.path.getmtime(os.path.join(entry_dir, META_FILE)), name, size))
+    
+    total = sum(size for _, _, size in entries)
+    removed = 0
+    for _, name, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        if name in keep:
+            continue
+        shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def evaluate_dag(graph, targets, params, cache_dir=None, memo=None, metrics=None,
+                 max_bytes=DEFAULT_MAX_DAG_CACHE_BYTES):
+    """
+    คำนวณ targets แบบ lazy: node ที่ key ตรงกับผลลัพธ์ที่เก็บไว้จะไม่ถูกรัน (รวมถึง node ต้นทางของมัน)
+    ดังนั้นเมื่อเปลี่ยน parameter จะรันใหม่เฉพาะ node ที่ใช้ parameter นั้นและ node ปลายทางของมัน
+    
+    Args:
+        graph: dict {ชื่อ node: dag_node()}
+        targets: ชื่อ node ที่ต้องการผลลัพธ์
+        params: dict ของค่า parameter (ต้อง serialize เป็น JSON ได้ เช่น ตัวเลข, ข้อความ, list)
+        cache_dir: directory ที่เก็บผลลัพธ์ของ node ข้ามการรัน (default: None = ไม่เก็บลง disk)
+        memo: dict ที่เก็บผลลัพธ์ในหน่วยความจำข้ามการเรียก (ถูกอัปเดตในที่) (default: None = ไม่เก็บ)
+        metrics: list ของ measure_stage() - วัดเฉพาะ node ที่ถูกรัน (default: None = ไม่วัด)
+        max_bytes: ขนาดรวมสูงสุดของ cache_dir (default: DEFAULT_MAX_DAG_CACHE_BYTES)
+    
+    Returns:
+        tuple: (dict {target: ผลลัพธ์}, dict {ชื่อ node: 'memory' / 'disk' / 'computed'} ของ node ที่ถูกใช้)
+    """
+    keys = dag_node_keys(graph, params, targets, cache_dir)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    values = {}
+    sources = {}
+    
+    def value_of(name):
+        if name in values:
+            return values[name]
+        node, key = graph[name], keys[name]
+        if node['cache'] and memo is not None and key in memo:
+            values[name], sources[name] = memo[key], 'memory'
+            return values[name]
+        entry = _read_entry(cache_dir, key) if node['cache'] and cache_dir else None
+        if entry is not None:
+            values[name], sources[name] = entry['value'], 'disk'
+        else:
+            inputs = [value_of(dep) for dep in node['deps']]
+            with measure_stage(metrics, name):
+                values[name] = node['func'](*inputs, **{param: params[param] for param in node['params']})
+            sources[name] = 'computed'
+            if node['cache'] and cache_dir:
+                _write_entry(cache_dir, name, key, values[name])
+        if node['cache'] and memo is not None:
+            memo[key] = values[name]
+        return values[name]
+    
+    results = {target: value_of(target) for target in targets}
+    if cache_dir and 'computed' in sources.values():
+        evict_dag_cache(cache_dir, max_bytes, keep=[keys[name] for name in sources])
+    return results, sources
+
+
+if __name__ == "__main__":
+    # Example usage
+    graph = {
+        'numbers': dag_node(lambda size: pd.Series(range(size)), params=['size']),
+        'scaled': dag_node(lambda numbers, factor: numbers * factor, deps=['numbers'], params=['factor'])
+    }
+    memo = {}
+    
+    try:
+        for factor in (2, 3):
+            results, sources = evaluate_dag(graph, ['scaled'], {'size': 5, 'factor': factor}, memo=memo)
+            print(f"factor={factor}: {results['scaled'].tolist()} {sources}")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+CSV Row Sampling Function
+ฟังก์ชันสำหรับสุ่มตัวอย่างแถวจากไฟล์ CSV โดยไม่ต้อง parse ทั้งไฟล์
+"""
+
+import io
+import os
+import random
+import pandas as pd
+import warnings
+warnings.filterwarnings('ignore')
+
+SAMPLE_STRATEGIES = ('head', 'reservoir', 'stratified')
+
+# จำนวนช่วง (byte offset) ที่ใช้กับ strategy 'stratified'
+DEFAULT_STRATA = 100
+
+
+def _parse_lines(lines, delimiter, has_headers):
+    """parse bytes ของแถวที่สุ่มได้ (รวม header ถ้ามี) เป็น DataFrame"""
+    return pd.read_csv(io.BytesIO(b''.join(lines)), sep=delimiter, low_memory=False,
+                       header=0 if has_headers else None)
+
+
+def _reservoir_lines(file_path, sample_size, has_headers, random_state):
+    """สุ่มแถวแบบ reservoir (Algorithm R) จากทั้งไฟล์ในการอ่านรอบเดียว"""
+    rng = random.Random(random_state)
+    header = []
+    reservoir = []
+    total = 0
+    with open(file_path, 'rb') as f:
+        if has_headers:
+            header = [f.readline()]
+        for line in f:
+            if sample_size > len(reservoir):
+                reservoir.append((total, line))
+            else:
+                j = rng.randint(0, total)
+                if j < sample_size:
+                    reservoir[j] = (total, line)
+            total += 1
+    
+    # คงลำดับเดิมของแถวในไฟล์
+    reservoir.sort(key=lambda item: item[0])
+    return header, [line for _, line in reservoir], total <= sample_size
+
+
+def _stratified_lines(file_path, sample_size, has_headers, strata):
+    """อ่านแถวจากหลายช่วง byte offset ที่กระจายทั่วไฟล์ (อ่านเฉพาะแถวที่ใช้)"""
+    file_size = os.path.getsize(file_path)
+    header = []
+    lines = []
+    complete = True
+    with open(file_path, 'rb') as f:
+        if has_headers:
+            header = [f.readline()]
+        data_start = f.tell()
+        data_size = file_size - data_start
+        strata = max(1, min(strata, sample_size, data_size))
+        rows_per_stratum = -(-sample_size // strata)
+        boundaries = [data_start + data_size * i // strata for i in range(strata + 1)]
+        
+        for start, end in zip(boundaries[:-1], boundaries[1:]):
+            # จัดตำแหน่งให้อยู่ต้นแถวแรกที่เริ่ม >= start
+            if start > data_start:
+                f.seek(start - 1)
+                f.readline()
+            else:
+                f.seek(start)
+            taken = 0
+            while f.tell() < end and taken < rows_per_stratum:
+                line = f.readline()
+                if not line:
+                    break
+                lines.append(line)
+                taken += 1
+            if f.tell() < end:
+                complete = False
+    return header, lines, complete
+
+
+def sample_csv_rows(file_path, sample_size=10000, strategy='head', delimiter=',', has_headers=True,
+                    random_state=42, strata=DEFAULT_STRATA):
+    """
+    สุ่มตัวอย่างแถวจากไฟล์ CSV โดย parse เฉพาะแถวที่สุ่มได้
+    
+    Strategies:
+        - 'head': อ่าน sample_size แถวแรก
+        - 'reservoir': สุ่มแบบ uniform จากทั้งไฟล์ (scan bytes รอบเดียว, parse เฉพาะแถวที่เลือก)
+        - 'stratified': อ่านแถวจากช่วง byte offset ที่กระจายเท่าๆ กันทั่วไฟล์ (ไม่ต้อง scan ทั้งไฟล์)
+    
+    หมายเหตุ: 'reservoir' และ 'stratified' แบ่งแถวด้วย newline จึงไม่รองรับ
+    ค่าที่มี newline อยู่ใน quoted field
+    
+    Args:
+        file_path: path ของไฟล์ CSV
+        sample_size: จำนวนแถวตัวอย่าง (default: 10000)
+        strategy: 'head', 'reservoir' หรือ 'stratified' (default: 'head')
+        delimiter: ตัวแบ่งคอลัมน์ (default: ',')
+        has_headers: มี header หรือไม่ (default: True)
+        random_state: seed สำหรับ 'reservoir' (default: 42)
+        strata: จำนวนช่วง byte offset สำหรับ 'stratified' (default: 100)
+    
+    Returns:
+        tuple: (sample_df: DataFrame, is_complete: bool - ตัวอย่างครอบคลุมทุกแถวของไฟล์หรือไม่)
+    """
+    if strategy not in SAMPLE_STRATEGIES:
+        raise ValueError(f"Unknown sample strategy '{strategy}', expected one of {SAMPLE_STRATEGIES}")
+    
+    if strategy == 'head':
+        # อ่านเกิน 1 แถวเพื่อรู้ว่าไฟล์จบที่ sample_size แถวพอดี (ตัวอย่างครบทั้งไฟล์) หรือยังมีแถวต่อ
+        sample_df = pd.read_csv(file_path, sep=delimiter, low_memory=False, nrows=sample_size + 1,
+                                header=0 if has_headers else None)
+        return sample_df.iloc[:sample_size], len(sample_df) <= sample_size
+    
+    if strategy == 'reservoir':
+        header, lines, complete = _reservoir_lines(file_path, sample_size, has_headers, random_state)
+    else:
+        header, lines, complete = _stratified_lines(file_path, sample_size, has_headers, strata)
+    
+    return _parse_lines(header + lines, delimiter, has_headers), complete
+
+
+if __name__ == "__main__":
+    # Example usage
+    file_path = '../dataops-foundation-jenkins/data/LoanStats_web_small.csv'
+    
+    try:
+        for strategy in SAMPLE_STRATEGIES:
+            sample_df, complete = sample_csv_rows(file_path, sample_size=1000, strategy=strategy)
+            print(f"{strategy}: {len(sample_df):,} rows sampled (complete={complete})")
+    except Exception as e:
+        print(f"Error: {e}")
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Stage Metrics Functions
+ฟังก์ชันสำหรับวัดเวลา, CPU, หน่วยความจำ และจำนวนแถวของแต่ละขั้นตอนของ pipeline แล้วบันทึกเป็น JSON / CSV
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+import pandas as pd
+import warnings
+warnings.filterwarnings('ignore')
+
+try:
+    import resource
+except ImportError:  # Windows: ไม่มี peak RSS
+    resource = None
+
+# คอลัมน์ของแต่ละ record ตามลำดับ (ใช้เป็น header ของ CSV)
+METRIC_FIELDS = ['stage', 'status', 'rows_in', 'rows_out', 'wall_seconds', 'cpu_seconds', 'rows_per_second',
+                 'peak_rss_mb', 'process_peak_rss_mb', 'tracemalloc_peak_mb']
+
+# peak RSS ที่อ่านได้ก่อน reset high-water mark แต่ละครั้ง (MB) - ใช้คำนวณ peak ของทั้ง process
+_PROCESS_PEAK_MB = 0.0
+
+# running peak (MB) ของขั้นตอนที่ยังวัดอยู่ (ขั้นตอนซ้อนกัน: ขั้นตอนนอกได้ peak ของขั้นตอนในด้วย)
+_OPEN_STAGE_PEAKS = []
+
+
+def _high_water_mark_mb():
+    """VmHWM ของ process นี้ (MB) ตั้งแต่ reset ครั้งล่าสุด หรือ None ถ้าไม่ใช่ Linux"""
+    # VmHWM เป็นของ process นี้เอง (ru_maxrss ส่งต่อผ่าน exec จาก process แม่ที่ใหญ่กว่าได้)
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _reset_high_water_mark():
+    """
+    reset VmHWM เป็น RSS ปัจจุบัน (เขียน 5 ลง /proc/self/clear_refs - Linux 4.0 ขึ้นไป)
+    peak ที่อ่านได้ก่อน reset ถูกเก็บไว้ใน peak ของ process และของขั้นตอนที่ยังเปิดอยู่
+    
+    Returns:
+        bool: True ถ้า reset ได้ (peak RSS รายขั้นตอนใช้ได้)
+    """
+    global _PROCESS_PEAK_MB
+    current = _high_water_mark_mb()
+    if current is None:
+        return False
+    _PROCESS_PEAK_MB = max(_PROCESS_PEAK_MB, current)
+    _OPEN_STAGE_PEAKS[:] = [None if peak is None else max(peak, current) for peak in _OPEN_STAGE_PEAKS]
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        return False
+    return True
+
+
+def _process_peak_rss_mb():
+    """peak RSS ของ process นี้ตั้งแต่เริ่ม (MB) หรือ None ถ้าระบบไม่รองรับ"""
+    current = _high_water_mark_mb()
+    if current is not None:
+        return round(max(_PROCESS_PEAK_MB, current), 1)
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux รายงานเป็น KB, macOS เป็น bytes
+    return round(peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024, 1)
+
+
+def _cpu_seconds():
+    """CPU time ของ process นี้รวม process ลูกที่จบแล้ว (เช่น process pool)"""
+    times = os.times()
+    return time.process_time() + times.children_user + times.children_system
+
+
+@contextmanager
+def measure_stage(metrics, stage, rows_in=None):
+    """
+    วัดขั้นตอนหนึ่งของ pipeline แล้วเพิ่ม record ต่อท้าย metrics
+    
+    ใช้กับ with: ผู้เรียกกำหนด record['rows_out'] (และ record['rows_in'] ถ้ารู้ทีหลัง) ระหว่างขั้นตอน
+    เมื่อ metrics เป็น None จะไม่วัดอะไรเลย (overhead แทบเป็นศูนย์) ส่วน tracemalloc_peak_mb วัดเฉพาะเมื่อ
+    ผู้เรียกเปิด tracemalloc ไว้แล้ว (tracemalloc ทำให้โปรแกรมช้าลงมาก)
+    
+    peak_rss_mb เป็น peak RSS ระหว่างขั้นตอนนี้ (reset VmHWM ตอนเริ่มขั้นตอน - Linux เท่านั้น ระบบอื่นเป็น None)
+    ส่วน process_peak_rss_mb เป็น peak ของทั้ง process ตั้งแต่เริ่มจนจบขั้นตอน (สะสม ไม่ลดลง)
+    
+    Args:
+        metrics: list ที่เก็บ record (ถูกอัปเดตในที่) หรือ None = ปิดการวัด
+        stage: ชื่อขั้นตอน เช่น 'load', 'clean', 'star_schema'
+        rows_in: จำนวนแถวที่เข้าขั้นตอน (default: None)
+    
+    Yields:
+        dict: record ของขั้นตอน (status = 'failed' ถ้าเกิด exception)
+    """
+    if metrics is None:
+        yield {}
+        return
+    
+    record = {'rows_in': rows_in, 'rows_out': None}
+    _OPEN_STAGE_PEAKS.append(0.0 if _reset_high_water_mark() else None)
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        traced_before = tracemalloc.get_traced_memory()[0]
+    status = 'failed'
+    wall_start, cpu_start = time.perf_counter(), _cpu_seconds()
+    try:
+        yield record
+        status = 'ok'
+    finally:
+        wall_seconds = time.perf_counter() - wall_start
+        stage_peak = _OPEN_STAGE_PEAKS.pop()
+        if stage_peak is not None:
+            stage_peak = max(stage_peak, _high_water_mark_mb() or 0.0)
+            _OPEN_STAGE_PEAKS[:] = [None if peak is None else max(peak, stage_peak) for peak in _OPEN_STAGE_PEAKS]
+        rows = record['rows_in'] if record['rows_in'] is not None else record['rows_out']
+        metrics.append({
+            'stage': stage,
+            'status': status,
+            'rows_in': record['rows_in'],
+            'rows_out': record['rows_out'],
+            'wall_seconds': round(wall_seconds, 6),
+            'cpu_seconds': round(_cpu_seconds() - cpu_start, 6),
+            'rows_per_second': round(rows / wall_seconds, 1) if rows and wall_seconds > 0 else None,
+            'peak_rss_mb': None if stage_peak is None else round(stage_peak, 1),
+            'process_peak_rss_mb': _process_peak_rss_mb(),
+            'tracemalloc_peak_mb': (round((tracemalloc.get_traced_memory()[1] - traced_before) / 1024 ** 2, 3)
+                                    if tracing else None)
+        })
+
+
+def write_stage_metrics(metrics, path, run_info=None):
+    """
+    บันทึก metrics เป็นไฟล์ให้ Jenkins archive / plot แนวโน้ม (แทนไฟล์เดิมแบบ atomic)
+    
+    Args:
+        metrics: list ของ record จาก measure_stage()
+        path: ไฟล์ปลายทาง - นามสกุล .csv = หนึ่งแถวต่อขั้นตอน, อื่น ๆ = JSON
+        run_info: ข้อมูลของการรันที่เก็บไว้ใน JSON เช่นไฟล์ข้อมูลและ options (default: None)
+    
+    Returns:
+        str: path ของไฟล์ที่บันทึก
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_file = f'{path}.{os.getpid()}.tmp'
+    
+    if path.lower().endswith('.csv'):
+        pd.DataFrame(metrics, columns=METRIC_FIELDS).to_csv(temp_file, index=False)
+    else:
+        document = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'run': run_info or {},
+            'total_wall_seconds': round(sum(record['wall_seconds'] for record in metrics), 6),
+            'stages': metrics
+        }
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2, default=str)
+    os.replace(temp_file, path)
+    return path
+
+
+if __name__ == "__main__":
+    # Example usage
+    try:
+        metrics = []
+        with measure_stage(metrics, 'sum', rows_in=1_000_000) as record:
+            values = list(range(1_000_000))
+            record['rows_out'] = 1 if sum(values) else 0
+        print(metrics[0])
+    except Exception as e:
+        print(f"Error: {e}")
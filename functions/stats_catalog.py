@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Column Statistics Catalog Functions
+ฟังก์ชันสำหรับเก็บสถิติของแต่ละคอลัมน์ (จำนวน null, จำนวนแถว, ประเภทที่เดาได้) ไว้ข้างไฟล์ข้อมูล
+เพื่อให้รอบถัดไปตัดคอลัมน์ที่ null เกินเกณฑ์ได้ก่อนอ่านไฟล์
+"""
+
+import json
+import os
+import pandas as pd
+import warnings
+from .file_fingerprint import file_fingerprint
+warnings.filterwarnings('ignore')
+
+# นามสกุลของไฟล์ catalog ที่เก็บข้างไฟล์ข้อมูล (<data_file>.stats.json)
+STATS_CATALOG_SUFFIX = '.stats.json'
+
+# เวอร์ชันของรูปแบบ catalog (เปลี่ยนเมื่อรูปแบบไม่เข้ากันกับของเดิม)
+CATALOG_VERSION = 1
+
+
+def stats_catalog_path(data_file):
+    """path ของ catalog ของไฟล์ข้อมูล"""
+    return os.path.abspath(data_file) + STATS_CATALOG_SUFFIX
+
+
+def _read_raw(data_file):
+    """อ่าน catalog แบบ JSON (None ถ้าไม่มีหรือเสีย)"""
+    try:
+        with open(stats_catalog_path(data_file), 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return raw if isinstance(raw, dict) and raw.get('version') == CATALOG_VERSION else None
+
+
+def _matches_file(raw, data_file, delimiter):
+    """catalog ตรงกับเนื้อหาไฟล์ปัจจุบันหรือไม่ (ขนาด + mtime เท่าเดิม หรือ sha256 เท่าเดิม)"""
+    if raw.get('delimiter') != delimiter:
+        return False
+    stat = os.stat(data_file)
+    if stat.st_size != raw.get('size'):
+        return False
+    if stat.st_mtime_ns == raw.get('mtime_ns'):
+        return True
+    return file_fingerprint(data_file)['sha256'] == raw.get('sha256')
+
+
+def read_stats_catalog(data_file, delimiter=','):
+    """
+    อ่าน catalog ของไฟล์ข้อมูลถ้ายังตรงกับเนื้อหาไฟล์
+    
+    ถ้าขนาดและ mtime ของไฟล์เท่าที่บันทึกไว้จะไม่อ่านไฟล์ข้อมูลเลย ถ้า mtime เปลี่ยนจะคำนวณ sha256
+    ใหม่เพื่อตรวจว่าเนื้อหายังเหมือนเดิม
+    
+    Args:
+        data_file: path ของไฟล์ CSV
+        delimiter: ตัวแบ่งคอลัมน์ที่ใช้ตอนนับสถิติ (default: ',')
+    
+    Returns:
+        dict: {'rows': จำนวนแถว, 'null_counts': Series ของจำนวน null ของคอลัมน์ที่เคยนับ,
+               'column_types': dict ประเภทที่เดาได้, 'columns': header ของไฟล์}
+              (ใช้แทนผลลัพธ์ของ count_missing_values() ได้) หรือ None ถ้าไม่มี / ไม่ตรงกับไฟล์
+    """
+    raw = _read_raw(data_file)
+    if raw is None or not _matches_file(raw, data_file, delimiter):
+        return None
+    
+    columns = raw['columns']
+    null_counts = raw['null_counts']
+    return {
+        'rows': raw['rows'],
+        'null_counts': pd.Series([null_counts[column] for column in columns if column in null_counts],
+                                 index=[column for column in columns if column in null_counts], dtype='int64'),
+        'column_types': raw.get('column_types', {}),
+        'columns': columns
+    }
+
+
+def catalog_null_stats(catalog, columns=None):
+    """
+    null stats ของคอลัมน์ที่ต้องการจาก catalog (แทนการนับจากไฟล์)
+    
+    Args:
+        catalog: ผลลัพธ์จาก read_stats_catalog() หรือ None
+        columns: คอลัมน์ที่ต้องการ (default: None = ทุกคอลัมน์ของไฟล์) คอลัมน์ที่ไฟล์ไม่มีจะถูกข้าม
+    
+    Returns:
+        dict ในรูปแบบเดียวกับ count_missing_values() (เรียงตามลำดับในไฟล์)
+        หรือ None ถ้า catalog ยังไม่มีสถิติของบางคอลัมน์
+    """
+    if catalog is None:
+        return None
+    wanted = catalog['columns'] if columns is None else [c for c in catalog['columns'] if c in set(columns)]
+    if not all(column in catalog['null_counts'].index for column in wanted):
+        return None
+    return {'rows': catalog['rows'], 'null_counts': catalog['null_counts'][wanted]}
+
+
+def update_stats_catalog(data_file, null_stats, column_types=None, delimiter=','):
+    """
+    บันทึกสถิติที่นับได้ระหว่างอ่านไฟล์ลง catalog แบบ atomic
+    
+    สถิติของคอลัมน์ที่ catalog เดิม (ของไฟล์เดียวกัน) มีอยู่แล้วแต่รอบนี้ไม่ได้อ่านจะถูกเก็บไว้
+    (ไม่เขียนซ้ำถ้าไม่มีอะไรเปลี่ยน) ส่วน catalog ของเนื้อหาไฟล์เดิมที่เปลี่ยนไปแล้วจะถูกแทนที่ทั้งหมด
+    
+    Args:
+        data_file: path ของไฟล์ CSV
+        null_stats: ผลลัพธ์จาก count_missing_values() ที่นับจากทุกแถวของไฟล์
+        column_types: dict ของประเภทที่เดาได้ เช่นจาก guess_column_types() (default: None)
+        delimiter: ตัวแบ่งคอลัมน์ของไฟล์ (default: ',')
+    
+    Returns:
+        str: path ของ catalog
+    
+    Raises:
+        ValueError: null_stats ไม่ได้นับจากทุกแถว (จำนวนแถวไม่ตรงกับ catalog ของไฟล์เดียวกัน)
+    """
+    raw = _read_raw(data_file)
+    stored = json.dumps(raw, sort_keys=True)
+    if raw is None or not _matches_file(raw, data_file, delimiter):
+        fingerprint = file_fingerprint(data_file)
+        columns = pd.read_csv(data_file, sep=delimiter, nrows=0).columns.tolist()
+        raw = {
+            'version': CATALOG_VERSION,
+            'sha256': fingerprint['sha256'],
+            'delimiter': delimiter,
+            'columns': columns,
+            'rows': null_stats['rows'],
+            'null_counts': {},
+            'column_types': {}
+        }
+    elif raw['rows'] != null_stats['rows']:
+        raise ValueError(f"Null stats cover {null_stats['rows']} rows, catalog of {data_file} has {raw['rows']}")
+    
+    stat = os.stat(data_file)
+    raw['size'] = stat.st_size
+    raw['mtime_ns'] = stat.st_mtime_ns
+    raw['null_counts'].update({column: int(count) for column, count in null_stats['null_counts'].items()})
+    raw['column_types'].update({column: str(dtype) for column, dtype in (column_types or {}).items()})
+    
+    path = stats_catalog_path(data_file)
+    if json.dumps(raw, sort_keys=True) == stored:
+        return path
+    temp_file = f'{path}.{os.getpid()}.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(raw, f, indent=2)
+    os.replace(temp_file, path)
+    return path
+
+
+if __name__ == "__main__":
+    # Example usage
+    from .clean_missing_values import count_missing_values, columns_within_null_limit
+    
+    data_file = '../dataops-foundation-jenkins/data/LoanStats_web_small.csv'
+    
+    try:
+        catalog = read_stats_catalog(data_file)
+        if catalog is None:
+            update_stats_catalog(data_file, count_missing_values(pd.read_csv(data_file, low_memory=False)))
+            catalog = read_stats_catalog(data_file)
+        print(f"Columns within 30% null: {columns_within_null_limit(catalog, 30)}")
+    except Exception as e:
+        print(f"Error: {e}")
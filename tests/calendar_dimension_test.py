@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Simple Test Demo for Calendar Dimension Functions
+ทดสอบฟังก์ชัน build_calendar_dimension() / calendar_month_ids() แบบง่าย
+"""
+
+import pandas as pd
+import numpy as np
+import os
+import sys
+
+# เพิ่ม path สำหรับ import functions
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.calendar_dimension import build_calendar_dimension, calendar_month_ids, calendar_year_range
+
+# ===== Test Cases =====
+
+def test_case_1_calendar_dimension():
+    """Test Case 1: calendar dimension ครบทุกเดือนพร้อม month / quarter / year / period"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 1: calendar dimension ครบทุกเดือนพร้อม month / quarter / year / period")
+    print("="*60)
+    
+    print(f"📊 Input Data:")
+    print(f"   Years: 2016-2019")
+    print(f"   Expected output: 48 months, attributes equal to the .dt accessors, id = year * 12 + month")
+    
+    calendar = build_calendar_dimension(2016, 2019)
+    dates = calendar['issue_d']
+    
+    print(f"\n📋 Test Results:")
+    print(calendar.head(3).to_string(index=False))
+    print(f"   Rows: {len(calendar)}, first: {dates.min().date()}, last: {dates.max().date()}")
+    
+    expected = (
+        len(calendar) == 48
+        and dates.equals(pd.Series(pd.date_range('2016-01-01', '2019-12-01', freq='MS'), name='issue_d'))
+        and calendar['month'].equals(dates.dt.month) and calendar['year'].equals(dates.dt.year)
+        and calendar['quarter'].equals(dates.dt.quarter)
+        and calendar['issue_d_id'].tolist() == (dates.dt.year * 12 + dates.dt.month).tolist()
+        and calendar['period'].tolist() == (dates.dt.year * 100 + dates.dt.month).tolist()
+    )
+    
+    if expected:
+        print("   ✅ PASS: Calendar dimension is complete and correct")
+        return True
+    else:
+        print("   ❌ FAIL: Unexpected calendar dimension")
+        return False
+
+def test_case_2_month_ids():
+    """Test Case 2: id ของวันที่ (datetime / category / ข้อความ) และค่าว่าง"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 2: id ของวันที่ (datetime / category / ข้อความ) และค่าว่าง")
+    print("="*60)
+    
+    dates = pd.Series(pd.to_datetime(['2016-01-15', '2019-12-01', '2016-01-01', '2017-06-30']))
+    
+    print(f"📊 Input Data:")
+    print(f"   Dates: {dates.dt.date.tolist()}")
+    print(f"   Expected output: [24193, 24240, 24193, 24210] for every input type, ValueError for NaT")
+    
+    results = {
+        'datetime': calendar_month_ids(dates).tolist(),
+        'category': calendar_month_ids(dates.astype('category')).tolist(),
+        'text': calendar_month_ids(dates.dt.strftime('%b-%Y')).tolist()
+    }
+    year_range = calendar_year_range(calendar_month_ids(dates))
+    try:
+        calendar_month_ids(pd.Series([pd.Timestamp('2016-01-01'), pd.NaT]))
+        error = None
+    except ValueError as e:
+        error = str(e)
+    
+    print(f"\n📋 Test Results:")
+    for kind, ids in results.items():
+        print(f"   {kind}: {ids}")
+    print(f"   Year range: {year_range}, empty: {calendar_year_range(np.array([], dtype=np.int64))}")
+    print(f"   Error: {error}")
+    
+    expected_ids = [24193, 24240, 24193, 24210]
+    if (all(ids == expected_ids for ids in results.values()) and year_range == (2016, 2019)
+            and calendar_year_range(np.array([], dtype=np.int64)) is None and error is not None):
+        print("   ✅ PASS: Month ids are computed correctly")
+        return True
+    else:
+        print("   ❌ FAIL: Unexpected month ids")
+        return False
+
+def run_all_tests():
+    """รัน Test Cases ทั้งหมด"""
+    print("🚀 Starting Calendar Dimension Function Tests")
+    print("Target: calendar_dimension - calendar dimension รายเดือนและ id แบบ year * 12 + month")
+    
+    results = []
+    
+    # รัน test cases
+    results.append(test_case_1_calendar_dimension())
+    results.append(test_case_2_month_ids())
+    
+    # สรุปผลลัพธ์
+    print("\n" + "="*60)
+    print("📊 SUMMARY RESULTS")
+    print("="*60)
+    
+    test_names = [
+        "Test Case 1: calendar dimension ครบทุกเดือนพร้อม month / quarter / year / period",
+        "Test Case 2: id ของวันที่ (datetime / category / ข้อความ) และค่าว่าง"
+    ]
+    
+    passed = 0
+    for i, (name, result) in enumerate(zip(test_names, results)):
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{i+1}. {name}: {status}")
+        if result:
+            passed += 1
+    
+    print(f"\n🎯 Overall Result: {passed}/{len(results)} tests passed")
+    
+    if passed == len(results):
+        print("🎉 ALL TESTS PASSED! ฟังก์ชันทำงานถูกต้องตาม spec")
+    else:
+        print("⚠️  SOME TESTS FAILED! ต้องแก้ไขฟังก์ชัน")
+    
+    return passed == len(results)
+
+if __name__ == "__main__":
+    # รัน tests
+    success = run_all_tests()
+    
+    print(f"\n{'='*60}")
+    print("🔚 Test Execution Complete")
+    print(f"{'='*60}")
+    
+    exit(0 if success else 1)
@@ -14,7 +14,7 @@ from datetime import datetime
 # เพิ่ม path สำหรับ import functions
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from functions.clean_missing_values import clean_missing_values
+from functions.clean_missing_values import clean_missing_values, count_missing_values, columns_within_null_limit
 
 # ===== Test Cases =====
 
@@ -218,6 +218,86 @@ def test_case_4_edge_cases():
     
     return test_4a_pass and test_4b_pass and test_4c_pass
 
+def test_case_5_chunked_null_statistics():
+    """Test Case 5: นับ null สะสมทีละ chunk"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 5: นับ null สะสมทีละ chunk")
+    print("="*60)
+    
+    n_rows = 100
+    test_df = pd.DataFrame({
+        'good_col': [1] * n_rows,  # ✅ 0% null
+        'ok_col': [1] * 75 + [None] * 25,  # ✅ 25% null (null อยู่ท้ายไฟล์)
+        'bad_col': [None] * 40 + [1] * 60  # ❌ 40% null (null อยู่ต้นไฟล์)
+    })
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: {n_rows}, processed in 4 chunks of 25 rows")
+    print(f"   Expected output: same columns as clean_missing_values on the whole frame")
+    
+    null_stats = None
+    for start in range(0, n_rows, 25):
+        null_stats = count_missing_values(test_df.iloc[start:start + 25], null_stats)
+    
+    chunked_columns = columns_within_null_limit(null_stats, max_null_percentage=30)
+    whole_columns = list(clean_missing_values(test_df, max_null_percentage=30).columns)
+    
+    print(f"\n📋 Test Results:")
+    print(f"   Rows counted: {null_stats['rows']}")
+    print(f"   Null counts: {null_stats['null_counts'].to_dict()}")
+    print(f"   Chunked selection: {chunked_columns}")
+    print(f"   Whole-frame selection: {whole_columns}")
+    
+    if null_stats['rows'] == n_rows and chunked_columns == whole_columns == ['good_col', 'ok_col']:
+        print("   ✅ PASS: Chunked null statistics match whole-frame cleaning")
+        return True
+    else:
+        print("   ❌ FAIL: Chunked null statistics mismatch")
+        return False
+
+def test_case_6_no_copy_null_profile():
+    """Test Case 6: นับ null ทุกประเภทคอลัมน์ได้ตรง และคอลัมน์ที่เหลือไม่ถูก copy"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 6: นับ null ทุกประเภทคอลัมน์ได้ตรง และคอลัมน์ที่เหลือไม่ถูก copy")
+    print("="*60)
+    
+    n_rows = 150000  # มากกว่า NULL_COUNT_BLOCK_ROWS เพื่อให้นับหลายช่วง
+    rng = np.random.default_rng(7)
+    missing = rng.random(n_rows) < 0.2
+    test_df = pd.DataFrame({
+        'loan_amnt': np.where(missing, np.nan, 1000.0),
+        'term': pd.Categorical(np.where(missing, None, ' 36 months')),
+        'issue_d': pd.to_datetime(np.where(missing, None, '2016-01-01')),
+        'member_id': np.arange(n_rows),
+        'grade': pd.array(np.where(missing, None, 'A'), dtype='string'),
+        'open_acc': pd.array(np.where(missing, None, 3), dtype='Int64'),
+        'desc': np.where(rng.random(n_rows) < 0.9, None, 'text')
+    })
+    
+    print(f"📊 Input Data:")
+    print(f"   Rows: {n_rows:,}, dtypes: {[str(dtype) for dtype in test_df.dtypes]}")
+    print(f"   Expected output: counts equal df.isnull().sum(), only desc removed, kept columns share memory")
+    
+    null_stats = count_missing_values(test_df)
+    cleaned_df = clean_missing_values(test_df, max_null_percentage=30)
+    shared = np.shares_memory(cleaned_df['loan_amnt'].to_numpy(), test_df['loan_amnt'].to_numpy())
+    no_null_df = test_df[['member_id']]
+    same_object = clean_missing_values(no_null_df) is no_null_df
+    
+    print(f"\n📋 Test Results:")
+    print(f"   Null counts: {null_stats['null_counts'].to_dict()}")
+    print(f"   Columns kept: {list(cleaned_df.columns)}")
+    print(f"   Shares memory with the input: {shared}, nothing removed returns the input: {same_object}")
+    
+    if (null_stats['null_counts'].equals(test_df.isnull().sum()) and null_stats['rows'] == n_rows
+            and list(cleaned_df.columns) == [column for column in test_df.columns if column != 'desc']
+            and shared and same_object and cleaned_df.equals(test_df.drop(columns='desc'))):
+        print("   ✅ PASS: Null profiling works without copying")
+        return True
+    else:
+        print("   ❌ FAIL: Unexpected null profile")
+        return False
+
 def run_all_tests():
     """รัน Test Cases ทั้งหมด"""
     print("🚀 Starting Missing Values Cleaning Function Tests")
@@ -230,6 +310,8 @@ def run_all_tests():
     results.append(test_case_2_threshold_testing()) 
     results.append(test_case_3_data_types_preservation())
     results.append(test_case_4_edge_cases())
+    results.append(test_case_5_chunked_null_statistics())
+    results.append(test_case_6_no_copy_null_profile())
     
     # สรุปผลลัพธ์
     print("\n" + "="*60)
@@ -240,7 +322,9 @@ def run_all_tests():
         "Test Case 1: การทำความสะอาดพื้นฐาน",
         "Test Case 2: ทดสอบ threshold ที่แตกต่างกัน", 
         "Test Case 3: ทดสอบการรักษาประเภทข้อมูล",
-        "Test Case 4: Edge Cases"
+        "Test Case 4: Edge Cases",
+        "Test Case 5: นับ null สะสมทีละ chunk",
+        "Test Case 6: นับ null ทุกประเภทคอลัมน์ได้ตรง และคอลัมน์ที่เหลือไม่ถูก copy"
     ]
     
     passed = 0
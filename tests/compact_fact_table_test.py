@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Simple Test Demo for Compact Fact Table Functions
+ทดสอบฟังก์ชัน compact_fact_table() / concat_compact_frames() / restore_fact_table() แบบง่าย
+"""
+
+import pandas as pd
+import numpy as np
+import os
+import sys
+
+# เพิ่ม path สำหรับ import functions
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.compact_fact_table import compact_fact_table, concat_compact_frames, frame_memory_bytes, restore_fact_table
+
+# ===== Helpers =====
+
+def build_fact_table(n_rows, seed=42):
+    """สร้าง fact table จำลองแบบเดียวกับผลของ create_star_schema"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'loan_amnt': rng.integers(1000, 40000, n_rows).astype(float),
+        'installment': rng.uniform(30, 1500, n_rows).round(2),
+        'term': rng.choice([' 36 months', ' 60 months'], n_rows).astype(object),
+        'int_rate': rng.choice(['5.32%', '13.56%', '22.15%'], n_rows).astype(object),
+        'home_ownership_id': rng.integers(1, 4, n_rows),
+        'issue_d_id': rng.integers(2016 * 12 + 1, 2019 * 12 + 13, n_rows),
+        'fact_id': np.arange(1, n_rows + 1, dtype=np.int64)
+    })
+
+# ===== Test Cases =====
+
+def test_case_1_narrowest_safe_types():
+    """Test Case 1: downcast เป็นประเภทแคบที่สุดที่ยังคืนค่าเดิมได้"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 1: downcast เป็นประเภทแคบที่สุดที่ยังคืนค่าเดิมได้")
+    print("="*60)
+    
+    fact_table = build_fact_table(1000)
+    fact_table['rate'] = 0.123456  # ทศนิยมเกิน 2 ตำแหน่ง - คง float64
+    fact_table['big_amount'] = 250000.01  # float32 ไม่ละเอียดพอระดับสตางค์ - คง float64
+    
+    print(f"📊 Input Data:")
+    print(f"   Rows: {len(fact_table)}, dtypes: {sorted(set(fact_table.dtypes.astype(str)))}")
+    print(f"   Expected output: float32 money, category text, int8/int16 ids, same values, fewer bytes per row")
+    
+    compact = compact_fact_table(fact_table)
+    before = frame_memory_bytes(fact_table) / len(fact_table)
+    after = frame_memory_bytes(compact) / len(compact)
+    restored = compact.astype({'loan_amnt': np.float64, 'installment': np.float64}).round({'loan_amnt': 2, 'installment': 2})
+    
+    print(f"\n📋 Test Results:")
+    print(f"   Dtypes: {dict(compact.dtypes.astype(str))}")
+    print(f"   Bytes per row: {before:.1f} -> {after:.1f}")
+    
+    expected_dtypes = {'loan_amnt': 'float32', 'installment': 'float32', 'term': 'category', 'int_rate': 'category',
+                       'home_ownership_id': 'int8', 'issue_d_id': 'int16', 'fact_id': 'int16',
+                       'rate': 'float64', 'big_amount': 'float64'}
+    same_values = all(restored[column].astype(fact_table[column].dtype).equals(fact_table[column])
+                      for column in fact_table.columns)
+    if dict(compact.dtypes.astype(str)) == expected_dtypes and same_values and after < before / 3:
+        print("   ✅ PASS: Fact table is compacted without changing values")
+        return True
+    else:
+        print("   ❌ FAIL: Unexpected compact fact table")
+        return False
+
+def test_case_2_concat_chunks_matches_whole():
+    """Test Case 2: compact ทีละ chunk แล้วต่อกันได้ผลเหมือน compact ทั้งตาราง"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 2: compact ทีละ chunk แล้วต่อกันได้ผลเหมือน compact ทั้งตาราง")
+    print("="*60)
+    
+    fact_table = build_fact_table(3000)
+    fact_table.loc[:99, 'term'] = ' 12 months'  # ค่าที่พบเฉพาะ chunk แรก
+    
+    print(f"📊 Input Data:")
+    print(f"   Rows: {len(fact_table)} in chunks of 100 / 400 / 2500 rows (fact_id 1-3000)")
+    print(f"   Expected output: identical to compacting the whole table, categories merged")
+    
+    chunks = [fact_table.iloc[0:100], fact_table.iloc[100:500], fact_table.iloc[500:]]
+    combined = concat_compact_frames([compact_fact_table(chunk) for chunk in chunks])
+    whole = compact_fact_table(fact_table)
+    
+    print(f"\n📋 Test Results:")
+    print(f"   Chunk dtypes of fact_id: {[str(compact_fact_table(chunk)['fact_id'].dtype) for chunk in chunks]}")
+    print(f"   Combined dtypes: {dict(combined.dtypes.astype(str))}")
+    print(f"   term categories: {list(combined['term'].cat.categories)}")
+    
+    if combined.equals(whole) and concat_compact_frames([]).empty:
+        print("   ✅ PASS: Chunked compaction matches the whole table")
+        return True
+    else:
+        print("   ❌ FAIL: Chunked compaction mismatch")
+        return False
+
+def test_case_3_restore_original_values():
+    """Test Case 3: restore_fact_table() คืนประเภทปกติและค่าเดิมตรงตัว"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 3: restore_fact_table() คืนประเภทปกติและค่าเดิมตรงตัว")
+    print("="*60)
+    
+    fact_table = build_fact_table(1000)
+    fact_table.loc[0, 'installment'] = 1285.32  # float32 อ่านได้ 1285.319946
+    
+    print(f"📊 Input Data:")
+    print(f"   Rows: {len(fact_table)}, installment[0] = 1285.32")
+    print(f"   Expected output: the restored table equals the original, float64 sums match exactly")
+    
+    compact = compact_fact_table(fact_table)
+    restored = restore_fact_table(compact)
+    
+    print(f"\n📋 Test Results:")
+    print(f"   Compact installment[0]: {float(compact.loc[0, 'installment']):.6f}")
+    print(f"   Restored installment[0]: {restored.loc[0, 'installment']:.6f}")
+    print(f"   Restored dtypes: {dict(restored.dtypes.astype(str))}")
+    print(f"   Restored equals original: {restored.equals(fact_table)}")
+    
+    if (restored.equals(fact_table) and restored['installment'].sum() == fact_table['installment'].sum()
+            and restore_fact_table(fact_table).equals(fact_table)):
+        print("   ✅ PASS: Compact fact table restores the original values")
+        return True
+    else:
+        print("   ❌ FAIL: Restored fact table differs from the original")
+        return False
+
+def run_all_tests():
+    """รัน Test Cases ทั้งหมด"""
+    print("🚀 Starting Compact Fact Table Function Tests")
+    print("Target: compact_fact_table() - ลดหน่วยความจำของ fact table")
+    
+    results = []
+    
+    # รัน test cases
+    results.append(test_case_1_narrowest_safe_types())
+    results.append(test_case_2_concat_chunks_matches_whole())
+    results.append(test_case_3_restore_original_values())
+    
+    # สรุปผลลัพธ์
+    print("\n" + "="*60)
+    print("📊 SUMMARY RESULTS")
+    print("="*60)
+    
+    test_names = [
+        "Test Case 1: downcast เป็นประเภทแคบที่สุดที่ยังคืนค่าเดิมได้",
+        "Test Case 2: compact ทีละ chunk แล้วต่อกันได้ผลเหมือน compact ทั้งตาราง",
+        "Test Case 3: restore_fact_table() คืนประเภทปกติและค่าเดิมตรงตัว"
+    ]
+    
+    passed = 0
+    for i, (name, result) in enumerate(zip(test_names, results)):
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{i+1}. {name}: {status}")
+        if result:
+            passed += 1
+    
+    print(f"\n🎯 Overall Result: {passed}/{len(results)} tests passed")
+    
+    if passed == len(results):
+        print("🎉 ALL TESTS PASSED! ฟังก์ชันทำงานถูกต้องตาม spec")
+    else:
+        print("⚠️  SOME TESTS FAILED! ต้องแก้ไขฟังก์ชัน")
+    
+    return passed == len(results)
+
+if __name__ == "__main__":
+    # รัน tests
+    success = run_all_tests()
+    
+    print(f"\n{'='*60}")
+    print("🔚 Test Execution Complete")
+    print(f"{'='*60}")
+    
+    exit(0 if success else 1)
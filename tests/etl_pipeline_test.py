@@ -0,0 +1,938 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Simple Test Demo for ETL Pipeline
+ทดสอบ etl_pipeline (star schema และโหมด streaming) แบบง่าย
+"""
+
+import pandas as pd
+import io
+import json
+import numpy as np
+import os
+import sys
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from sqlalchemy import create_engine
+
+# เพิ่ม path สำหรับ import etl_pipeline และ functions
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from etl_pipeline import (create_star_schema, run_batch_pipeline, run_streaming_pipeline, required_columns,
+                          save_etl_bundle, load_etl_bundle, deploy_to_database, input_files,
+                          run_multi_file_pipeline, run_dag_pipeline, show_etl_results, FACT_TABLE)
+import etl_pipeline
+from functions.load_control import read_load_control
+
+# ===== Helpers =====
+
+def build_loan_data(n_rows, seed=42):
+    """สร้างข้อมูล loan จำลองที่มีคอลัมน์เดียวกับ LoanStats ที่ pipeline ใช้"""
+    rng = np.random.default_rng(seed)
+    months = pd.date_range('2014-01-01', '2020-12-01', freq='MS').strftime('%b-%Y')
+    return pd.DataFrame({
+        'loan_amnt': rng.integers(1000, 40000, n_rows).astype(float),
+        'funded_amnt': rng.integers(1000, 40000, n_rows).astype(float),
+        'term': rng.choice([' 36 months', ' 60 months'], n_rows),
+        'int_rate': rng.choice(['5.32%', '13.56%', '22.15%'], n_rows),
+        'installment': rng.uniform(30, 1500, n_rows).round(2),
+        'home_ownership': rng.choice(['RENT', 'OWN', 'MORTGAGE'], n_rows),
+        'loan_status': rng.choice(['Current', 'Fully Paid', 'Charged Off'], n_rows),
+        'issue_d': rng.choice(months, n_rows),
+        'emp_title': np.where(rng.random(n_rows) < 0.1, None, 'Teacher'),  # ✅ 10% null - คงไว้
+        'desc': np.where(rng.random(n_rows) < 0.9, None, 'text')  # ❌ 90% null - ถูกลบ
+    })
+
+def write_temp_csv(df):
+    """เขียน DataFrame เป็นไฟล์ CSV ชั่วคราวและคืน path"""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+        df.to_csv(temp_file.name, index=False)
+        return temp_file.name
+
+# ===== Test Cases =====
+
+def test_case_1_star_schema_structure():
+    """Test Case 1: โครงสร้าง Star Schema"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 1: โครงสร้าง Star Schema")
+    print("="*60)
+    
+    test_df = build_loan_data(200).dropna(axis=1, how='any')
+    test_df['issue_d'] = pd.to_datetime(test_df['issue_d'], format='%b-%Y')
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: {len(test_df)}")
+    print(f"   Expected output: 3 dimension tables and a fact table with matching ids")
+    
+    fact_table, dim_tables = create_star_schema(test_df)
+    
+    # ตรวจว่า id ใน fact table ชี้กลับไปหาค่าเดิมได้
+    home_dim = dim_tables['home_ownership_dim'].set_index('home_ownership_id')['home_ownership']
+    round_trip = fact_table['home_ownership_id'].map(home_dim).tolist() == test_df['home_ownership'].tolist()
+    
+    print(f"\n📋 Test Results:")
+    print(f"   Dimension tables: {sorted(dim_tables)}")
+    print(f"   Fact rows: {len(fact_table)}, fact_id range: {fact_table['fact_id'].min()}-{fact_table['fact_id'].max()}")
+    print(f"   home_ownership ids round-trip: {round_trip}")
+    
+    expected_dims = ['home_ownership_dim', 'issue_d_dim', 'loan_status_dim']
+    if (sorted(dim_tables) == expected_dims and len(fact_table) == len(test_df)
+            and fact_table['fact_id'].tolist() == list(range(1, len(test_df) + 1)) and round_trip):
+        print("   ✅ PASS: Star schema structure is correct")
+        return True
+    else:
+        print("   ❌ FAIL: Star schema structure mismatch")
+        return False
+
+def test_case_2_streaming_matches_batch():
+    """Test Case 2: โหมด streaming ให้ผลเหมือนโหมดปกติ"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 2: โหมด streaming ให้ผลเหมือนโหมดปกติ")
+    print("="*60)
+    
+    temp_file_path = write_temp_csv(build_loan_data(5000))
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: 5,000, streamed in chunks of 700 rows")
+    print(f"   Expected output: identical fact and dimension tables")
+    
+    try:
+        batch_fact, batch_dims, _, _ = run_batch_pipeline(temp_file_path)
+        stream_fact, stream_dims, original_rows, _ = run_streaming_pipeline(temp_file_path, chunksize=700)
+        
+        same_fact = batch_fact.equals(stream_fact)
+        same_dims = sorted(batch_dims) == sorted(stream_dims) and all(
+            batch_dims[name].equals(stream_dims[name]) for name in batch_dims)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Rows read: {original_rows:,}")
+        print(f"   Fact rows: batch={len(batch_fact):,}, streaming={len(stream_fact):,}")
+        print(f"   Same fact table: {same_fact}")
+        print(f"   Same dimension tables: {same_dims}")
+        
+        if original_rows == 5000 and same_fact and same_dims:
+            print("   ✅ PASS: Streaming mode matches batch mode")
+            return True
+        else:
+            print("   ❌ FAIL: Streaming mode mismatch")
+            return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_3_column_projection():
+    """Test Case 3: อ่านเฉพาะคอลัมน์ที่ Star Schema ใช้"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 3: อ่านเฉพาะคอลัมน์ที่ Star Schema ใช้")
+    print("="*60)
+    
+    loan_df = build_loan_data(3000)
+    temp_file_path = write_temp_csv(loan_df)
+    
+    print(f"📊 Input Data:")
+    print(f"   Columns in file: {len(loan_df.columns)} (includes emp_title, desc)")
+    print(f"   Expected output: fact table equals a run on a file without the unused columns")
+    
+    try:
+        projected_fact, _, _, _ = run_batch_pipeline(temp_file_path, columns=required_columns())
+        
+        # ไฟล์อ้างอิงที่มีเฉพาะคอลัมน์ที่ต้องใช้
+        reference_path = write_temp_csv(loan_df[required_columns()])
+        try:
+            reference_fact, _, _, _ = run_batch_pipeline(reference_path)
+        finally:
+            os.unlink(reference_path)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Required columns: {required_columns()}")
+        print(f"   Fact rows: projected={len(projected_fact):,}, reference={len(reference_fact):,}")
+        
+        if 'emp_title' not in required_columns() and projected_fact.equals(reference_fact):
+            print("   ✅ PASS: Column projection works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Column projection mismatch")
+            return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_4_typed_load():
+    """Test Case 4: โหลดแบบกำหนด dtype ให้ค่าเหมือนเดิมแต่ใช้หน่วยความจำน้อยลง"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 4: โหลดแบบกำหนด dtype ให้ค่าเหมือนเดิมแต่ใช้หน่วยความจำน้อยลง")
+    print("="*60)
+    
+    temp_file_path = write_temp_csv(build_loan_data(3000))
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: 3,000")
+    print(f"   Expected output: same fact values, categorical term, smaller fact table")
+    
+    try:
+        plain_fact, _, _, _ = run_batch_pipeline(temp_file_path, columns=required_columns())
+        typed_fact, _, _, _ = run_batch_pipeline(temp_file_path, columns=required_columns(), typed_load=True)
+        
+        same_values = plain_fact.equals(typed_fact.astype(plain_fact.dtypes))
+        plain_bytes = plain_fact.memory_usage(deep=True).sum()
+        typed_bytes = typed_fact.memory_usage(deep=True).sum()
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Same values: {same_values}")
+        print(f"   term dtype: {typed_fact['term'].dtype}")
+        print(f"   Memory: {plain_bytes:,} -> {typed_bytes:,} bytes")
+        
+        if same_values and str(typed_fact['term'].dtype) == 'category' and typed_bytes < plain_bytes:
+            print("   ✅ PASS: Typed load works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Typed load mismatch")
+            return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_5_date_filter_pushdown():
+    """Test Case 5: กรองช่วงปีระหว่างอ่าน โดยเกณฑ์ null ยังคิดจากทั้งไฟล์"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 5: กรองช่วงปีระหว่างอ่าน โดยเกณฑ์ null ยังคิดจากทั้งไฟล์")
+    print("="*60)
+    
+    test_df = build_loan_data(3000)
+    years = pd.to_datetime(test_df['issue_d'], format='%b-%Y').dt.year
+    in_range = years.between(2016, 2019)
+    # desc: null ทุกแถวนอกช่วง + 20% ของแถวในช่วง -> ทั้งไฟล์ >30% null จึงต้องถูกลบก่อน dropna
+    rng = np.random.default_rng(0)
+    test_df['desc'] = np.where(in_range & (rng.random(len(test_df)) >= 0.2), 'text', None)
+    temp_file_path = write_temp_csv(test_df)
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: {len(test_df):,}, in 2016-2019: {in_range.sum():,}")
+    print(f"   desc null: {test_df['desc'].isna().mean()*100:.1f}% of file, "
+          f"{test_df.loc[in_range, 'desc'].isna().mean()*100:.1f}% of in-range rows")
+    print(f"   Expected output: every in-range row kept (desc dropped by whole-file null ratio)")
+    
+    try:
+        batch_fact, _, batch_original, batch_final = run_batch_pipeline(temp_file_path, columns=None)
+        stream_fact, _, stream_original, _ = run_streaming_pipeline(temp_file_path, chunksize=500, columns=None)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Original rows: batch={batch_original:,}, streaming={stream_original:,}")
+        print(f"   Fact rows: batch={batch_final:,}, streaming={len(stream_fact):,}")
+        
+        expected_rows = int((in_range & test_df['emp_title'].notna()).sum())
+        if (batch_original == stream_original == len(test_df) and batch_final == expected_rows
+                and batch_fact.equals(stream_fact)):
+            print("   ✅ PASS: Pushed-down date filter keeps whole-file null semantics")
+            return True
+        else:
+            print("   ❌ FAIL: Pushed-down date filter changed the result")
+            return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_6_artifact_bundle():
+    """Test Case 6: บันทึกผลลัพธ์เป็น artifact bundle แล้วโหลดกลับสำหรับ --deploy-from"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 6: บันทึกผลลัพธ์เป็น artifact bundle แล้วโหลดกลับสำหรับ --deploy-from")
+    print("="*60)
+    
+    temp_file_path = write_temp_csv(build_loan_data(2000))
+    bundle_dir = tempfile.mkdtemp()
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: 2,000, batch pipeline output saved to a bundle")
+    print(f"   Expected output: the bundle loads back to identical fact/dimension tables and row counts")
+    
+    try:
+        fact_table, dim_tables, original_rows, final_rows = run_batch_pipeline(temp_file_path)
+        save_etl_bundle(bundle_dir, fact_table, dim_tables, temp_file_path, original_rows)
+        loaded_fact, loaded_dims, loaded_original, loaded_final = load_etl_bundle(bundle_dir)
+        
+        same_dims = sorted(loaded_dims) == sorted(dim_tables) and all(
+            loaded_dims[name].equals(dim_tables[name]) for name in dim_tables)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Rows: original={loaded_original:,}, final={loaded_final:,}")
+        print(f"   Same fact table: {loaded_fact.equals(fact_table)}")
+        print(f"   Same dimension tables: {same_dims}")
+        
+        if (loaded_fact.equals(fact_table) and same_dims
+                and (loaded_original, loaded_final) == (original_rows, final_rows)):
+            print("   ✅ PASS: Artifact bundle round trip works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Artifact bundle round trip mismatch")
+            return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+        shutil.rmtree(bundle_dir, ignore_errors=True)
+
+def test_case_7_deploy_bulk_load():
+    """Test Case 7: deploy ตารางด้วย bulk loader ไปยัง SQLite แทน SQL Server"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 7: deploy ตารางด้วย bulk loader ไปยัง SQLite แทน SQL Server")
+    print("="*60)
+    
+    temp_file_path = write_temp_csv(build_loan_data(2000))
+    db_dir = tempfile.mkdtemp()
+    database_url = f"sqlite:///{os.path.join(db_dir, 'deploy.db')}"
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: 2,000, batch pipeline output deployed with load_method='multi'")
+    print(f"   Expected output: every table read back from the database equals the pipeline output")
+    
+    try:
+        fact_table, dim_tables, _, _ = run_batch_pipeline(temp_file_path)
+        success = deploy_to_database(fact_table, dim_tables, load_method='multi', database_url=database_url)
+        engine = create_engine(database_url)
+        
+        def same_table(table_name, df):
+            # SQLite อ่าน integer กลับเป็น int64 เสมอ - เทียบค่าหลังแปลงเป็น dtype เดิม
+            loaded = pd.read_sql_table(table_name, engine).astype(df.dtypes.to_dict())
+            return loaded.equals(df.reset_index(drop=True))
+        
+        same_fact = same_table(FACT_TABLE, fact_table)
+        same_dims = all(same_table(name, dim_df) for name, dim_df in dim_tables.items())
+        engine.dispose()
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Deploy succeeded: {success}")
+        print(f"   Same fact table: {same_fact}")
+        print(f"   Same dimension tables: {same_dims}")
+        
+        if success and same_fact and same_dims:
+            print("   ✅ PASS: Bulk deploy works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Deployed tables mismatch")
+            return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+def test_case_8_incremental_deploy():
+    """Test Case 8: deploy แบบ incremental โหลดเฉพาะ partition ใหม่ / ที่เปลี่ยน"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 8: deploy แบบ incremental โหลดเฉพาะ partition ใหม่ / ที่เปลี่ยน")
+    print("="*60)
+    
+    data = build_loan_data(3000)
+    first_file = write_temp_csv(data[data['issue_d'] != 'Dec-2019'])
+    updated = data.copy()
+    updated.loc[updated['issue_d'] == 'Jan-2017', 'loan_amnt'] = 123456.0
+    second_file = write_temp_csv(updated)
+    db_dir = tempfile.mkdtemp()
+    incremental_url = f"sqlite:///{os.path.join(db_dir, 'incremental.db')}"
+    full_url = f"sqlite:///{os.path.join(db_dir, 'full.db')}"
+    
+    print(f"📊 Input Data:")
+    print(f"   Run 1: 2016-2019 without Dec-2019, run 2: adds Dec-2019 and changes loan_amnt in Jan-2017")
+    print(f"   Expected output: run 2 loads only those 2 partitions, database content equals a full replace")
+    
+    def natural_fact(database_url):
+        # fact rows ในรูปค่าจริงของ dimension (id ของสองวิธีไม่จำเป็นต้องตรงกัน)
+        engine = create_engine(database_url)
+        fact = pd.read_sql_table(FACT_TABLE, engine)
+        for column in ['home_ownership', 'loan_status', 'issue_d']:
+            dim_df = pd.read_sql_table(f'{column}_dim', engine)
+            fact[f'{column}_id'] = fact[f'{column}_id'].map(dict(zip(dim_df[f'{column}_id'], dim_df[column])))
+        engine.dispose()
+        unique_ids = fact['fact_id'].is_unique
+        fact = fact.drop(columns='fact_id')
+        return fact.sort_values(list(fact.columns)).reset_index(drop=True), unique_ids
+    
+    try:
+        fact_table, dim_tables, _, _ = run_batch_pipeline(first_file)
+        deploy_to_database(fact_table, dim_tables, database_url=incremental_url, incremental=True)
+        
+        fact_table, dim_tables, _, _ = run_batch_pipeline(second_file)
+        deploy_to_database(fact_table, dim_tables, database_url=incremental_url, incremental=True)
+        deploy_to_database(fact_table, dim_tables, database_url=full_url)
+        
+        engine = create_engine(incremental_url)
+        control = read_load_control(engine, FACT_TABLE)
+        engine.dispose()
+        second_batch = sorted(control.loc[control['batch_id'] == 2, 'partition_key'])
+        incremental_fact, unique_ids = natural_fact(incremental_url)
+        full_fact, _ = natural_fact(full_url)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Partitions loaded in batch 2: {second_batch}")
+        print(f"   Rows: incremental={len(incremental_fact):,}, full={len(full_fact):,}")
+        print(f"   Same content: {incremental_fact.equals(full_fact)}, unique fact_id: {unique_ids}")
+        
+        if second_batch == ['2017-01-01', '2019-12-01'] and incremental_fact.equals(full_fact) and unique_ids:
+            print("   ✅ PASS: Incremental deploy works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Incremental deploy mismatch")
+            return False
+    
+    finally:
+        for path in [first_file, second_file]:
+            if os.path.exists(path):
+                os.unlink(path)
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+def test_case_9_key_registry():
+    """Test Case 9: key registry ทำให้ surrogate id คงเดิมข้ามการรันและตรงกับ database"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 9: key registry ทำให้ surrogate id คงเดิมข้ามการรันและตรงกับ database")
+    print("="*60)
+    
+    data = build_loan_data(3000)
+    first_file = write_temp_csv(data[(data['loan_status'] != 'Current') & (data['issue_d'] != 'Dec-2019')])
+    second_file = write_temp_csv(data.iloc[::-1])
+    registry_dir = tempfile.mkdtemp()
+    db_dir = tempfile.mkdtemp()
+    database_url = f"sqlite:///{os.path.join(db_dir, 'registry.db')}"
+    
+    print(f"📊 Input Data:")
+    print(f"   Run 1: without 'Current' and Dec-2019, run 2: all rows in reverse order (streaming)")
+    print(f"   Expected output: run 1 ids unchanged in run 2, new values appended, database ids equal run ids")
+    
+    def id_map(dim_tables, name):
+        dim_df = dim_tables[f'{name}_dim']
+        return dict(zip(dim_df[name].astype(str), dim_df[f'{name}_id']))
+    
+    try:
+        first_fact, first_dims, _, _ = run_batch_pipeline(first_file, key_registry=registry_dir)
+        deploy_to_database(first_fact, first_dims, database_url=database_url, incremental=True)
+        second_fact, second_dims, _, _ = run_streaming_pipeline(second_file, chunksize=500,
+                                                                key_registry=registry_dir)
+        deploy_to_database(second_fact, second_dims, database_url=database_url, incremental=True)
+        
+        engine = create_engine(database_url)
+        database_dims = {table_name: pd.read_sql_table(table_name, engine) for table_name in second_dims}
+        loaded_fact = pd.read_sql_table(FACT_TABLE, engine)
+        engine.dispose()
+        
+        names = ['home_ownership', 'loan_status', 'issue_d']
+        stable = all(set(id_map(first_dims, name).items()) <= set(id_map(second_dims, name).items())
+                     for name in names)
+        new_status_id = id_map(second_dims, 'loan_status')['Current']
+        same_in_database = all(id_map(database_dims, name) == id_map(second_dims, name) for name in names)
+        id_columns = [f'{name}_id' for name in names]
+        fact_ids = (loaded_fact[id_columns].value_counts().sort_index()
+                    .equals(second_fact[id_columns].value_counts().sort_index()))
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Run 1 loan_status ids: {id_map(first_dims, 'loan_status')}")
+        print(f"   Run 2 loan_status ids: {id_map(second_dims, 'loan_status')}")
+        print(f"   Stable ids: {stable}, database ids equal run ids: {same_in_database}, fact ids: {fact_ids}")
+        
+        if stable and new_status_id == 3 and same_in_database and fact_ids:
+            print("   ✅ PASS: Key registry keeps surrogate ids stable")
+            return True
+        else:
+            print("   ❌ FAIL: Surrogate ids changed between runs")
+            return False
+    
+    finally:
+        for path in [first_file, second_file]:
+            if os.path.exists(path):
+                os.unlink(path)
+        shutil.rmtree(registry_dir, ignore_errors=True)
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+def test_case_10_calendar_dimension():
+    """Test Case 10: issue_d_dim เป็น calendar ครบทุกเดือนและ id คำนวณจากวันที่"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 10: issue_d_dim เป็น calendar ครบทุกเดือนและ id คำนวณจากวันที่")
+    print("="*60)
+    
+    data = build_loan_data(500)
+    data = data[data['issue_d'].isin(['Mar-2016', 'Jul-2018'])]
+    temp_file_path = write_temp_csv(data)
+    unfiltered = build_loan_data(200).dropna(axis=1, how='any')
+    unfiltered['issue_d'] = pd.to_datetime(unfiltered['issue_d'], format='%b-%Y')
+    
+    print(f"📊 Input Data:")
+    print(f"   Pipeline rows: {len(data)} issued in Mar-2016 / Jul-2018, star schema of 2014-2020 rows")
+    print(f"   Expected output: 48 calendar months with only 2 used, ids = year * 12 + month, range widened to 84 months")
+    
+    try:
+        fact_table, dim_tables, _, _ = run_batch_pipeline(temp_file_path)
+        _, wide_dims = create_star_schema(unfiltered, verbose=False)
+        
+        calendar = dim_tables['issue_d_dim']
+        used = sorted(fact_table['issue_d_id'].unique().tolist())
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Calendar rows: {len(calendar)}, used ids: {used}")
+        print(f"   Widened calendar: {len(wide_dims['issue_d_dim'])} rows, "
+              f"{wide_dims['issue_d_dim']['year'].min()}-{wide_dims['issue_d_dim']['year'].max()}")
+        
+        if (len(calendar) == 48 and used == [2016 * 12 + 3, 2018 * 12 + 7]
+                and calendar['issue_d_id'].is_unique and len(wide_dims['issue_d_dim']) == 84):
+            print("   ✅ PASS: Calendar dimension works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Unexpected calendar dimension")
+            return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_11_compact_fact_table():
+    """Test Case 11: --compact ลดขนาดต่อแถวของ fact table โดยค่าเดิมและ checksum ไม่เปลี่ยน"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 11: --compact ลดขนาดต่อแถวของ fact table โดยค่าเดิมและ checksum ไม่เปลี่ยน")
+    print("="*60)
+    
+    temp_file_path = write_temp_csv(build_loan_data(5000))
+    db_dir = tempfile.mkdtemp()
+    database_url = f"sqlite:///{os.path.join(db_dir, 'compact.db')}"
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: 5,000, batch and streaming (chunks of 700) with compact=True")
+    print(f"   Expected output: same compact table in both modes, same values as the default table,")
+    print(f"   fewer bytes per row, incremental deploy of the compact table finds every partition unchanged")
+    
+    try:
+        plain_fact, plain_dims, _, _ = run_batch_pipeline(temp_file_path)
+        compact_fact, _, _, _ = run_batch_pipeline(temp_file_path, compact=True)
+        stream_fact, _, _, _ = run_streaming_pipeline(temp_file_path, chunksize=700, compact=True)
+        
+        restored = compact_fact.astype({column: dtype for column, dtype in plain_fact.dtypes.items()})
+        for column in ['loan_amnt', 'funded_amnt', 'installment']:
+            restored[column] = restored[column].round(2)
+        plain_bytes = plain_fact.memory_usage(deep=True, index=False).sum() / len(plain_fact)
+        compact_bytes = compact_fact.memory_usage(deep=True, index=False).sum() / len(compact_fact)
+        
+        deploy_to_database(plain_fact, plain_dims, database_url=database_url)
+        deploy_to_database(compact_fact, plain_dims, database_url=database_url, incremental=True)
+        engine = create_engine(database_url)
+        batches = read_load_control(engine, FACT_TABLE)['batch_id'].unique().tolist()
+        engine.dispose()
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Compact dtypes: {dict(compact_fact.dtypes.astype(str))}")
+        print(f"   Bytes per row: {plain_bytes:.1f} -> {compact_bytes:.1f}")
+        print(f"   Streaming equals batch: {stream_fact.equals(compact_fact)}, values kept: {restored.equals(plain_fact)}")
+        print(f"   Control batches after the compact incremental deploy: {batches}")
+        
+        if (stream_fact.equals(compact_fact) and restored.equals(plain_fact) and compact_bytes < plain_bytes / 3
+                and batches == [1]):
+            print("   ✅ PASS: Compact fact table works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Compact fact table mismatch")
+            return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+def test_case_12_stats_catalog():
+    """Test Case 12: stats catalog ทำให้รอบถัดไปไม่อ่านคอลัมน์ที่ null เกินเกณฑ์ และข้าม pass 1"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 12: stats catalog ทำให้รอบถัดไปไม่อ่านคอลัมน์ที่ null เกินเกณฑ์ และข้าม pass 1")
+    print("="*60)
+    
+    temp_file_path = write_temp_csv(build_loan_data(3000))
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: 3,000 (desc 90% null), batch then batch / streaming (chunks of 500) with stats_catalog=True")
+    print(f"   Expected output: same tables as without the catalog, desc not read in the second run,")
+    print(f"   streaming reads the file once (pass 2 only)")
+    
+    reads = []
+    original_load_data = etl_pipeline.load_data
+    
+    def recording_load_data(*args, **kwargs):
+        usecols = kwargs.get('usecols')
+        reads.append(usecols is None or (usecols('desc') if callable(usecols) else 'desc' in usecols))
+        return original_load_data(*args, **kwargs)
+    
+    try:
+        plain_fact, plain_dims, plain_rows, _ = run_batch_pipeline(temp_file_path)
+        plain_stream, _, _, _ = run_streaming_pipeline(temp_file_path, chunksize=500)
+        
+        etl_pipeline.load_data = recording_load_data
+        first_fact, _, _, _ = run_batch_pipeline(temp_file_path, stats_catalog=True)
+        first_reads, reads[:] = list(reads), []
+        second_fact, second_dims, second_rows, _ = run_batch_pipeline(temp_file_path, stats_catalog=True)
+        batch_reads, reads[:] = list(reads), []
+        stream_fact, _, _, _ = run_streaming_pipeline(temp_file_path, chunksize=500, stats_catalog=True)
+        stream_reads = list(reads)
+        
+        same_dims = all(second_dims[name].equals(dim) for name, dim in plain_dims.items())
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Catalog exists: {os.path.exists(temp_file_path + '.stats.json')}")
+        print(f"   desc read: first run {first_reads}, second run {batch_reads}, streaming {stream_reads}")
+        print(f"   Same fact/dims: {first_fact.equals(plain_fact)} {second_fact.equals(plain_fact)} {same_dims}, "
+              f"streaming {stream_fact.equals(plain_stream)}, rows {second_rows}/{plain_rows}")
+        
+        if (first_reads == [True] and batch_reads == [False] and stream_reads == [False]
+                and first_fact.equals(plain_fact) and second_fact.equals(plain_fact) and same_dims
+                and stream_fact.equals(plain_stream) and second_rows == plain_rows):
+            print("   ✅ PASS: Stats catalog prunes columns before reading")
+            return True
+        else:
+            print("   ❌ FAIL: Stats catalog mismatch")
+            return False
+    
+    finally:
+        etl_pipeline.load_data = original_load_data
+        for path in [temp_file_path, temp_file_path + '.stats.json']:
+            if os.path.exists(path):
+                os.unlink(path)
+
+def test_case_13_multi_file_input():
+    """Test Case 13: หลายไฟล์ (directory / glob) บน process pool ได้ Star Schema เดียวกับไฟล์ที่ต่อกัน"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 13: หลายไฟล์ (directory / glob) บน process pool ได้ Star Schema เดียวกับไฟล์ที่ต่อกัน")
+    print("="*60)
+    
+    df = build_loan_data(4000)
+    temp_file_path = write_temp_csv(df)
+    input_dir = tempfile.mkdtemp()
+    for i, start in enumerate(range(0, len(df), 1000)):
+        df.iloc[start:start + 1000].to_csv(os.path.join(input_dir, f'LoanStats_2016Q{i + 1}.csv'), index=False)
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: 4,000 split into 4 quarterly files of 1,000 rows")
+    print(f"   Expected output: directory and glob list the same 4 files, 2 processes and 1 process give")
+    print(f"   the same fact / dimension tables and row counts as the single concatenated file")
+    
+    try:
+        files = input_files(input_dir)
+        matched = input_files(os.path.join(input_dir, 'LoanStats_2016Q*.csv'))
+        single_fact, single_dims, single_rows, single_final = run_batch_pipeline(temp_file_path)
+        pool_fact, pool_dims, pool_rows, pool_final = run_multi_file_pipeline(files, workers=2)
+        inline_fact, _, _, _ = run_multi_file_pipeline(files, workers=1)
+        
+        same_dims = (single_dims.keys() == pool_dims.keys()
+                     and all(pool_dims[name].equals(dim) for name, dim in single_dims.items()))
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Files: {[os.path.basename(path) for path in files]}, glob equal: {matched == files}")
+        print(f"   Rows: single {single_rows}/{single_final}, multi-file {pool_rows}/{pool_final}")
+        print(f"   Same fact (2 processes / 1 process): {pool_fact.equals(single_fact)} / "
+              f"{inline_fact.equals(single_fact)}, same dims: {same_dims}")
+        
+        if (len(files) == 4 and matched == files and pool_fact.equals(single_fact)
+                and inline_fact.equals(single_fact) and same_dims
+                and (pool_rows, pool_final) == (single_rows, single_final)):
+            print("   ✅ PASS: Multi-file input builds one consistent star schema")
+            return True
+        else:
+            print("   ❌ FAIL: Multi-file result differs from the single file")
+            return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+        shutil.rmtree(input_dir, ignore_errors=True)
+
+def test_case_14_stage_metrics_file():
+    """Test Case 14: --metrics-file บันทึกเวลา / หน่วยความจำ / จำนวนแถวของทุกขั้นตอน"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 14: --metrics-file บันทึกเวลา / หน่วยความจำ / จำนวนแถวของทุกขั้นตอน")
+    print("="*60)
+    
+    temp_file_path = write_temp_csv(build_loan_data(3000))
+    output_dir = tempfile.mkdtemp()
+    json_file = os.path.join(output_dir, 'etl_metrics.json')
+    csv_file = os.path.join(output_dir, 'etl_metrics.csv')
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: 3,000, main() batch --compact with a JSON metrics file,")
+    print(f"   streaming (chunks of 500) --trace-memory with a CSV metrics file")
+    print(f"   Expected output: one ok record per stage, row counts match the pipeline, tracemalloc peak")
+    print(f"   only with --trace-memory")
+    
+    try:
+        batch_ok = etl_pipeline.main(['--input', temp_file_path, '--compact', '--metrics-file', json_file])
+        stream_ok = etl_pipeline.main(['--input', temp_file_path, '--chunksize', '500', '--trace-memory',
+                                       '--metrics-file', csv_file])
+        fact_table, _, original_rows, final_rows = run_batch_pipeline(temp_file_path, columns=required_columns())
+        
+        with open(json_file, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        stages = {record['stage']: record for record in document['stages']}
+        stream_df = pd.read_csv(csv_file)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Batch stages: {list(stages)}")
+        print(f"   Streaming stages: {stream_df['stage'].tolist()}")
+        print(f"   load rows: {stages['load']['rows_out']}, star_schema rows: {stages['star_schema']['rows_out']}")
+        print(f"   Run input: {document['run']['input'] == temp_file_path}, "
+              f"tracemalloc peak: {stream_df['tracemalloc_peak_mb'].tolist()}")
+        
+        if (batch_ok and stream_ok
+                and list(stages) == ['load', 'type_analysis', 'clean', 'filter', 'dropna', 'star_schema', 'compact']
+                and all(record['status'] == 'ok' and record['wall_seconds'] >= 0 for record in stages.values())
+                and stages['load']['rows_in'] == original_rows and stages['clean']['rows_in'] == stages['load']['rows_out']
+                and stages['dropna']['rows_out'] == stages['star_schema']['rows_in'] == final_rows
+                and stages['star_schema']['rows_out'] == len(fact_table)
+                and stages['load']['tracemalloc_peak_mb'] is None and document['run']['input'] == temp_file_path
+                and document['run']['options']['compact'] is True
+                and stream_df['stage'].tolist() == ['null_profile', 'stream']
+                and stream_df['rows_in'].tolist() == [3000, 3000]
+                and stream_df['tracemalloc_peak_mb'].notna().all()):
+            print("   ✅ PASS: Stage metrics file matches the pipeline")
+            return True
+        else:
+            print("   ❌ FAIL: Stage metrics file mismatch")
+            return False
+    
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+        os.unlink(temp_file_path)
+
+def test_case_15_dag_pipeline():
+    """Test Case 15: run_dag_pipeline() ได้ผลเหมือน batch และรันใหม่เฉพาะ node ที่ parameter เปลี่ยน"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 15: run_dag_pipeline() ได้ผลเหมือน batch และรันใหม่เฉพาะ node ที่ parameter เปลี่ยน")
+    print("="*60)
+    
+    temp_file_path = write_temp_csv(build_loan_data(3000))
+    dag_cache = tempfile.mkdtemp()
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: 3,000, DAG cache on disk, runs: default, same again (new process),")
+    print(f"   max_null_percentage=50, issue_years=(2017, 2018)")
+    print(f"   Expected output: same tables as batch, cached rerun computes nothing, threshold change")
+    print(f"   recomputes clean/filter/final only, year change recomputes filter/final only")
+    
+    try:
+        batch_fact, batch_dims, batch_original, batch_final = run_batch_pipeline(temp_file_path)
+        computed = []
+        for options in [{}, {}, {'max_null_percentage': 50}, {'max_null_percentage': 50, 'issue_years': (2017, 2018)}]:
+            metrics = []
+            result = run_dag_pipeline(temp_file_path, dag_cache=dag_cache, metrics=metrics, **options)
+            computed.append([record['stage'] for record in metrics if record['stage'] not in ('star_schema', 'compact')])
+            if not options:
+                dag_fact, dag_dims, dag_original, dag_final = result
+        calendar = result[1]['issue_d_dim'].set_index('issue_d_id')['year']
+        years = sorted(calendar[result[0]['issue_d_id']].unique().tolist())
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Batch: {batch_original:,} -> {batch_final:,} rows, DAG: {dag_original:,} -> {dag_final:,} rows")
+        print(f"   Computed nodes per run: {computed}")
+        print(f"   Years after issue_years=(2017, 2018): {years}")
+        
+        if (dag_fact.equals(batch_fact) and (dag_original, dag_final) == (batch_original, batch_final)
+                and all(dag_dims[name].equals(batch_dims[name]) for name in batch_dims)
+                and sorted(computed[0]) == ['clean', 'column_types', 'filter', 'final', 'load', 'rows']
+                and computed[1] == [] and sorted(computed[2]) == ['clean', 'filter', 'final']
+                and sorted(computed[3]) == ['filter', 'final']
+                and years == [2017, 2018]):
+            print("   ✅ PASS: DAG pipeline matches batch and recomputes only changed nodes")
+            return True
+        else:
+            print("   ❌ FAIL: DAG pipeline mismatch")
+            return False
+    
+    finally:
+        shutil.rmtree(dag_cache, ignore_errors=True)
+        os.unlink(temp_file_path)
+
+def test_case_16_compact_bundle_deploy():
+    """Test Case 16: bundle และ deploy ของ --compact ได้จำนวนเงินระดับสตางค์ตรงตัว"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 16: bundle และ deploy ของ --compact ได้จำนวนเงินระดับสตางค์ตรงตัว")
+    print("="*60)
+    
+    temp_file_path = write_temp_csv(build_loan_data(3000))
+    bundle_dir = tempfile.mkdtemp()
+    db_dir = tempfile.mkdtemp()
+    database_url = f"sqlite:///{os.path.join(db_dir, 'compact_bundle.db')}"
+    money_columns = ['loan_amnt', 'funded_amnt', 'installment']
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: 3,000, compact batch output saved to a bundle, deployed from the bundle to SQLite")
+    print(f"   Expected output: money columns in the bundle and the database equal the default run exactly,")
+    print(f"   the printed loan amount total equals the float64 total")
+    
+    try:
+        plain_fact, _, _, _ = run_batch_pipeline(temp_file_path)
+        compact_fact, dim_tables, original_rows, _ = run_batch_pipeline(temp_file_path, compact=True)
+        save_etl_bundle(bundle_dir, compact_fact, dim_tables, temp_file_path, original_rows)
+        bundle_fact, bundle_dims, _, _ = load_etl_bundle(bundle_dir)
+        success = deploy_to_database(bundle_fact, bundle_dims, load_method='multi', database_url=database_url)
+        engine = create_engine(database_url)
+        deployed = pd.read_sql_table(FACT_TABLE, engine).sort_values('fact_id').reset_index(drop=True)
+        engine.dispose()
+        
+        expected = plain_fact.reset_index(drop=True)[money_columns]
+        bundle_exact = bundle_fact.reset_index(drop=True)[money_columns].equals(expected)
+        deployed_exact = deployed[money_columns].equals(expected)
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            show_etl_results(compact_fact, dim_tables)
+        expected_total = f"Total: ${plain_fact['loan_amnt'].sum():,.2f}"
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Deploy succeeded: {success}")
+        print(f"   Bundle dtypes: {dict(bundle_fact[money_columns].dtypes.astype(str))}")
+        print(f"   Bundle values exact: {bundle_exact}, database values exact: {deployed_exact}")
+        print(f"   Sample installment in database: {deployed['installment'].head(3).tolist()}")
+        print(f"   Printed total matches {expected_total}: {expected_total in output.getvalue()}")
+        
+        if success and bundle_exact and deployed_exact and expected_total in output.getvalue():
+            print("   ✅ PASS: Compact output is restored before leaving the pipeline")
+            return True
+        else:
+            print("   ❌ FAIL: Compact money values leaked as float32")
+            return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+        shutil.rmtree(bundle_dir, ignore_errors=True)
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+def test_case_17_incremental_removed_partitions():
+    """Test Case 17: deploy แบบ incremental ลบ partition ที่ไม่มีในข้อมูลรอบใหม่แล้ว"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 17: deploy แบบ incremental ลบ partition ที่ไม่มีในข้อมูลรอบใหม่แล้ว")
+    print("="*60)
+    
+    data = build_loan_data(3000)
+    first_file = write_temp_csv(data)
+    second_file = write_temp_csv(data[~data['issue_d'].isin(['Jan-2017', 'Dec-2019'])])
+    db_dir = tempfile.mkdtemp()
+    incremental_url = f"sqlite:///{os.path.join(db_dir, 'removed.db')}"
+    full_url = f"sqlite:///{os.path.join(db_dir, 'removed_full.db')}"
+    
+    print(f"📊 Input Data:")
+    print(f"   Run 1: 2016-2019, run 2: same rows without Jan-2017 and Dec-2019")
+    print(f"   Expected output: run 2 deletes those partitions' fact rows and control records,")
+    print(f"   database content equals a full replace")
+    
+    def fact_and_control(database_url):
+        engine = create_engine(database_url)
+        fact = pd.read_sql_table(FACT_TABLE, engine)
+        issue_dim = pd.read_sql_table('issue_d_dim', engine)
+        fact['issue_d_id'] = fact['issue_d_id'].map(dict(zip(issue_dim['issue_d_id'], issue_dim['issue_d'].astype(str))))
+        control = read_load_control(engine, FACT_TABLE)
+        engine.dispose()
+        fact = fact.drop(columns=['fact_id', 'home_ownership_id', 'loan_status_id'])
+        return fact.sort_values(list(fact.columns)).reset_index(drop=True), control
+    
+    try:
+        fact_table, dim_tables, _, _ = run_batch_pipeline(first_file)
+        deploy_to_database(fact_table, dim_tables, database_url=incremental_url, incremental=True)
+        
+        fact_table, dim_tables, _, _ = run_batch_pipeline(second_file)
+        deploy_to_database(fact_table, dim_tables, database_url=incremental_url, incremental=True)
+        deploy_to_database(fact_table, dim_tables, database_url=full_url)
+        
+        incremental_fact, control = fact_and_control(incremental_url)
+        full_fact, full_control = fact_and_control(full_url)
+        removed = {'2017-01-01', '2019-12-01'}
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Rows: incremental={len(incremental_fact):,}, full={len(full_fact):,}")
+        print(f"   Removed partitions left in fact: {sorted(removed & set(incremental_fact['issue_d_id']))}")
+        print(f"   Removed partitions left in control: {sorted(removed & set(control['partition_key']))}")
+        print(f"   Same content: {incremental_fact.equals(full_fact)}")
+        
+        if (incremental_fact.equals(full_fact) and not removed & set(incremental_fact['issue_d_id'])
+                and sorted(control['partition_key']) == sorted(full_control['partition_key'])):
+            print("   ✅ PASS: Removed partitions are deleted")
+            return True
+        else:
+            print("   ❌ FAIL: Removed partitions are still loaded")
+            return False
+    
+    finally:
+        for path in [first_file, second_file]:
+            if os.path.exists(path):
+                os.unlink(path)
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+def run_all_tests():
+    """รัน Test Cases ทั้งหมด"""
+    print("🚀 Starting ETL Pipeline Tests")
+    print("Target: etl_pipeline - Star Schema และโหมด streaming")
+    
+    results = []
+    
+    # รัน test cases
+    results.append(test_case_1_star_schema_structure())
+    results.append(test_case_2_streaming_matches_batch())
+    results.append(test_case_3_column_projection())
+    results.append(test_case_4_typed_load())
+    results.append(test_case_5_date_filter_pushdown())
+    results.append(test_case_6_artifact_bundle())
+    results.append(test_case_7_deploy_bulk_load())
+    results.append(test_case_8_incremental_deploy())
+    results.append(test_case_9_key_registry())
+    results.append(test_case_10_calendar_dimension())
+    results.append(test_case_11_compact_fact_table())
+    results.append(test_case_12_stats_catalog())
+    results.append(test_case_13_multi_file_input())
+    results.append(test_case_14_stage_metrics_file())
+    results.append(test_case_15_dag_pipeline())
+    results.append(test_case_16_compact_bundle_deploy())
+    results.append(test_case_17_incremental_removed_partitions())
+    
+    # สรุปผลลัพธ์
+    print("\n" + "="*60)
+    print("📊 SUMMARY RESULTS")
+    print("="*60)
+    
+    test_names = [
+        "Test Case 1: โครงสร้าง Star Schema",
+        "Test Case 2: โหมด streaming ให้ผลเหมือนโหมดปกติ",
+        "Test Case 3: อ่านเฉพาะคอลัมน์ที่ Star Schema ใช้",
+        "Test Case 4: โหลดแบบกำหนด dtype ให้ค่าเหมือนเดิมแต่ใช้หน่วยความจำน้อยลง",
+        "Test Case 5: กรองช่วงปีระหว่างอ่าน โดยเกณฑ์ null ยังคิดจากทั้งไฟล์",
+        "Test Case 6: บันทึกผลลัพธ์เป็น artifact bundle แล้วโหลดกลับสำหรับ --deploy-from",
+        "Test Case 7: deploy ตารางด้วย bulk loader ไปยัง SQLite แทน SQL Server",
+        "Test Case 8: deploy แบบ incremental โหลดเฉพาะ partition ใหม่ / ที่เปลี่ยน",
+        "Test Case 9: key registry ทำให้ surrogate id คงเดิมข้ามการรันและตรงกับ database",
+        "Test Case 10: issue_d_dim เป็น calendar ครบทุกเดือนและ id คำนวณจากวันที่",
+        "Test Case 11: --compact ลดขนาดต่อแถวของ fact table โดยค่าเดิมและ checksum ไม่เปลี่ยน",
+        "Test Case 12: stats catalog ทำให้รอบถัดไปไม่อ่านคอลัมน์ที่ null เกินเกณฑ์ และข้าม pass 1",
+        "Test Case 13: หลายไฟล์ (directory / glob) บน process pool ได้ Star Schema เดียวกับไฟล์ที่ต่อกัน",
+        "Test Case 14: --metrics-file บันทึกเวลา / หน่วยความจำ / จำนวนแถวของทุกขั้นตอน",
+        "Test Case 15: run_dag_pipeline() ได้ผลเหมือน batch และรันใหม่เฉพาะ node ที่ parameter เปลี่ยน",
+        "Test Case 16: bundle และ deploy ของ --compact ได้จำนวนเงินระดับสตางค์ตรงตัว",
+        "Test Case 17: deploy แบบ incremental ลบ partition ที่ไม่มีในข้อมูลรอบใหม่แล้ว"
+    ]
+    
+    passed = 0
+    for i, (name, result) in enumerate(zip(test_names, results)):
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{i+1}. {name}: {status}")
+        if result:
+            passed += 1
+    
+    print(f"\n🎯 Overall Result: {passed}/{len(results)} tests passed")
+    
+    if passed == len(results):
+        print("🎉 ALL TESTS PASSED! ฟังก์ชันทำงานถูกต้องตาม spec")
+    else:
+        print("⚠️  SOME TESTS FAILED! ต้องแก้ไขฟังก์ชัน")
+    
+    return passed == len(results)
+
+if __name__ == "__main__":
+    # รัน tests
+    success = run_all_tests()
+    
+    print(f"\n{'='*60}")
+    print("🔚 Test Execution Complete")
+    print(f"{'='*60}")
+    
+    exit(0 if success else 1)
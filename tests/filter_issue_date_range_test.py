@@ -14,7 +14,7 @@ from datetime import datetime
 # เพิ่ม path สำหรับ import functions
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from functions.filter_issue_date_range import filter_issue_date_range
+from functions.filter_issue_date_range import filter_issue_date_range, issue_date_in_range
 
 # ===== Test Cases =====
 
@@ -199,6 +199,39 @@ def test_case_4_edge_cases():
     
     return test_4a_pass and test_4b_pass
 
+def test_case_5_in_range_mask():
+    """Test Case 5: mask ของช่วงปีจากข้อความวันที่ดิบ (issue_date_in_range)"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 5: mask ของช่วงปีจากข้อความวันที่ดิบ (issue_date_in_range)")
+    print("="*60)
+    
+    test_df = pd.DataFrame({
+        'issue_d': ['Dec-2015', 'Jan-2016', None, 'Jun-2018', 'Dec-2019', 'Jan-2020', 'Jan-2016'],
+        'loan_amnt': [1000, 2000, 3000, 4000, 5000, 6000, 7000]
+    })
+    
+    print(f"📊 Input Data:")
+    print(f"   Raw dates: {test_df['issue_d'].tolist()}")
+    print(f"   Expected output: same rows as filter_issue_date_range(), all-null -> none, unparseable -> all")
+    
+    mask = issue_date_in_range(test_df['issue_d'])
+    filtered = filter_issue_date_range(test_df, verbose=False)
+    all_null = issue_date_in_range(pd.Series([np.nan, np.nan]))
+    unparseable = issue_date_in_range(pd.Series(['Jan-2016', 'not_a_date']))
+    
+    print(f"\n📋 Test Results:")
+    print(f"   Mask: {mask.tolist()}")
+    print(f"   filter_issue_date_range rows: {filtered.index.tolist()}")
+    print(f"   All-null mask: {all_null.tolist()}, unparseable mask: {unparseable.tolist()}")
+    
+    if (test_df.index[mask].tolist() == filtered.index.tolist() == [1, 3, 4, 6]
+            and not all_null.any() and unparseable.all()):
+        print("   ✅ PASS: In-range mask matches the filter")
+        return True
+    else:
+        print("   ❌ FAIL: In-range mask mismatch")
+        return False
+
 def run_all_tests():
     """รัน Test Cases ทั้งหมด"""
     print("🚀 Starting Date Filtering Function Tests")
@@ -211,6 +244,7 @@ def run_all_tests():
     results.append(test_case_2_boundary_testing()) 
     results.append(test_case_3_string_format())
     results.append(test_case_4_edge_cases())
+    results.append(test_case_5_in_range_mask())
     
     # สรุปผลลัพธ์
     print("\n" + "="*60)
@@ -221,7 +255,8 @@ def run_all_tests():
         "Test Case 1: การกรองพื้นฐาน",
         "Test Case 2: ทดสอบขอบเขต", 
         "Test Case 3: รูปแบบข้อมูล String",
-        "Test Case 4: Edge Cases"
+        "Test Case 4: Edge Cases",
+        "Test Case 5: mask ของช่วงปีจากข้อความวันที่ดิบ (issue_date_in_range)"
     ]
     
     passed = 0
@@ -10,13 +10,17 @@ import numpy as np
 import re
 import os
 import sys
+import shutil
 import tempfile
 from datetime import datetime
 
 # เพิ่ม path สำหรับ import functions
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from functions.guess_column_types import guess_column_types
+from functions.guess_column_types import guess_column_types, clear_column_types_memo
+
+# module ของฟังก์ชัน (ชื่อ functions.guess_column_types ถูกแทนด้วยฟังก์ชันใน __init__)
+gct_module = sys.modules['functions.guess_column_types']
 
 # ===== Test Cases =====
 
@@ -75,12 +79,12 @@ def test_case_1_basic_type_detection():
             print(f"   Error: {result}")
             print("   ❌ FAIL: Function returned error")
             return False
-            
+    
     except Exception as e:
         print(f"\n📋 Test Results:")
         print(f"   ❌ FAIL: Exception occurred: {str(e)}")
         return False
-        
+    
     finally:
         # ลบไฟล์ชั่วคราว
         if os.path.exists(temp_file_path):
@@ -142,12 +146,12 @@ def test_case_2_date_datetime_detection():
             print(f"   Error: {result}")
             print("   ❌ FAIL: Function returned error")
             return False
-            
+    
     except Exception as e:
         print(f"\n📋 Test Results:")
         print(f"   ❌ FAIL: Exception occurred: {str(e)}")
         return False
-        
+    
     finally:
         # ลบไฟล์ชั่วคราว
         if os.path.exists(temp_file_path):
@@ -193,10 +197,10 @@ def test_case_3_different_delimiters():
             
             if success and len(result) == 3:  # ควรมี 3 คอลัมน์
                 successful_delimiters += 1
-                
+        
         except Exception:
             pass  # ไม่ต้องทำอะไร เก็บสถิติไว้ที่ท้าย
-            
+        
         finally:
             # ลบไฟล์ชั่วคราว
             if os.path.exists(temp_file_path):
@@ -249,18 +253,285 @@ def test_case_4_edge_cases():
         print(f"   Actual output: success={success}")
         test_4b_pass = True  # ทั้ง success หรือ failure ก็ยอมรับได้สำหรับไฟล์ว่าง
         print(f"   {'✅ PASS' if test_4b_pass else '❌ FAIL'}: Empty file handling")
-        
+    
     except Exception as e:
         print(f"   Actual output: Exception - {str(e)}")
         test_4b_pass = False
         print(f"   {'✅ PASS' if test_4b_pass else '❌ FAIL'}: Empty file handling")
-        
+    
     finally:
         if os.path.exists(empty_file_path):
             os.unlink(empty_file_path)
     
     return test_4a_pass and test_4b_pass
 
+def test_case_5_dataframe_input():
+    """Test Case 5: ส่ง DataFrame ที่โหลดไว้แล้วแทน path"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 5: ส่ง DataFrame ที่โหลดไว้แล้วแทน path")
+    print("="*60)
+    
+    test_data = pd.DataFrame({
+        'integer_col': [1, 2, 3],
+        'string_col': ['a', 'b', 'c'],
+        'date_col': ['2023-01-15', '2023-02-20', '2023-03-25']
+    })
+    
+    # สร้างไฟล์ชั่วคราวเพื่อเทียบผลลัพธ์ระหว่าง path กับ DataFrame
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+        test_data.to_csv(temp_file.name, index=False)
+        temp_file_path = temp_file.name
+    
+    print(f"📊 Input Data:")
+    print(f"   Same data passed as file path and as loaded DataFrame")
+    print(f"   Expected output: identical column type dicts")
+    
+    try:
+        loaded_df = pd.read_csv(temp_file_path)
+        success_path, result_path = guess_column_types(temp_file_path)
+        success_df, result_df = guess_column_types(loaded_df)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   From path: {result_path}")
+        print(f"   From DataFrame: {result_df}")
+        
+        if success_path and success_df and result_path == result_df:
+            print("   ✅ PASS: DataFrame input gives the same result as file input")
+            return True
+        else:
+            print("   ❌ FAIL: DataFrame input result mismatch")
+            return False
+    
+    except Exception as e:
+        print(f"\n📋 Test Results:")
+        print(f"   ❌ FAIL: Exception occurred: {str(e)}")
+        return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_6_vectorized_detection():
+    """Test Case 6: ตรวจจับจาก unique values บนข้อมูลจำนวนมาก"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 6: ตรวจจับจาก unique values บนข้อมูลจำนวนมาก")
+    print("="*60)
+    
+    # ข้อมูลซ้ำจำนวนมาก + null + ค่าที่ไม่ตรง pattern อยู่ท้ายคอลัมน์
+    n_rows = 20000
+    late_mismatch = ['2023-01-15'] * (n_rows - 1) + ['not_a_date']
+    test_df = pd.DataFrame({
+        'date_col': ['2023-01-15', '2023-02-20', None, '2023-03-25'] * (n_rows // 4),  # ✅ 'date'
+        'datetime_col': ['2023-01-15 14:30:45', None] * (n_rows // 2),  # ✅ 'datetime64'
+        'late_mismatch_col': late_mismatch,  # ✅ 'string' (ค่าสุดท้ายไม่ใช่วันที่)
+        'numeric_col': np.arange(n_rows),  # ✅ 'integer'
+        'empty_col': [np.nan] * n_rows  # ✅ 'datetime64' (all() ของคอลัมน์ว่างเป็น True เหมือนเดิม)
+    })
+    
+    expected = {
+        'date_col': 'date',
+        'datetime_col': 'datetime64',
+        'late_mismatch_col': 'string',
+        'numeric_col': 'integer',
+        'empty_col': 'datetime64'
+    }
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: {n_rows:,}")
+    print(f"   Expected output: {expected}")
+    
+    success, result = guess_column_types(test_df)
+    
+    print(f"\n📋 Test Results:")
+    print(f"   Success: {success}")
+    print(f"   Detected: {result}")
+    
+    if success and result == expected:
+        print("   ✅ PASS: Vectorized detection matches per-value semantics")
+        return True
+    else:
+        print("   ❌ FAIL: Vectorized detection mismatch")
+        return False
+
+def test_case_7_sampling_with_confidence():
+    """Test Case 7: เดาประเภทจากตัวอย่างพร้อมค่าความมั่นใจ"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 7: เดาประเภทจากตัวอย่างพร้อมค่าความมั่นใจ")
+    print("="*60)
+    
+    n_rows = 5000
+    test_data = pd.DataFrame({
+        'date_col': ['2023-01-15'] * n_rows,  # ✅ 'date' มั่นใจสูง
+        'sparse_col': [None] * (n_rows - 1) + ['2023-01-15 10:00:00'],  # ⚠️ ตัวอย่างไม่มีค่า -> ต้องตรวจซ้ำ
+        'late_text_col': ['2023-01-15'] * (n_rows - 1) + ['text']  # ⚠️ ตัวอย่างดูเหมือน 'date'
+    })
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+        test_data.to_csv(temp_file.name, index=False)
+        temp_file_path = temp_file.name
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: {n_rows:,}, sample_size=100 (head)")
+    print(f"   Expected output: sparse_col has confidence 0.0 and is verified to 'datetime64'")
+    
+    try:
+        success, result, confidence = guess_column_types(temp_file_path, sample_size=100,
+                                                         return_confidence=True)
+        verified_ok, verified, verified_confidence = guess_column_types(temp_file_path, sample_size=100,
+                                                                        verify_threshold=0.5,
+                                                                        return_confidence=True)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Sampled: {result}")
+        print(f"   Confidence: {confidence}")
+        print(f"   Verified (threshold 0.5): {verified}")
+        
+        sampled_ok = (success and result['date_col'] == 'date' and confidence['date_col'] > 0.9
+                      and confidence['sparse_col'] == 0.0)
+        verify_ok = (verified_ok and verified['sparse_col'] == 'datetime64'
+                     and verified_confidence['sparse_col'] == 1.0)
+        
+        if sampled_ok and verify_ok:
+            print("   ✅ PASS: Sampling with confidence works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Sampling/verification mismatch")
+            return False
+    
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_8_parallel_column_inference():
+    """Test Case 8: workers= เดาประเภทพร้อมกันทีละกลุ่มคอลัมน์ได้ผลเหมือนแบบทีละคอลัมน์"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 8: workers= เดาประเภทพร้อมกันทีละกลุ่มคอลัมน์ได้ผลเหมือนแบบทีละคอลัมน์")
+    print("="*60)
+    
+    n_rows = 20000
+    rng = np.random.default_rng(7)
+    days = pd.date_range('2016-01-01', periods=365, freq='D')
+    base = pd.DataFrame({
+        'loan_amnt': rng.integers(1000, 40000, n_rows).astype(float),
+        'term': rng.choice([' 36 months', ' 60 months'], n_rows),
+        'last_pymnt_d': rng.choice(days.strftime('%Y-%m-%d'), n_rows),
+        'last_credit_pull_ts': rng.choice(days.strftime('%Y-%m-%d %H:%M:%S'), n_rows),
+        'grade': pd.Categorical(rng.choice(['A', 'B', 'C'], n_rows)),
+        'issue_d': pd.to_datetime(rng.choice(days, n_rows)),
+        'mixed': pd.Series([1, 'a', None, 2.5] * (n_rows // 4), dtype=object),
+        'empty': pd.Series([None] * n_rows, dtype=object)
+    })
+    wide = pd.concat([base.add_suffix(f'_{i}') for i in range(5)], axis=1)
+    
+    print(f"📊 Input Data:")
+    print(f"   {n_rows:,} rows x {len(wide.columns)} columns (float, text, date, datetime, category, mixed, empty)")
+    print(f"   Expected output: workers=3 and workers=1 give the same type dict, in column order")
+    
+    try:
+        success_serial, serial = guess_column_types(wide)
+        success_parallel, parallel = guess_column_types(wide, workers=3)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Serial types of the first copy: {dict(list(serial.items())[:len(base.columns)])}")
+        print(f"   Same dict: {parallel == serial}, same order: {list(parallel) == list(wide.columns)}")
+        
+        if success_serial and success_parallel and parallel == serial and list(parallel) == list(wide.columns):
+            print("   ✅ PASS: Parallel inference matches serial inference")
+            return True
+        else:
+            print("   ❌ FAIL: Parallel inference result mismatch")
+            return False
+    
+    except Exception as e:
+        print(f"\n📋 Test Results:")
+        print(f"   ❌ FAIL: Exception occurred: {str(e)}")
+        return False
+
+def test_case_9_memoized_results():
+    """Test Case 9: memoize / memo_dir คืนผลที่จำไว้เมื่อไฟล์ไม่เปลี่ยน และเดาใหม่เมื่อไฟล์หรือตัวเลือกเปลี่ยน"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 9: memoize / memo_dir คืนผลที่จำไว้เมื่อไฟล์ไม่เปลี่ยน และเดาใหม่เมื่อไฟล์หรือตัวเลือกเปลี่ยน")
+    print("="*60)
+    
+    directory = tempfile.mkdtemp()
+    memo_dir = os.path.join(directory, 'memo')
+    temp_file_path = os.path.join(directory, 'loans.csv')
+    pd.DataFrame({
+        'loan_amnt': [1000.0, 2500.0, 3000.0],
+        'issue_d': ['2016-01-01', '2016-02-01', '2016-03-01'],
+        'grade': ['A', 'B', 'C']
+    }).to_csv(temp_file_path, index=False)
+    
+    print(f"📊 Input Data:")
+    print(f"   3 rows x 3 columns, calls: memoize twice, has_headers=False (memory + disk), memo_dir in a 'new process',")
+    print(f"   then the file gains a row with text in loan_amnt, then TYPES_MEMO_SIZE=2 with 3 option sets")
+    print(f"   Expected output: repeat calls do not read the file, changed options / content are guessed again,")
+    print(f"   at most 2 results kept in memory and on disk")
+    
+    reads = []
+    original_load_data = gct_module.load_data
+    original_memo_size = gct_module.TYPES_MEMO_SIZE
+    
+    def counting_load_data(*args, **kwargs):
+        reads.append(kwargs.get('has_headers'))
+        return original_load_data(*args, **kwargs)
+    
+    try:
+        gct_module.load_data = counting_load_data
+        clear_column_types_memo()
+        
+        _, first = guess_column_types(temp_file_path, memoize=True)
+        first['loan_amnt'] = 'changed by caller'
+        _, second = guess_column_types(temp_file_path, memoize=True)
+        _, no_headers = guess_column_types(temp_file_path, has_headers=False, memoize=True, memo_dir=memo_dir)
+        clear_column_types_memo()
+        _, no_headers_disk = guess_column_types(temp_file_path, has_headers=False, memo_dir=memo_dir)
+        memory_reads = len(reads)
+        
+        guess_column_types(temp_file_path, memo_dir=memo_dir)
+        clear_column_types_memo()
+        _, from_disk = guess_column_types(temp_file_path, memo_dir=memo_dir, memoize=True)
+        disk_reads = len(reads)
+        
+        with open(temp_file_path, 'a', encoding='utf-8') as f:
+            f.write('unknown,2016-04-01,D\n')
+        _, changed = guess_column_types(temp_file_path, memo_dir=memo_dir, memoize=True)
+        changed_reads = len(reads)
+        
+        gct_module.TYPES_MEMO_SIZE = 2
+        for delimiter in [',', ';', '|']:
+            guess_column_types(temp_file_path, delimiter=delimiter, memo_dir=memo_dir, memoize=True)
+        memo_files = [name for name in os.listdir(memo_dir) if name != 'fingerprints.json']
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Second call: {second}, file reads so far: {memory_reads}")
+        print(f"   has_headers=False from disk: {no_headers_disk}")
+        print(f"   From disk after clearing memory: {from_disk == second}, file reads: {disk_reads}")
+        print(f"   After the file changed: {changed}, file reads: {changed_reads}")
+        print(f"   Kept: {len(gct_module._TYPES_MEMO)} in memory, {len(memo_files)} in memo_dir")
+        
+        if (second == {'loan_amnt': 'floating', 'issue_d': 'date', 'grade': 'string'}
+                and no_headers[0] == no_headers_disk[0] == 'string' and reads[:3] == [True, False, True] and memory_reads == 2
+                and disk_reads == 3 and from_disk == second
+                and changed_reads == 4 and changed['loan_amnt'] == 'string'
+                and len(gct_module._TYPES_MEMO) == 2 and len(memo_files) == 2):
+            print("   ✅ PASS: Memoized results are reused only for the same file and options")
+            return True
+        else:
+            print("   ❌ FAIL: Memoized result mismatch")
+            return False
+    
+    except Exception as e:
+        print(f"\n📋 Test Results:")
+        print(f"   ❌ FAIL: Exception occurred: {str(e)}")
+        return False
+    
+    finally:
+        gct_module.load_data = original_load_data
+        gct_module.TYPES_MEMO_SIZE = original_memo_size
+        clear_column_types_memo()
+        shutil.rmtree(directory, ignore_errors=True)
+
 def run_all_tests():
     """รัน Test Cases ทั้งหมด"""
     print("🚀 Starting Column Type Guessing Function Tests")
@@ -273,6 +544,11 @@ def run_all_tests():
     results.append(test_case_2_date_datetime_detection()) 
     results.append(test_case_3_different_delimiters())
     results.append(test_case_4_edge_cases())
+    results.append(test_case_5_dataframe_input())
+    results.append(test_case_6_vectorized_detection())
+    results.append(test_case_7_sampling_with_confidence())
+    results.append(test_case_8_parallel_column_inference())
+    results.append(test_case_9_memoized_results())
     
     # สรุปผลลัพธ์
     print("\n" + "="*60)
@@ -283,7 +559,12 @@ def run_all_tests():
         "Test Case 1: การตรวจจับประเภทข้อมูลพื้นฐาน",
         "Test Case 2: ทดสอบการตรวจจับรูปแบบวันที่และเวลา", 
         "Test Case 3: ทดสอบตัวแบ่งที่แตกต่างกัน",
-        "Test Case 4: Edge Cases"
+        "Test Case 4: Edge Cases",
+        "Test Case 5: ส่ง DataFrame ที่โหลดไว้แล้วแทน path",
+        "Test Case 6: ตรวจจับจาก unique values บนข้อมูลจำนวนมาก",
+        "Test Case 7: เดาประเภทจากตัวอย่างพร้อมค่าความมั่นใจ",
+        "Test Case 8: workers= เดาประเภทพร้อมกันทีละกลุ่มคอลัมน์ได้ผลเหมือนแบบทีละคอลัมน์",
+        "Test Case 9: memoize / memo_dir คืนผลที่จำไว้เมื่อไฟล์ไม่เปลี่ยน และเดาใหม่เมื่อไฟล์หรือตัวเลือกเปลี่ยน"
     ]
     
     passed = 0
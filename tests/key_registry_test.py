@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Simple Test Demo for Key Registry Functions
+ทดสอบฟังก์ชัน save_key_registry() / load_key_registry() แบบง่าย
+"""
+
+import pandas as pd
+import multiprocessing
+import os
+import sys
+import shutil
+import tempfile
+import time
+
+# เพิ่ม path สำหรับ import functions
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.build_dimension import assign_surrogate_keys
+from functions.key_registry import load_key_registry, save_key_registry, key_registry_lock
+
+# ===== Helper Functions =====
+
+def _add_status_in_run(registry_dir, status):
+    """หนึ่งการรันของ pipeline: load -> assign -> save ภายใต้ lock (คืน id ที่ได้ของ status)"""
+    with key_registry_lock(registry_dir):
+        known_keys = load_key_registry(registry_dir, 'loan_status')
+        time.sleep(0.2)
+        ids, known_keys = assign_surrogate_keys(pd.DataFrame({'loan_status': [status]}), ['loan_status'],
+                                                known_keys)
+        save_key_registry(registry_dir, 'loan_status', known_keys)
+    return int(ids[0])
+
+# ===== Test Cases =====
+
+def test_case_1_registry_round_trip():
+    """Test Case 1: บันทึก / โหลด key (ข้อความ, วันที่, หลายคอลัมน์) ได้ค่าเดิมตามลำดับเดิม"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 1: บันทึก / โหลด key (ข้อความ, วันที่, หลายคอลัมน์) ได้ค่าเดิมตามลำดับเดิม")
+    print("="*60)
+    
+    df = pd.DataFrame({
+        'loan_status': ['Fully Paid', 'Current', None, 'Current'],
+        'issue_d': pd.to_datetime(['2016-03-01', '2016-01-01', '2016-03-01', '2017-06-01']),
+        'grade': ['B', 'A', 'B', 'C'],
+        'sub_grade': ['B2', 'A1', 'B2', 'C5']
+    })
+    registry_dir = tempfile.mkdtemp()
+    
+    print(f"📊 Input Data:")
+    print(f"   Keys: loan_status (with None), issue_d (datetime), grade + sub_grade")
+    print(f"   Expected output: identical keys after reload, missing registry -> None, unchanged keys not rewritten")
+    
+    try:
+        missing = load_key_registry(registry_dir, 'loan_status')
+        results = {}
+        for name, columns in [('loan_status', ['loan_status']), ('issue_d', ['issue_d']),
+                              ('grade', ['grade', 'sub_grade'])]:
+            _, keys = assign_surrogate_keys(df, columns)
+            saved = save_key_registry(registry_dir, name, keys)
+            resaved = save_key_registry(registry_dir, name, keys)
+            loaded = load_key_registry(registry_dir, name)
+            results[name] = (saved, resaved, loaded.equals(keys) and list(loaded.names) == columns,
+                             str(loaded.dtype))
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Missing registry: {missing}")
+        for name, result in results.items():
+            print(f"   {name}: {result}")
+        
+        expected = {'loan_status': (3, 0, True, 'object'), 'issue_d': (3, 0, True, 'datetime64[ns]'),
+                    'grade': (3, 0, True, 'object')}
+        if missing is None and results == expected:
+            print("   ✅ PASS: Key registry round trip works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Unexpected key registry content")
+            return False
+    
+    finally:
+        shutil.rmtree(registry_dir, ignore_errors=True)
+
+def test_case_2_ids_stable_across_runs():
+    """Test Case 2: id เดิมคงที่ในรอบถัดไป / ปฏิเสธ key ที่หายหรือต่างชนิด"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 2: id เดิมคงที่ในรอบถัดไป / ปฏิเสธ key ที่หายหรือต่างชนิด")
+    print("="*60)
+    
+    first = pd.DataFrame({'home_ownership': ['RENT', 'OWN', 'RENT']})
+    second = pd.DataFrame({'home_ownership': ['MORTGAGE', 'OWN', 'RENT', 'MORTGAGE']})
+    registry_dir = tempfile.mkdtemp()
+    
+    print(f"📊 Input Data:")
+    print(f"   Run 1: {first['home_ownership'].tolist()}, run 2: {second['home_ownership'].tolist()}")
+    print(f"   Expected output: run 2 ids [3, 2, 1, 3], ValueError for fewer keys and for datetime keys")
+    
+    try:
+        _, keys = assign_surrogate_keys(first, ['home_ownership'])
+        save_key_registry(registry_dir, 'home_ownership', keys)
+        ids, keys = assign_surrogate_keys(second, ['home_ownership'], load_key_registry(registry_dir, 'home_ownership'))
+        added = save_key_registry(registry_dir, 'home_ownership', keys)
+        
+        errors = []
+        try:
+            save_key_registry(registry_dir, 'home_ownership', keys[:2])
+        except ValueError as e:
+            errors.append(str(e))
+        try:
+            assign_surrogate_keys(pd.DataFrame({'home_ownership': pd.to_datetime(['2016-01-01'])}),
+                                  ['home_ownership'], load_key_registry(registry_dir, 'home_ownership'))
+        except ValueError as e:
+            errors.append(str(e))
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Run 2 ids: {ids.tolist()}, new keys saved: {added}")
+        print(f"   Registry: {load_key_registry(registry_dir, 'home_ownership').tolist()}")
+        print(f"   Errors: {errors}")
+        
+        if (ids.tolist() == [3, 2, 1, 3] and added == 1 and len(errors) == 2
+                and load_key_registry(registry_dir, 'home_ownership').tolist() == ['RENT', 'OWN', 'MORTGAGE']):
+            print("   ✅ PASS: Surrogate ids are stable across runs")
+            return True
+        else:
+            print("   ❌ FAIL: Unexpected surrogate ids")
+            return False
+    
+    finally:
+        shutil.rmtree(registry_dir, ignore_errors=True)
+
+def test_case_3_concurrent_runs():
+    """Test Case 3: การรันพร้อมกันบน registry เดียวกันรอกันที่ key_registry_lock() - id ไม่ชนและ key ไม่หาย"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 3: การรันพร้อมกันบน registry เดียวกันรอกันที่ key_registry_lock() - id ไม่ชนและ key ไม่หาย")
+    print("="*60)
+    
+    registry_dir = tempfile.mkdtemp()
+    with key_registry_lock(registry_dir):
+        _, keys = assign_surrogate_keys(pd.DataFrame({'loan_status': ['Current']}), ['loan_status'])
+        save_key_registry(registry_dir, 'loan_status', keys)
+    
+    print(f"📊 Input Data:")
+    print(f"   Registry with ['Current'], 4 processes each add a different status at the same time")
+    print(f"   (each sleeps between load and save so the runs overlap)")
+    print(f"   Expected output: registry holds all 5 statuses, every run got a different id for its status")
+    
+    try:
+        context = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+        statuses = ['Fully Paid', 'Charged Off', 'Late (31-120 days)', 'In Grace Period']
+        with context.Pool(len(statuses)) as pool:
+            run_ids = pool.starmap(_add_status_in_run, [(registry_dir, status) for status in statuses])
+        stored = load_key_registry(registry_dir, 'loan_status')
+        stored_ids = dict(zip(statuses, (stored.get_indexer(statuses) + 1).tolist()))
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Ids per run: {dict(zip(statuses, run_ids))}")
+        print(f"   Registry: {stored.tolist()}")
+        
+        if (len(stored) == 5 and stored[0] == 'Current' and sorted(run_ids) == [2, 3, 4, 5]
+                and dict(zip(statuses, run_ids)) == stored_ids):
+            print("   ✅ PASS: Concurrent runs keep ids unique and stable")
+            return True
+        else:
+            print("   ❌ FAIL: Concurrent runs lost or reused ids")
+            return False
+    
+    finally:
+        shutil.rmtree(registry_dir, ignore_errors=True)
+
+def run_all_tests():
+    """รัน Test Cases ทั้งหมด"""
+    print("🚀 Starting Key Registry Function Tests")
+    print("Target: key_registry - surrogate id ของ dimension ที่คงเดิมข้ามการรัน")
+    
+    results = []
+    
+    # รัน test cases
+    results.append(test_case_1_registry_round_trip())
+    results.append(test_case_2_ids_stable_across_runs())
+    results.append(test_case_3_concurrent_runs())
+    
+    # สรุปผลลัพธ์
+    print("\n" + "="*60)
+    print("📊 SUMMARY RESULTS")
+    print("="*60)
+    
+    test_names = [
+        "Test Case 1: บันทึก / โหลด key (ข้อความ, วันที่, หลายคอลัมน์) ได้ค่าเดิมตามลำดับเดิม",
+        "Test Case 2: id เดิมคงที่ในรอบถัดไป / ปฏิเสธ key ที่หายหรือต่างชนิด",
+        "Test Case 3: การรันพร้อมกันบน registry เดียวกันรอกันที่ key_registry_lock() - id ไม่ชนและ key ไม่หาย"
+    ]
+    
+    passed = 0
+    for i, (name, result) in enumerate(zip(test_names, results)):
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{i+1}. {name}: {status}")
+        if result:
+            passed += 1
+    
+    print(f"\n🎯 Overall Result: {passed}/{len(results)} tests passed")
+    
+    if passed == len(results):
+        print("🎉 ALL TESTS PASSED! ฟังก์ชันทำงานถูกต้องตาม spec")
+    else:
+        print("⚠️  SOME TESTS FAILED! ต้องแก้ไขฟังก์ชัน")
+    
+    return passed == len(results)
+
+if __name__ == "__main__":
+    # รัน tests
+    success = run_all_tests()
+    
+    print(f"\n{'='*60}")
+    print("🔚 Test Execution Complete")
+    print(f"{'='*60}")
+    
+    exit(0 if success else 1)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Simple Test Demo for Load Control Functions
+ทดสอบฟังก์ชัน partition_checksums() / record_load_control() / load_watermark() แบบง่าย
+"""
+
+import pandas as pd
+import os
+import sys
+from sqlalchemy import create_engine
+
+# เพิ่ม path สำหรับ import functions
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.load_control import partition_checksums, read_load_control, load_watermark, record_load_control
+
+# ===== Helpers =====
+
+def build_fact_rows():
+    """สร้าง fact rows ขนาดเล็ก 3 partition (เดือนของ issue_d)"""
+    return pd.DataFrame({
+        'issue_d': pd.to_datetime(['2016-01-01', '2016-01-01', '2016-02-01', '2016-03-01']),
+        'loan_amnt': [1000.0, 2000.0, 1500.0, 3000.0],
+        'home_ownership': ['RENT', 'OWN', 'RENT', 'MORTGAGE']
+    })
+
+# ===== Test Cases =====
+
+def test_case_1_partition_checksums():
+    """Test Case 1: checksum เปลี่ยนเฉพาะ partition ที่เนื้อหาเปลี่ยน"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 1: checksum เปลี่ยนเฉพาะ partition ที่เนื้อหาเปลี่ยน")
+    print("="*60)
+    
+    df = build_fact_rows()
+    changed = df.copy()
+    changed.loc[2, 'loan_amnt'] = 9999.0
+    
+    print(f"📊 Input Data:")
+    print(f"   Rows: {len(df)} in 3 partitions, then loan_amnt changed in 2016-02-01")
+    print(f"   Expected output: same checksums for an unchanged copy with another index, only 2016-02-01 differs")
+    
+    before = partition_checksums(df, 'issue_d')
+    same = partition_checksums(df.set_index(pd.Index([10, 11, 12, 13])), 'issue_d')
+    after = partition_checksums(changed, 'issue_d')
+    differs = before.loc[before['checksum'] != after['checksum'], 'partition_key'].tolist()
+    
+    print(f"\n📋 Test Results:")
+    print(before.to_string(index=False))
+    print(f"   Changed partitions: {differs}")
+    
+    if (before['partition_key'].tolist() == ['2016-01-01', '2016-02-01', '2016-03-01']
+            and before['row_count'].tolist() == [2, 1, 1] and before.equals(same) and differs == ['2016-02-01']):
+        print("   ✅ PASS: Partition checksums work correctly")
+        return True
+    else:
+        print("   ❌ FAIL: Unexpected partition checksums")
+        return False
+
+def test_case_2_control_table_round_trip():
+    """Test Case 2: บันทึก / อ่าน control table และ watermark"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 2: บันทึก / อ่าน control table และ watermark")
+    print("="*60)
+    
+    engine = create_engine('sqlite://')
+    partitions = partition_checksums(build_fact_rows(), 'issue_d')
+    
+    print(f"📊 Input Data:")
+    print(f"   Batch 1: 2 partitions, batch 2: 2016-02-01 again + 2016-03-01")
+    print(f"   Expected output: 3 partitions, watermark ('2016-03-01', 2), replace_all leaves one record")
+    
+    empty_watermark = load_watermark(engine, 'loans_fact')
+    empty_control = read_load_control(engine, 'loans_fact')
+    record_load_control(engine, 'loans_fact', partitions.iloc[:2], batch_id=1)
+    record_load_control(engine, 'loans_fact', partitions.iloc[1:], batch_id=2)
+    control = read_load_control(engine, 'loans_fact')
+    watermark = load_watermark(engine, 'loans_fact')
+    record_load_control(engine, 'loans_fact', partitions.iloc[:1], batch_id=3, replace_all=True)
+    replaced = read_load_control(engine, 'loans_fact')
+    
+    print(f"\n📋 Test Results:")
+    print(f"   Before any load: {empty_watermark}, {len(empty_control)} records")
+    print(control[['partition_key', 'row_count', 'batch_id']].to_string(index=False))
+    print(f"   Watermark: {watermark}")
+    print(f"   After replace_all: {replaced['partition_key'].tolist()}")
+    
+    if (empty_watermark == (None, 0) and empty_control.empty
+            and sorted(zip(control['partition_key'], control['batch_id'])) == [
+                ('2016-01-01', 1), ('2016-02-01', 2), ('2016-03-01', 2)]
+            and watermark == ('2016-03-01', 2) and replaced['partition_key'].tolist() == ['2016-01-01']):
+        print("   ✅ PASS: Control table works correctly")
+        return True
+    else:
+        print("   ❌ FAIL: Unexpected control table state")
+        return False
+
+def run_all_tests():
+    """รัน Test Cases ทั้งหมด"""
+    print("🚀 Starting Load Control Function Tests")
+    print("Target: load_control - watermark และ checksum ต่อ partition สำหรับ deploy แบบ incremental")
+    
+    results = []
+    
+    # รัน test cases
+    results.append(test_case_1_partition_checksums())
+    results.append(test_case_2_control_table_round_trip())
+    
+    # สรุปผลลัพธ์
+    print("\n" + "="*60)
+    print("📊 SUMMARY RESULTS")
+    print("="*60)
+    
+    test_names = [
+        "Test Case 1: checksum เปลี่ยนเฉพาะ partition ที่เนื้อหาเปลี่ยน",
+        "Test Case 2: บันทึก / อ่าน control table และ watermark"
+    ]
+    
+    passed = 0
+    for i, (name, result) in enumerate(zip(test_names, results)):
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{i+1}. {name}: {status}")
+        if result:
+            passed += 1
+    
+    print(f"\n🎯 Overall Result: {passed}/{len(results)} tests passed")
+    
+    if passed == len(results):
+        print("🎉 ALL TESTS PASSED! ฟังก์ชันทำงานถูกต้องตาม spec")
+    else:
+        print("⚠️  SOME TESTS FAILED! ต้องแก้ไขฟังก์ชัน")
+    
+    return passed == len(results)
+
+if __name__ == "__main__":
+    # รัน tests
+    success = run_all_tests()
+    
+    print(f"\n{'='*60}")
+    print("🔚 Test Execution Complete")
+    print(f"{'='*60}")
+    
+    exit(0 if success else 1)
@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Simple Test Demo for Data Loading Function
+ทดสอบฟังก์ชัน load_data() แบบง่าย
+"""
+
+import pandas as pd
+import os
+import sys
+import shutil
+import tempfile
+
+# เพิ่ม path สำหรับ import functions
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.load_data import load_data
+
+# ===== Test Cases =====
+
+def test_case_1_basic_loading():
+    """Test Case 1: การโหลดไฟล์พื้นฐาน"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 1: การโหลดไฟล์พื้นฐาน")
+    print("="*60)
+    
+    test_data = pd.DataFrame({
+        'loan_amnt': [1000.0, 2000.0, 3000.0],
+        'home_ownership': ['RENT', 'OWN', 'MORTGAGE'],
+        'issue_d': ['Jan-2016', 'Feb-2017', 'Mar-2018']
+    })
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+        test_data.to_csv(temp_file.name, index=False)
+        temp_file_path = temp_file.name
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: {len(test_data)}")
+    print(f"   Expected output: same rows and columns as the written CSV")
+    
+    try:
+        df = load_data(temp_file_path)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Loaded: {len(df)} rows, {list(df.columns)}")
+        
+        if df.equals(test_data):
+            print("   ✅ PASS: Basic loading works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Loaded data mismatch")
+            return False
+        
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_2_delimiter_and_headers():
+    """Test Case 2: ตัวแบ่งคอลัมน์และไฟล์ที่ไม่มี header"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 2: ตัวแบ่งคอลัมน์และไฟล์ที่ไม่มี header")
+    print("="*60)
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+        temp_file.write("1;RENT\n2;OWN\n")
+        temp_file_path = temp_file.name
+    
+    print(f"📊 Input Data:")
+    print(f"   Semicolon-delimited file without header (2 rows)")
+    print(f"   Expected output: 2 rows, integer column names [0, 1]")
+    
+    try:
+        df = load_data(temp_file_path, delimiter=';', has_headers=False)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Loaded: {len(df)} rows, columns={list(df.columns)}")
+        
+        if len(df) == 2 and list(df.columns) == [0, 1]:
+            print("   ✅ PASS: Delimiter and header options work correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Delimiter/header handling failed")
+            return False
+        
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_3_column_projection():
+    """Test Case 3: อ่านเฉพาะคอลัมน์ที่กำหนด (usecols)"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 3: อ่านเฉพาะคอลัมน์ที่กำหนด (usecols)")
+    print("="*60)
+    
+    test_data = pd.DataFrame({
+        'loan_amnt': [1000.0, 2000.0],
+        'desc': ['a', 'b'],
+        'issue_d': ['Jan-2016', 'Feb-2017']
+    })
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+        test_data.to_csv(temp_file.name, index=False)
+        temp_file_path = temp_file.name
+    
+    print(f"📊 Input Data:")
+    print(f"   Columns: {list(test_data.columns)}")
+    print(f"   Expected output: only loan_amnt and issue_d (list and callable usecols)")
+    
+    try:
+        by_list = load_data(temp_file_path, usecols=['loan_amnt', 'issue_d'])
+        by_callable = load_data(temp_file_path, usecols=lambda column: column in {'loan_amnt', 'issue_d', 'missing'})
+        
+        print(f"\n📋 Test Results:")
+        print(f"   usecols list: {list(by_list.columns)}")
+        print(f"   usecols callable: {list(by_callable.columns)}")
+        
+        expected = ['loan_amnt', 'issue_d']
+        if list(by_list.columns) == expected and list(by_callable.columns) == expected:
+            print("   ✅ PASS: Column projection works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Column projection mismatch")
+            return False
+        
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_4_dtype_spec():
+    """Test Case 4: โหลดด้วย dtype spec (รวมแบบทีละ chunk)"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 4: โหลดด้วย dtype spec (รวมแบบทีละ chunk)")
+    print("="*60)
+    
+    test_data = pd.DataFrame({
+        'loan_id': [1, 2, 3, 4],
+        'home_ownership': ['RENT', 'OWN', 'RENT', 'OWN'],
+        'issue_d': ['Jan-2016', 'Feb-2017', 'Mar-2018', 'Apr-2019']
+    })
+    dtype_spec = {
+        'dtype': {'home_ownership': 'category'},
+        'parse_dates': [],
+        'downcast_integers': ['loan_id'],
+        'date_formats': {'issue_d': '%b-%Y'}
+    }
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+        test_data.to_csv(temp_file.name, index=False)
+        temp_file_path = temp_file.name
+    
+    print(f"📊 Input Data:")
+    print(f"   dtype spec: {dtype_spec}")
+    print(f"   Expected output: category / int8 / datetime64 in both whole-file and chunked loads")
+    
+    try:
+        whole = load_data(temp_file_path, dtype_spec=dtype_spec)
+        chunks = list(load_data(temp_file_path, chunksize=2, dtype_spec=dtype_spec))
+        
+        expected = {'loan_id': 'int8', 'home_ownership': 'category', 'issue_d': 'datetime64[ns]'}
+        whole_ok = whole.dtypes.astype(str).to_dict() == expected
+        chunks_ok = len(chunks) == 2 and all(chunk.dtypes.astype(str).to_dict() == expected for chunk in chunks)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Whole-file dtypes: {whole.dtypes.astype(str).to_dict()}")
+        print(f"   Chunk dtypes: {[chunk.dtypes.astype(str).to_dict() for chunk in chunks]}")
+        
+        if whole_ok and chunks_ok:
+            print("   ✅ PASS: Dtype spec loading works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Dtype spec loading mismatch")
+            return False
+        
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_5_row_filter():
+    """Test Case 5: กรองแถวระหว่างโหลด (row_filter) ก่อนแปลง dtype"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 5: กรองแถวระหว่างโหลด (row_filter) ก่อนแปลง dtype")
+    print("="*60)
+    
+    test_data = pd.DataFrame({
+        'loan_id': [1, 2, 3, 4, 5, 6],
+        'home_ownership': ['RENT', 'OWN', 'RENT', 'OWN', 'ANY', 'RENT'],
+        'issue_d': ['Jan-2015', 'Feb-2016', 'Mar-2020', 'Apr-2019', 'May-2014', 'Jun-2017']
+    })
+    dtype_spec = {
+        'dtype': {'home_ownership': 'category'},
+        'parse_dates': [],
+        'downcast_integers': ['loan_id'],
+        'date_formats': {'issue_d': '%b-%Y'}
+    }
+    seen_dtypes = []
+    
+    def keep_even_ids(chunk):
+        seen_dtypes.append(str(chunk['issue_d'].dtype))
+        return chunk['loan_id'] % 2 == 0
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+        test_data.to_csv(temp_file.name, index=False)
+        temp_file_path = temp_file.name
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: {len(test_data)}, row_filter keeps even loan_id")
+    print(f"   Expected output: loan_id 2, 4, 6 with spec dtypes; filter sees raw (unparsed) chunks")
+    
+    try:
+        whole = load_data(temp_file_path, dtype_spec=dtype_spec, row_filter=keep_even_ids)
+        chunks = list(load_data(temp_file_path, chunksize=4, dtype_spec=dtype_spec, row_filter=keep_even_ids))
+        nothing = load_data(temp_file_path, row_filter=lambda chunk: chunk['loan_id'] > 100)
+        
+        expected = {'loan_id': 'int8', 'home_ownership': 'category', 'issue_d': 'datetime64[ns]'}
+        whole_ok = whole['loan_id'].tolist() == [2, 4, 6] and whole.dtypes.astype(str).to_dict() == expected
+        chunks_ok = ([chunk['loan_id'].tolist() for chunk in chunks] == [[2, 4], [6]]
+                     and all(chunk.dtypes.astype(str).to_dict() == expected for chunk in chunks))
+        raw_ok = all(dtype in ('object', 'str', 'string') for dtype in seen_dtypes)
+        empty_ok = nothing.empty and list(nothing.columns) == list(test_data.columns)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Whole-file rows: {whole['loan_id'].tolist()}, dtypes: {whole.dtypes.astype(str).to_dict()}")
+        print(f"   Chunk rows: {[chunk['loan_id'].tolist() for chunk in chunks]}")
+        print(f"   issue_d dtype seen by row_filter: {sorted(set(seen_dtypes))}")
+        print(f"   No rows kept: {len(nothing)} rows, columns {list(nothing.columns)}")
+        
+        if whole_ok and chunks_ok and raw_ok and empty_ok:
+            print("   ✅ PASS: Row filtering during load works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Row filtering during load mismatch")
+            return False
+        
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+
+def test_case_6_cache_dir():
+    """Test Case 6: โหลดผ่าน columnar cache (cache_dir) ได้ผลเหมือนอ่านไฟล์โดยตรง"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 6: โหลดผ่าน columnar cache (cache_dir) ได้ผลเหมือนอ่านไฟล์โดยตรง")
+    print("="*60)
+    
+    test_data = pd.DataFrame({
+        'loan_id': [1, 2, 3, 4, 5, 6],
+        'home_ownership': ['RENT', 'OWN', None, 'OWN', 'ANY', 'RENT'],
+        'issue_d': ['Jan-2015', 'Feb-2016', 'Mar-2020', 'Apr-2019', 'May-2014', 'Jun-2017']
+    })
+    dtype_spec = {
+        'dtype': {'home_ownership': 'category'},
+        'parse_dates': [],
+        'downcast_integers': ['loan_id'],
+        'date_formats': {'issue_d': '%b-%Y'}
+    }
+    keep_even_ids = lambda chunk: chunk['loan_id'] % 2 == 0
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+        test_data.to_csv(temp_file.name, index=False)
+        temp_file_path = temp_file.name
+    cache_dir = tempfile.mkdtemp()
+    
+    print(f"📊 Input Data:")
+    print(f"   Total rows: {len(test_data)}, loaded twice through cache_dir (plain, typed + row_filter, chunked)")
+    print(f"   Expected output: identical to loading without cache")
+    
+    try:
+        results = []
+        for _ in range(2):
+            plain = load_data(temp_file_path, cache_dir=cache_dir)
+            typed = load_data(temp_file_path, dtype_spec=dtype_spec, row_filter=keep_even_ids, cache_dir=cache_dir)
+            chunks = list(load_data(temp_file_path, chunksize=4, dtype_spec=dtype_spec, cache_dir=cache_dir))
+            results.append((plain, typed, chunks))
+        
+        expected_plain = load_data(temp_file_path)
+        expected_typed = load_data(temp_file_path, dtype_spec=dtype_spec, row_filter=keep_even_ids)
+        expected_rows = load_data(temp_file_path, dtype_spec=dtype_spec)['loan_id'].tolist()
+        all_equal = all(
+            plain.equals(expected_plain) and typed.equals(expected_typed)
+            and pd.concat(chunks)['loan_id'].tolist() == expected_rows
+            for plain, typed, chunks in results)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Typed + filtered rows: {results[1][1]['loan_id'].tolist()}, "
+              f"dtypes: {results[1][1].dtypes.astype(str).to_dict()}")
+        print(f"   Same as uncached (parse and cached reads): {all_equal}")
+        
+        if all_equal:
+            print("   ✅ PASS: Cached loading matches direct loading")
+            return True
+        else:
+            print("   ❌ FAIL: Cached loading mismatch")
+            return False
+        
+    finally:
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+def run_all_tests():
+    """รัน Test Cases ทั้งหมด"""
+    print("🚀 Starting Data Loading Function Tests")
+    print("Target: load_data() - โหลดไฟล์ CSV ครั้งเดียว")
+    
+    results = []
+    
+    # รัน test cases
+    results.append(test_case_1_basic_loading())
+    results.append(test_case_2_delimiter_and_headers())
+    results.append(test_case_3_column_projection())
+    results.append(test_case_4_dtype_spec())
+    results.append(test_case_5_row_filter())
+    results.append(test_case_6_cache_dir())
+    
+    # สรุปผลลัพธ์
+    print("\n" + "="*60)
+    print("📊 SUMMARY RESULTS")
+    print("="*60)
+    
+    test_names = [
+        "Test Case 1: การโหลดไฟล์พื้นฐาน",
+        "Test Case 2: ตัวแบ่งคอลัมน์และไฟล์ที่ไม่มี header",
+        "Test Case 3: อ่านเฉพาะคอลัมน์ที่กำหนด (usecols)",
+        "Test Case 4: โหลดด้วย dtype spec (รวมแบบทีละ chunk)",
+        "Test Case 5: กรองแถวระหว่างโหลด (row_filter) ก่อนแปลง dtype",
+        "Test Case 6: โหลดผ่าน columnar cache (cache_dir) ได้ผลเหมือนอ่านไฟล์โดยตรง"
+    ]
+    
+    passed = 0
+    for i, (name, result) in enumerate(zip(test_names, results)):
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{i+1}. {name}: {status}")
+        if result:
+            passed += 1
+    
+    print(f"\n🎯 Overall Result: {passed}/{len(results)} tests passed")
+    
+    if passed == len(results):
+        print("🎉 ALL TESTS PASSED! ฟังก์ชันทำงานถูกต้องตาม spec")
+    else:
+        print("⚠️  SOME TESTS FAILED! ต้องแก้ไขฟังก์ชัน")
+    
+    return passed == len(results)
+
+if __name__ == "__main__":
+    # รัน tests
+    success = run_all_tests()
+    
+    print(f"\n{'='*60}")
+    print("🔚 Test Execution Complete")
+    print(f"{'='*60}")
+    
+    exit(0 if success else 1)
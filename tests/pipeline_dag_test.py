@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Simple Test Demo for Pipeline DAG Functions
+ทดสอบฟังก์ชัน dag_node() / evaluate_dag() / evict_dag_cache() แบบง่าย
+"""
+
+import pandas as pd
+import os
+import sys
+import shutil
+import tempfile
+
+# เพิ่ม path สำหรับ import functions
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.pipeline_dag import dag_node, dag_node_keys, evaluate_dag, evict_dag_cache
+
+# ===== Helper Functions =====
+
+def build_graph(calls):
+    """DAG ตัวอย่าง: read(data_file) -> clean(limit) -> total(factor) โดยนับจำนวนครั้งที่แต่ละ node ถูกรันใน calls"""
+    def read(data_file):
+        calls.append('read')
+        return pd.read_csv(data_file)
+    
+    def clean(df, limit):
+        calls.append('clean')
+        return df[df['amount'] <= limit]
+    
+    def total(df, factor):
+        calls.append('total')
+        return {'rows': len(df), 'total': float(df['amount'].sum() * factor), 'labels': df['label']}
+    
+    return {
+        'read': dag_node(read, params=['data_file'], files=['data_file']),
+        'clean': dag_node(clean, deps=['read'], params=['limit']),
+        'total': dag_node(total, deps=['clean'], params=['factor'])
+    }
+
+def write_sample_csv(directory):
+    """สร้างไฟล์ CSV ตัวอย่าง 5 แถว"""
+    data_file = os.path.join(directory, 'amounts.csv')
+    pd.DataFrame({
+        'amount': [10, 20, 30, 40, 50],
+        'label': ['a', 'b', None, 'd', 'e']
+    }).to_csv(data_file, index=False)
+    return data_file
+
+# ===== Test Cases =====
+
+def test_case_1_recompute_downstream_only():
+    """Test Case 1: เปลี่ยน parameter แล้วรันใหม่เฉพาะ node ที่ใช้ parameter นั้นและ node ปลายทาง"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 1: เปลี่ยน parameter แล้วรันใหม่เฉพาะ node ที่ใช้ parameter นั้นและ node ปลายทาง")
+    print("="*60)
+    
+    directory = tempfile.mkdtemp()
+    data_file = write_sample_csv(directory)
+    
+    print(f"📊 Input Data:")
+    print(f"   DAG: read(data_file) -> clean(limit) -> total(factor), in-process memo")
+    print(f"   Runs: limit=30/factor=1, same again, factor=2, limit=40, file changed")
+    print(f"   Expected output: read 2 times, clean 3 times, total 4 times")
+    
+    try:
+        calls = []
+        graph = build_graph(calls)
+        memo = {}
+        runs = []
+        for limit, factor in [(30, 1), (30, 1), (30, 2), (40, 2)]:
+            results, sources = evaluate_dag(graph, ['total'], {'data_file': data_file, 'limit': limit,
+                                                               'factor': factor}, memo=memo)
+            runs.append((results['total']['rows'], results['total']['total'], sources))
+        
+        with open(data_file, 'a', encoding='utf-8') as f:
+            f.write('5,f\n')
+        results, _ = evaluate_dag(graph, ['total'], {'data_file': data_file, 'limit': 40, 'factor': 2}, memo=memo)
+        runs.append((results['total']['rows'], results['total']['total'], None))
+        
+        errors = []
+        for bad_graph, params in [(dict(graph, read=dag_node(lambda df: df, deps=['total'])), {}),
+                                  (graph, {'data_file': data_file, 'limit': 30})]:
+            try:
+                dag_node_keys(bad_graph, params, ['total'])
+            except ValueError as e:
+                errors.append(str(e))
+        
+        print(f"\n📋 Test Results:")
+        for rows, total, sources in runs:
+            print(f"   rows={rows}, total={total}, sources={sources}")
+        print(f"   Calls: {calls}")
+        print(f"   Errors: {errors}")
+        
+        if ([run[:2] for run in runs] == [(3, 60.0), (3, 60.0), (3, 120.0), (4, 200.0), (5, 210.0)]
+                and runs[1][2] == {'total': 'memory'}
+                and runs[2][2] == {'clean': 'memory', 'total': 'computed'}
+                and runs[3][2] == {'read': 'memory', 'clean': 'computed', 'total': 'computed'}
+                and calls.count('read') == 2 and calls.count('clean') == 3 and calls.count('total') == 4
+                and len(errors) == 2):
+            print("   ✅ PASS: Only nodes downstream of a change are recomputed")
+            return True
+        else:
+            print("   ❌ FAIL: Unexpected recomputation")
+            return False
+    
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def test_case_2_disk_cache_across_runs():
+    """Test Case 2: ผลลัพธ์บน disk ใช้ซ้ำข้าม process ได้ค่าเดิม (รวม index / null) และถูกลบแบบ LRU"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 2: ผลลัพธ์บน disk ใช้ซ้ำข้าม process ได้ค่าเดิม (รวม index / null) และถูกลบแบบ LRU")
+    print("="*60)
+    
+    directory = tempfile.mkdtemp()
+    data_file = write_sample_csv(directory)
+    cache_dir = os.path.join(directory, 'dag')
+    
+    print(f"📊 Input Data:")
+    print(f"   Same DAG with a disk cache and no memo (simulates a new process), limit=40 twice")
+    print(f"   Expected output: second run reads 'total' from disk without running any node,")
+    print(f"   filtered frame keeps its index and null label, eviction to 0 bytes keeps the entries in use")
+    
+    try:
+        calls = []
+        graph = build_graph(calls)
+        params = {'data_file': data_file, 'limit': 40, 'factor': 1}
+        first, _ = evaluate_dag(graph, ['total', 'clean'], params, cache_dir=cache_dir)
+        first_calls, calls[:] = list(calls), []
+        second, sources = evaluate_dag(graph, ['total', 'clean'], params, cache_dir=cache_dir)
+        entries = len([name for name in os.listdir(cache_dir) if os.path.isdir(os.path.join(cache_dir, name))])
+        kept = dag_node_keys(graph, params, ['total'], cache_dir)
+        removed = evict_dag_cache(cache_dir, max_bytes=0, keep=[kept['total']])
+        
+        print(f"\n📋 Test Results:")
+        print(f"   First run calls: {first_calls}, second run calls: {calls}, sources: {sources}")
+        print(f"   Labels: {second['total']['labels'].tolist()}, index: {second['clean'].index.tolist()}")
+        print(f"   Entries: {entries}, evicted: {removed}")
+        
+        if (first_calls == ['read', 'clean', 'total'] and calls == []
+                and sources == {'total': 'disk', 'clean': 'disk'}
+                and second['clean'].equals(first['clean'])
+                and second['total']['labels'].equals(first['total']['labels'])
+                and second['total']['total'] == first['total']['total'] == 100.0
+                and entries == 3 and removed == 2):
+            print("   ✅ PASS: Disk cache returns the same results")
+            return True
+        else:
+            print("   ❌ FAIL: Disk cache mismatch")
+            return False
+    
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def run_all_tests():
+    """รัน Test Cases ทั้งหมด"""
+    print("🚀 Starting Pipeline DAG Function Tests")
+    print("Target: pipeline_dag - DAG แบบ lazy ที่เก็บผลลัพธ์ของแต่ละ node ตาม input + parameter")
+    
+    results = []
+    
+    # รัน test cases
+    results.append(test_case_1_recompute_downstream_only())
+    results.append(test_case_2_disk_cache_across_runs())
+    
+    # สรุปผลลัพธ์
+    print("\n" + "="*60)
+    print("📊 SUMMARY RESULTS")
+    print("="*60)
+    
+    test_names = [
+        "Test Case 1: เปลี่ยน parameter แล้วรันใหม่เฉพาะ node ที่ใช้ parameter นั้นและ node ปลายทาง",
+        "Test Case 2: ผลลัพธ์บน disk ใช้ซ้ำข้าม process ได้ค่าเดิม (รวม index / null) และถูกลบแบบ LRU"
+    ]
+    
+    passed = 0
+    for i, (name, result) in enumerate(zip(test_names, results)):
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{i+1}. {name}: {status}")
+        if result:
+            passed += 1
+    
+    print(f"\n🎯 Overall Result: {passed}/{len(results)} tests passed")
+    
+    if passed == len(results):
+        print("🎉 ALL TESTS PASSED! ฟังก์ชันทำงานถูกต้องตาม spec")
+    else:
+        print("⚠️  SOME TESTS FAILED! ต้องแก้ไขฟังก์ชัน")
+    
+    return passed == len(results)
+
+if __name__ == "__main__":
+    # รัน tests
+    success = run_all_tests()
+    
+    print(f"\n{'='*60}")
+    print("🔚 Test Execution Complete")
+    print(f"{'='*60}")
+    
+    exit(0 if success else 1)
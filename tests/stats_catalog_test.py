@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Simple Test Demo for Stats Catalog Functions
+ทดสอบฟังก์ชัน update_stats_catalog() / read_stats_catalog() / catalog_null_stats() แบบง่าย
+"""
+
+import pandas as pd
+import os
+import sys
+import shutil
+import tempfile
+
+# เพิ่ม path สำหรับ import functions
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.clean_missing_values import count_missing_values, columns_within_null_limit
+from functions.stats_catalog import read_stats_catalog, update_stats_catalog, catalog_null_stats, stats_catalog_path
+
+# ===== Helper Functions =====
+
+def write_sample_csv(directory):
+    """สร้างไฟล์ CSV ตัวอย่าง: loan_amnt ครบ, desc ว่าง 75%, emp_title ว่าง 25%"""
+    data_file = os.path.join(directory, 'loans.csv')
+    pd.DataFrame({
+        'loan_amnt': [1000, 2000, 3000, 4000],
+        'desc': ['note', None, None, None],
+        'emp_title': ['Teacher', 'Nurse', None, 'Driver']
+    }).to_csv(data_file, index=False)
+    return data_file
+
+# ===== Test Cases =====
+
+def test_case_1_catalog_round_trip():
+    """Test Case 1: บันทึก / อ่าน / รวมสถิติของคอลัมน์ได้ค่าเดิม"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 1: บันทึก / อ่าน / รวมสถิติของคอลัมน์ได้ค่าเดิม")
+    print("="*60)
+    
+    directory = tempfile.mkdtemp()
+    data_file = write_sample_csv(directory)
+    df = pd.read_csv(data_file)
+    
+    print(f"📊 Input Data:")
+    print(f"   File: 4 rows, null counts {df.isna().sum().to_dict()}")
+    print(f"   Expected output: no catalog at first, partial catalog does not cover all columns,")
+    print(f"   merged catalog gives the same null stats and 30% limit as count_missing_values()")
+    
+    try:
+        missing = read_stats_catalog(data_file)
+        update_stats_catalog(data_file, count_missing_values(df[['loan_amnt']]), {'loan_amnt': 'integer'})
+        partial = catalog_null_stats(read_stats_catalog(data_file))
+        projected = catalog_null_stats(read_stats_catalog(data_file), ['loan_amnt', 'not_in_file'])
+        update_stats_catalog(data_file, count_missing_values(df[['desc', 'emp_title']]))
+        catalog = read_stats_catalog(data_file)
+        full = catalog_null_stats(catalog)
+        expected = count_missing_values(df)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Missing catalog: {missing}, partial coverage: {partial}")
+        print(f"   Projected stats: {projected['null_counts'].to_dict()}")
+        print(f"   Full stats: {full['rows']} rows, {full['null_counts'].to_dict()}")
+        print(f"   Column types: {catalog['column_types']}")
+        print(f"   Within 30%: {columns_within_null_limit(catalog, 30)}")
+        
+        if (missing is None and partial is None and projected['null_counts'].to_dict() == {'loan_amnt': 0}
+                and full['rows'] == expected['rows'] and full['null_counts'].equals(expected['null_counts'])
+                and catalog['column_types'] == {'loan_amnt': 'integer'}
+                and columns_within_null_limit(catalog, 30) == ['loan_amnt', 'emp_title']):
+            print("   ✅ PASS: Stats catalog round trip works correctly")
+            return True
+        else:
+            print("   ❌ FAIL: Unexpected stats catalog content")
+            return False
+    
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def test_case_2_catalog_follows_file_content():
+    """Test Case 2: catalog ใช้ได้เมื่อเนื้อหาไฟล์เดิม และถูกละทิ้งเมื่อไฟล์เปลี่ยน"""
+    print("\n" + "="*60)
+    print("🧪 Test Case 2: catalog ใช้ได้เมื่อเนื้อหาไฟล์เดิม และถูกละทิ้งเมื่อไฟล์เปลี่ยน")
+    print("="*60)
+    
+    directory = tempfile.mkdtemp()
+    data_file = write_sample_csv(directory)
+    
+    print(f"📊 Input Data:")
+    print(f"   Catalog of a 4-row file, then: touch (same content), rewrite with 5 rows, wrong row count")
+    print(f"   Expected output: catalog kept after touch, dropped after rewrite, ValueError for wrong rows")
+    
+    try:
+        update_stats_catalog(data_file, count_missing_values(pd.read_csv(data_file)))
+        stat = os.stat(data_file)
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        touched = read_stats_catalog(data_file)
+        
+        errors = []
+        try:
+            update_stats_catalog(data_file, count_missing_values(pd.read_csv(data_file, nrows=2)))
+        except ValueError as e:
+            errors.append(str(e))
+        
+        with open(data_file, 'a', encoding='utf-8') as f:
+            f.write('5000,,\n')
+        changed = read_stats_catalog(data_file)
+        update_stats_catalog(data_file, count_missing_values(pd.read_csv(data_file)))
+        refreshed = read_stats_catalog(data_file)
+        
+        print(f"\n📋 Test Results:")
+        print(f"   Catalog file: {os.path.basename(stats_catalog_path(data_file))}")
+        print(f"   After touch: {touched['rows'] if touched else None} rows")
+        print(f"   After rewrite: {changed}, refreshed: {refreshed['rows']} rows")
+        print(f"   Errors: {errors}")
+        
+        if (touched is not None and touched['rows'] == 4 and changed is None and refreshed['rows'] == 5
+                and refreshed['null_counts'].to_dict() == {'loan_amnt': 0, 'desc': 4, 'emp_title': 2}
+                and len(errors) == 1):
+            print("   ✅ PASS: Stats catalog is keyed by file content")
+            return True
+        else:
+            print("   ❌ FAIL: Stale stats catalog was used")
+            return False
+    
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def run_all_tests():
+    """รัน Test Cases ทั้งหมด"""
+    print("🚀 Starting Stats Catalog Function Tests")
+    print("Target: stats_catalog - สถิติของคอลัมน์ที่เก็บไว้ข้างไฟล์ข้อมูล")
+    
+    results = []
+    
+    # รัน test cases
+    results.append(test_case_1_catalog_round_trip())
+    results.append(test_case_2_catalog_follows_file_content())
+    
+    # สรุปผลลัพธ์
+    print("\n" + "="*60)
+    print("📊 SUMMARY RESULTS")
+    print("="*60)
+    
+    test_names = [
+        "Test Case 1: บันทึก / อ่าน / รวมสถิติของคอลัมน์ได้ค่าเดิม",
+        "Test Case 2: catalog ใช้ได้เมื่อเนื้อหาไฟล์เดิม และถูกละทิ้งเมื่อไฟล์เปลี่ยน"
+    ]
+    
+    passed = 0
+    for i, (name, result) in enumerate(zip(test_names, results)):
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{i+1}. {name}: {status}")
+        if result:
+            passed += 1
+    
+    print(f"\n🎯 Overall Result: {passed}/{len(results)} tests passed")
+    
+    if passed == len(results):
+        print("🎉 ALL TESTS PASSED! ฟังก์ชันทำงานถูกต้องตาม spec")
+    else:
+        print("⚠️  SOME TESTS FAILED! ต้องแก้ไขฟังก์ชัน")
+    
+    return passed == len(results)
+
+if __name__ == "__main__":
+    # รัน tests
+    success = run_all_tests()
+    
+    print(f"\n{'='*60}")
+    print("🔚 Test Execution Complete")
+    print(f"{'='*60}")
+    
+    exit(0 if success else 1)